@@ -0,0 +1,121 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Reports the time to import a generated model package of many YANG
+# modules, eager and lazy, in a new interpreter, and to then access one
+# module class or all of them.
+# Usage: python benchmarks/bench_import.py [modules] [containers] [leaves]
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from yapyang.compiler import generate
+
+# Statements run in a new interpreter, which prints seconds elapsed.
+PROGRAM = """
+import time
+start = time.perf_counter()
+import {module} as models
+{access}
+print(time.perf_counter() - start)
+"""
+ACCESSES = {
+    "import": "",
+    "import + one module": "models.__all__[0] and getattr(models, models.__all__[0])",
+    "import + all modules": "[getattr(models, name) for name in models.__all__]",
+}
+REPEAT = 5
+
+
+def write_yang(directory: str, modules: int, containers: int, leaves: int):
+    """Writes YANG modules of containers, each with leaves and a list of
+    leaves, and returns their paths."""
+
+    paths = list()
+    for module in range(modules):
+        name = f"bench-{module}"
+        body = "\n".join(
+            f"""
+    container c{container} {{
+      {" ".join(f"leaf l{leaf} {{ type string; }}" for leaf in range(leaves))}
+      list e {{
+        key "l0";
+        {" ".join(f"leaf l{leaf} {{ type uint32; }}" for leaf in range(leaves))}
+      }}
+    }}"""
+            for container in range(containers)
+        )
+        path = os.path.join(directory, f"{name}.yang")
+        with open(path, "w") as file:
+            file.write(
+                f'module {name} {{\n  namespace "urn:{name}";\n'
+                f"  prefix b{module};\n  container root {{{body}\n  }}\n}}\n"
+            )
+        paths.append(path)
+    return paths
+
+
+def time_import(directory: str, module: str, access: str, /) -> float:
+    """Returns best seconds of REPEAT imports of module with access, each
+    in a new interpreter. Bytecode is cached by the first import."""
+
+    program = PROGRAM.format(module=module, access=access)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((directory, *sys.path)))
+    return min(
+        float(
+            subprocess.run(
+                (sys.executable, "-c", program),
+                check=True,
+                capture_output=True,
+                env=env,
+                text=True,
+            ).stdout
+        )
+        for _ in range(REPEAT + 1)
+    )
+
+
+def main(modules: int, containers: int, leaves: int, /) -> None:
+    """Prints import seconds of eager and lazy generated packages."""
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_yang(directory, modules, containers, leaves)
+        for lazy in (False, True):
+            source = generate(paths, lazy=lazy)
+            name = "models_lazy" if lazy else "models_eager"
+            with open(os.path.join(directory, f"{name}.py"), "w") as file:
+                file.write(source)
+        classes = modules * (1 + containers * (2 * leaves + 2) + 1)
+        print(f"modules: {modules}, classes: {classes}")
+        for access, statement in ACCESSES.items():
+            eager, lazy = (
+                time_import(directory, name, statement)
+                for name in ("models_eager", "models_lazy")
+            )
+            print(
+                f"{access:<22} eager {eager * 1000:>8.1f}ms "
+                f"lazy {lazy * 1000:>8.1f}ms ({eager / lazy:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 5,
+    )
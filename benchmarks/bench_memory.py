@@ -0,0 +1,103 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Reports bytes per leaf and per list entry, of list nodes and columnar list
+# nodes.
+# Usage: python benchmarks/bench_memory.py [count]
+
+import gc
+import sys
+import tracemalloc
+import typing as t
+
+from yapyang import ColumnarListNode, LeafNode, ListNode
+
+
+class Name(LeafNode):
+    __identifier__ = "name"
+
+    value: str
+
+
+class Mtu(LeafNode):
+    __identifier__ = "mtu"
+
+    value: int
+
+
+class Interface(ListNode):
+    __identifier__ = "interface"
+    __key__ = "name"
+
+    name: Name
+    mtu: Mtu
+
+
+class ColumnarInterface(ColumnarListNode):
+    __identifier__ = "interface"
+    __key__ = "name"
+
+    name: Name
+    mtu: Mtu
+
+
+def measure(build: t.Callable[[], t.Any], /) -> int:
+    """Returns bytes still allocated by build once it returns."""
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = build()  # noqa: F841
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before
+
+
+def main(count: int, /) -> None:
+    """Prints bytes per leaf and per list entry for count instances."""
+
+    # Leaf values are created up front so only node overhead is measured.
+    names = [f"xe-0/0/{index}" for index in range(count)]
+
+    leaf = measure(lambda: [Name(name) for name in names]) / count
+
+    def build_list() -> Interface:
+        interface = Interface()
+        for name in names:
+            interface.append(Name(name), Mtu(1500))
+        return interface
+
+    entry = measure(build_list) / count
+
+    def build_columnar() -> ColumnarInterface:
+        return ColumnarInterface.from_columns(
+            dict(name=names, mtu=[1500] * count)
+        )
+
+    columnar = measure(build_columnar) / count
+
+    print(f"instances:           {count}")
+    print(f"bytes per leaf:      {leaf:.1f}")
+    print(f"bytes per entry:     {entry:.1f} (including 2 leaves)")
+    print(f"bytes entry overhead {entry - 2 * leaf:.1f}")
+    print(
+        f"bytes per row:       {columnar:.1f} (columnar, {entry / columnar:.1f}x less)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
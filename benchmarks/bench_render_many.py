@@ -0,0 +1,124 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Reports devices rendered per second and speedup for each worker count.
+# Usage: python benchmarks/bench_render_many.py [devices] [interfaces]
+
+import functools
+import os
+import sys
+import time
+
+from yapyang import (
+    ContainerNode,
+    LeafNode,
+    ListNode,
+    ModuleNode,
+    render_many,
+)
+
+
+class Name(LeafNode):
+    __identifier__ = "name"
+
+    value: str
+
+
+class Mtu(LeafNode):
+    __identifier__ = "mtu"
+
+    value: int
+
+
+class Interface(ListNode):
+    __identifier__ = "interface"
+    __key__ = "name"
+
+    name: Name
+    mtu: Mtu
+
+
+class HostName(LeafNode):
+    __identifier__ = "host-name"
+
+    value: str
+
+
+class System(ContainerNode):
+    __identifier__ = "system"
+
+    host_name: HostName
+    interface: Interface
+
+
+class OpenConfigSystem(ModuleNode):
+    __identifier__ = "openconfig-system"
+    __namespace__ = "http://openconfig.net/yang/system"
+
+    system: System
+
+
+def build(index: int, /, interfaces: int = 200) -> OpenConfigSystem:
+    """Returns the module of device index with interfaces list entries."""
+
+    return OpenConfigSystem(
+        System(
+            HostName(f"r{index}"),
+            Interface.from_rows(
+                (f"xe-0/0/{port}", 1500) for port in range(interfaces)
+            ),
+        )
+    )
+
+
+def main(devices: int, interfaces: int, /) -> None:
+    """Prints devices rendered per second for 1 up to one worker per CPU,
+    shipping nodes to the workers and building nodes in the workers."""
+
+    build_device = functools.partial(build, interfaces=interfaces)
+    cpus = os.cpu_count() or 1
+    counts = [2**power for power in range(cpus.bit_length())]
+    if cpus not in counts:
+        counts.append(cpus)
+
+    print(f"devices: {devices}, interfaces: {interfaces}, cpus: {cpus}")
+    for mode in ("ship nodes", "build in workers"):
+        baseline = None
+        for workers in counts:
+            # Rendering caches fragments, so each run renders new nodes.
+            if mode == "ship nodes":
+                items = [build_device(index) for index in range(devices)]
+                kwargs = dict()
+            else:
+                items = list(range(devices))
+                kwargs = dict(build=build_device)
+            start = time.perf_counter()
+            for _ in render_many(items, workers=workers, **kwargs):
+                pass
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{mode:<16} workers: {workers:>3} "
+                f"{devices / elapsed:>10.0f} devices/s "
+                f"speedup {baseline / elapsed:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,524 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+# Reports ops per second, peak memory and allocated blocks of class creation,
+# instantiation, list append and serialization, on a synthetic model of
+# configurable depth, width and list size, and on a scaled-up
+# openconfig-interfaces model. Uses only the API of the first release, so
+# that any two revisions can be compared.
+# Usage: python benchmarks/bench_suite.py [--depth 3] [--width 4] ...
+#        python benchmarks/bench_suite.py --compare REV [REV]
+
+import argparse
+import fnmatch
+import gc
+import io
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+import typing as t
+
+from yapyang import ContainerNode, LeafNode, ListNode, ModuleNode
+
+# Value type of each leaf of the synthetic model, by leaf index.
+LEAF_TYPES = (str, int, bool)
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+
+
+class Case(t.NamedTuple):
+    """Represents a benchmark, run on the result of setup. Each run is
+    items ops."""
+
+    name: str
+    setup: t.Callable[[], t.Any]
+    run: t.Callable[[t.Any], t.Any]
+    items: int
+
+
+def leaf_value(index: int, entry: int = 0, /) -> t.Any:
+    """Returns the value of leaf index of the synthetic model."""
+
+    value_type = LEAF_TYPES[index % len(LEAF_TYPES)]
+    if value_type is str:
+        return f"value-{entry}-{index}"
+    if value_type is int:
+        return entry * 10 + index
+    return bool(entry % 2)
+
+
+def create_node_class(
+    base: type, name: str, identifier: str, annotations: dict, /, **defaults
+) -> t.Any:
+    """Returns a new node class of base, as a class statement would."""
+
+    namespace = dict(
+        __module__=__name__,
+        __qualname__=name,
+        __annotations__=annotations,
+        __identifier__=identifier,
+        **defaults,
+    )
+    return type(base)(name, (base,), namespace)
+
+
+def create_synthetic_model(depth: int, width: int, /) -> t.List[t.Any]:
+    """Returns the classes of a synthetic model, bottom up and the module
+    class last. Each of depth nested containers has width leaves, and the
+    innermost container a list with a key leaf and width leaves."""
+
+    classes: t.List[t.Any] = list()
+    leaves = [
+        create_node_class(
+            LeafNode,
+            f"Leaf{index}",
+            f"leaf-{index}",
+            dict(value=LEAF_TYPES[index % len(LEAF_TYPES)]),
+        )
+        for index in range(width)
+    ]
+    key = create_node_class(LeafNode, "Key", "key", dict(value=str))
+    child = create_node_class(
+        ListNode,
+        "Entry",
+        "entry",
+        dict(key=key, **{f"leaf_{i}": leaf for i, leaf in enumerate(leaves)}),
+        __key__="key",
+    )
+    classes.extend((*leaves, key, child))
+    for level in reversed(range(depth)):
+        annotations = {f"leaf_{i}": leaf for i, leaf in enumerate(leaves)}
+        annotations["child"] = child
+        child = create_node_class(
+            ContainerNode,
+            f"Container{level}",
+            f"container-{level}",
+            annotations,
+        )
+        classes.append(child)
+    classes.append(
+        create_node_class(
+            ModuleNode,
+            "Synthetic",
+            "synthetic",
+            dict(child=child),
+            __namespace__="urn:yapyang:synthetic",
+        )
+    )
+    return classes
+
+
+def build_synthetic(
+    classes: t.List[t.Any], width: int, list_size: int, /
+) -> t.Any:
+    """Returns an instance of the synthetic model module with list size
+    entries."""
+
+    leaves, (key, child), containers = (
+        classes[:width],
+        classes[width : width + 2],
+        classes[width + 2 : -1],
+    )
+    child = child()
+    for entry in range(list_size):
+        child.append(
+            key(f"entry-{entry}"),
+            *(leaf(leaf_value(i, entry)) for i, leaf in enumerate(leaves)),
+        )
+    for container in containers:
+        child = container(
+            *(leaf(leaf_value(i)) for i, leaf in enumerate(leaves)), child
+        )
+    return classes[-1](child)
+
+
+def create_openconfig_interfaces() -> t.Dict[str, t.Any]:
+    """Returns the classes of an openconfig-interfaces model, as in the
+    README, with config containers and subinterfaces."""
+
+    name = create_node_class(LeafNode, "Name", "name", dict(value=str))
+    mtu = create_node_class(LeafNode, "Mtu", "mtu", dict(value=int))
+    description = create_node_class(
+        LeafNode, "Description", "description", dict(value=str)
+    )
+    enabled = create_node_class(
+        LeafNode, "Enabled", "enabled", dict(value=bool)
+    )
+    index = create_node_class(LeafNode, "Index", "index", dict(value=int))
+    config = create_node_class(
+        ContainerNode,
+        "Config",
+        "config",
+        dict(name=name, mtu=mtu, description=description, enabled=enabled),
+    )
+    subinterface_config = create_node_class(
+        ContainerNode,
+        "SubinterfaceConfig",
+        "config",
+        dict(index=index, description=description, enabled=enabled),
+    )
+    subinterface = create_node_class(
+        ListNode,
+        "Subinterface",
+        "subinterface",
+        dict(index=index, config=subinterface_config),
+        __key__="index",
+    )
+    subinterfaces = create_node_class(
+        ContainerNode,
+        "Subinterfaces",
+        "subinterfaces",
+        dict(subinterface=subinterface),
+    )
+    interface = create_node_class(
+        ListNode,
+        "Interface",
+        "interface",
+        dict(name=name, config=config, subinterfaces=subinterfaces),
+        __key__="name",
+    )
+    interfaces = create_node_class(
+        ContainerNode, "Interfaces", "interfaces", dict(interface=interface)
+    )
+    module = create_node_class(
+        ModuleNode,
+        "OpenConfigInterfaces",
+        "openconfig-interfaces",
+        dict(interfaces=interfaces),
+        __namespace__="http://openconfig.net/yang/interfaces",
+    )
+    return {
+        cls.__name__: cls
+        for cls in (
+            name,
+            mtu,
+            description,
+            enabled,
+            index,
+            config,
+            subinterface_config,
+            subinterface,
+            subinterfaces,
+            interface,
+            interfaces,
+            module,
+        )
+    }
+
+
+def build_openconfig_interfaces(
+    classes: t.Dict[str, t.Any], interfaces: int, subinterfaces: int, /
+) -> t.Any:
+    """Returns an instance of the openconfig-interfaces model with
+    interfaces, each with subinterfaces."""
+
+    c = classes
+    interface = c["Interface"]()
+    for port in range(interfaces):
+        name = c["Name"](f"xe-0/0/{port}")
+        subinterface = c["Subinterface"]()
+        for unit in range(subinterfaces):
+            subinterface.append(
+                c["Index"](unit),
+                c["SubinterfaceConfig"](
+                    c["Index"](unit),
+                    c["Description"](f"unit {unit}"),
+                    c["Enabled"](True),
+                ),
+            )
+        interface.append(
+            name,
+            c["Config"](
+                name,
+                c["Mtu"](1500),
+                c["Description"](f"port {port}"),
+                c["Enabled"](bool(port % 2)),
+            ),
+            c["Subinterfaces"](subinterface),
+        )
+    return c["OpenConfigInterfaces"](c["Interfaces"](interface))
+
+
+def create_cases(options: argparse.Namespace, /) -> t.List[Case]:
+    """Returns the benchmark cases for options."""
+
+    depth, width, size = options.depth, options.width, options.list_size
+    synthetic = create_synthetic_model(depth, width)
+    leaves, (key, entry) = synthetic[:width], synthetic[width : width + 2]
+    containers = synthetic[width + 2 : -1]
+    openconfig = create_openconfig_interfaces()
+    ports, units = options.interfaces, options.subinterfaces
+
+    def append_setup() -> t.Tuple[t.Any, t.List[t.Any]]:
+        rows = [
+            (
+                key(f"entry-{row}"),
+                *(leaf(leaf_value(i, row)) for i, leaf in enumerate(leaves)),
+            )
+            for row in range(size)
+        ]
+        return entry(), rows
+
+    def append_run(state: t.Tuple[t.Any, t.List[t.Any]]) -> t.Any:
+        node, rows = state
+        for row in rows:
+            node.append(*row)
+        return node
+
+    def instantiate_run(values: t.List[t.Any]) -> t.Any:
+        child = entry()
+        for container in containers:
+            child = container(
+                *(leaf(value) for leaf, value in zip(leaves, values)), child
+            )
+        return child
+
+    # Serializers may cache fragments, so each run renders a new tree.
+    cases = [
+        Case(
+            "class-creation",
+            lambda: None,
+            lambda _: create_synthetic_model(depth, width),
+            len(synthetic),
+        ),
+        Case(
+            "instantiation",
+            lambda: [leaf_value(i) for i in range(width)],
+            instantiate_run,
+            depth * (width + 1),
+        ),
+        Case("list-append", append_setup, append_run, size),
+        Case(
+            "synthetic-to-xml",
+            lambda: build_synthetic(synthetic, width, size),
+            lambda module: module.to_xml(),
+            1,
+        ),
+        Case(
+            "openconfig-build",
+            lambda: None,
+            lambda _: build_openconfig_interfaces(openconfig, ports, units),
+            1,
+        ),
+        Case(
+            "openconfig-to-xml",
+            lambda: build_openconfig_interfaces(openconfig, ports, units),
+            lambda module: module.to_xml(),
+            1,
+        ),
+    ]
+    if hasattr(ModuleNode, "to_json"):
+        cases.append(
+            Case(
+                "openconfig-to-json",
+                lambda: build_openconfig_interfaces(openconfig, ports, units),
+                lambda module: module.to_json(),
+                1,
+            )
+        )
+    return [
+        case
+        for case in cases
+        if any(fnmatch.fnmatch(case.name, pattern) for pattern in options.case)
+    ]
+
+
+def time_case(case: Case, repeat: int, min_time: float, /) -> float:
+    """Returns the best ops per second of repeat timings of case, each of
+    enough runs to take min time. Setup is not timed."""
+
+    number, best = 1, 0.0
+    for _ in range(repeat):
+        while True:
+            states = [case.setup() for _ in range(number)]
+            gc.collect()
+            start = time.perf_counter()
+            for state in states:
+                case.run(state)
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+            number *= 2
+        best = max(best, number * case.items / elapsed)
+    return best
+
+
+def measure_case(case: Case, /) -> t.Tuple[int, int]:
+    """Returns the peak bytes allocated by one run of case, and the
+    allocated blocks still held once it returns, including its result."""
+
+    state = case.setup()
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    result = case.run(state)
+    gc.collect()
+    blocks = sys.getallocatedblocks() - blocks
+    del result
+
+    state = case.setup()
+    gc.collect()
+    tracemalloc.start()
+    case.run(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, blocks
+
+
+def run(options: argparse.Namespace, /) -> t.Dict[str, t.Dict[str, float]]:
+    """Returns the ops per second, peak bytes and allocated blocks of
+    each case."""
+
+    results = dict()
+    for case in create_cases(options):
+        ops = time_case(case, options.repeat, options.min_time)
+        peak, blocks = measure_case(case)
+        results[case.name] = dict(ops=ops, peak=peak, blocks=blocks)
+    return results
+
+
+def run_revision(
+    revision: t.Optional[str], argv: t.List[str], /
+) -> t.Dict[str, t.Dict[str, float]]:
+    """Returns the results of this suite run against the yapyang package
+    of revision, or of the working tree when revision is None, in a new
+    interpreter."""
+
+    with tempfile.TemporaryDirectory() as path:
+        if revision is None:
+            path = str(ROOT)
+        else:
+            archive = subprocess.run(
+                ("git", "-C", str(ROOT), "archive", revision, "yapyang"),
+                check=True,
+                capture_output=True,
+            ).stdout
+            with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+                tar.extractall(path)
+        env = dict(os.environ, PYTHONPATH=path)
+        output = subprocess.run(
+            (sys.executable, __file__, "--json", *argv),
+            check=True,
+            capture_output=True,
+            env=env,
+            text=True,
+        ).stdout
+    return json.loads(output)
+
+
+def format_size(size: float, /) -> str:
+    """Returns size in bytes with a binary unit suffix."""
+
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            break
+        size /= 1024
+    return f"{size:.1f}{unit}"
+
+
+def report(results: t.Dict[str, t.Dict[str, float]], /) -> None:
+    """Prints a row of results for each case."""
+
+    print(f"{'case':<20} {'ops/s':>12} {'peak':>10} {'blocks':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<20} {result['ops']:>12,.1f} "
+            f"{format_size(result['peak']):>10} {result['blocks']:>8}"
+        )
+
+
+def compare(revisions: t.List[t.Optional[str]], argv: t.List[str], /) -> None:
+    """Prints results of two revisions side by side, with the change of
+    the second from the first."""
+
+    labels = [revision or "working tree" for revision in revisions]
+    before, after = (run_revision(revision, argv) for revision in revisions)
+    print(f"{labels[0]} -> {labels[1]}")
+    print(
+        f"{'case':<20} {'ops/s':>12} {'ops/s':>12} {'change':>8} "
+        f"{'peak':>10} {'peak':>10}"
+    )
+    for name in dict.fromkeys((*before, *after)):
+        if name not in before or name not in after:
+            print(f"{name:<20} {'(only in one revision)':>36}")
+            continue
+        a, b = before[name], after[name]
+        print(
+            f"{name:<20} {a['ops']:>12,.1f} {b['ops']:>12,.1f} "
+            f"{b['ops'] / a['ops'] - 1:>+8.1%} "
+            f"{format_size(a['peak']):>10} {format_size(b['peak']):>10}"
+        )
+
+
+def parse_args(argv: t.List[str], /) -> argparse.Namespace:
+    """Returns options parsed from command line args."""
+
+    parser = argparse.ArgumentParser(
+        description="Benchmarks yapyang class creation, instantiation, list "
+        "append and serialization."
+    )
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--list-size", type=int, default=1_000)
+    parser.add_argument("--interfaces", type=int, default=200)
+    parser.add_argument("--subinterfaces", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument(
+        "--case",
+        action="append",
+        help="run cases matching glob pattern, may repeat",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    parser.add_argument(
+        "--compare",
+        nargs="+",
+        metavar="REV",
+        help="compare two git revisions, or one with the working tree",
+    )
+    options = parser.parse_args(argv)
+    options.case = options.case or ["*"]
+    if options.compare and len(options.compare) > 2:
+        parser.error("--compare takes one or two revisions")
+    return options
+
+
+def main(argv: t.List[str], /) -> None:
+    """Runs the suite, or compares two revisions, and prints results."""
+
+    options = parse_args(argv)
+    if options.compare:
+        # Remaining args are passed on to each revision run.
+        index = argv.index("--compare")
+        passed = argv[:index] + argv[index + 1 + len(options.compare) :]
+        compare([*options.compare, None][:2], passed)
+    elif options.json:
+        print(json.dumps(run(options)))
+    else:
+        print(
+            f"depth: {options.depth}, width: {options.width}, "
+            f"list size: {options.list_size}, interfaces: "
+            f"{options.interfaces}x{options.subinterfaces}"
+        )
+        report(run(options))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,212 @@
+"""This module contains functional tests for binary encoding."""
+
+import copy
+import ipaddress
+import pickle
+
+import pytest
+
+from yapyang.binary import dumps, loads
+from yapyang.nodes import (
+    ContainerNode,
+    LeafListNode,
+    LeafNode,
+    ListNode,
+    ModuleNode,
+)
+
+
+class Name(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "name"
+
+    value: str
+
+
+class Enabled(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "enabled"
+
+    value: bool
+
+
+class Address(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "address"
+
+    value: ipaddress.IPv4Address
+
+
+class Neighbor(ListNode):
+    """Represents a subclass of ListNode."""
+
+    __identifier__: str = "neighbor"
+    __key__: str = "address"
+
+    address: Address
+
+
+class Interface(ListNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "interface"
+    __key__: str = "name"
+
+    name: Name
+    enabled: Enabled
+
+
+class User(LeafListNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "user"
+
+    value: str
+
+
+class HostName(LeafNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "host-name"
+
+    value: str
+
+
+class System(ContainerNode):
+    """Represents a ModuleNode child node."""
+
+    __identifier__: str = "system"
+
+    host_name: HostName
+    interface: Interface
+    user: User
+
+
+class OpenConfigSystem(ModuleNode):
+    """Represents a subclass of ModuleNode."""
+
+    __identifier__: str = "openconfig-system"
+    __namespace__: str = "http://openconfig.net/yang/system"
+
+    system: System
+
+
+class OtherSystemContainer(ContainerNode):
+    """Represents a ModuleNode child node with another schema."""
+
+    __identifier__: str = "system"
+
+    host_name: HostName
+
+
+class OtherSystem(ModuleNode):
+    """Represents a subclass of ModuleNode with another schema."""
+
+    __identifier__: str = "openconfig-system"
+    __namespace__: str = "http://openconfig.net/yang/system"
+
+    system: OtherSystemContainer
+
+
+@pytest.fixture
+def module():
+    """Returns instance of ModuleNode subclass with child nodes."""
+
+    return OpenConfigSystem(
+        System(
+            HostName("r1"),
+            Interface.from_rows((("xe-0/0/0", True), ("xe-0/0/1", False))),
+            User.from_rows(("John Doe", "Jane Doe")),
+        )
+    )
+
+
+def test_given_instance_of_module_node_subclass_when_to_bytes_and_from_bytes_are_called_then_instance_with_same_xml_returned(
+    module,
+):
+    """Test given instance of module node subclass when to bytes and from bytes are called then instance with same xml returned."""
+
+    # Given instance of ModuleNode subclass.
+    # When to_bytes and from_bytes are called.
+    restored = OpenConfigSystem.from_bytes(module.to_bytes())
+
+    # Then instance with same XML returned.
+    assert restored.to_xml() == module.to_xml()
+    assert restored.system.interface["xe-0/0/1"].enabled == Enabled(False)
+
+
+def test_given_instance_of_module_node_subclass_when_pickled_and_copied_then_equal_instances_returned(
+    module,
+):
+    """Test given instance of module node subclass when pickled and copied then equal instances returned."""
+
+    # Given instance of ModuleNode subclass.
+    # When pickled and copied.
+    restored = pickle.loads(pickle.dumps(module))
+    shallow, deep = copy.copy(module), copy.deepcopy(module)
+
+    # Then equal instances returned.
+    assert restored.to_json() == shallow.to_json() == deep.to_json()
+    assert restored.to_json() == module.to_json()
+
+    # Then shallow copies share children.
+    assert shallow.system is module.system
+    assert deep.system is not module.system
+
+
+def test_given_leaf_value_that_marshal_does_not_support_when_pickled_then_equal_instance_returned():
+    """Test given leaf value that marshal does not support when pickled then equal instance returned."""
+
+    # Given leaf value that marshal does not support.
+    neighbor = Neighbor.from_rows(((ipaddress.IPv4Address("192.0.2.1"),),))
+
+    # When pickled.
+    restored = pickle.loads(pickle.dumps(neighbor))
+
+    # Then equal instance returned.
+    assert (
+        restored.to_xml()
+        == "<neighbor><address>192.0.2.1</address></neighbor>"
+    )
+
+    # Then binary encoding is not used.
+    with pytest.raises(ValueError):
+        neighbor.to_bytes()
+
+
+@pytest.mark.parametrize(
+    "data, match",
+    (
+        (b"not yapyang", "Expected data in yapyang binary format."),
+        (dumps(HostName("r1")), "Schema fingerprint of data does not match"),
+    ),
+)
+def test_given_data_of_another_format_or_schema_when_loads_is_called_then_exception_is_raised(
+    data, match
+):
+    """Test given data of another format or schema when loads is called then exception is raised."""
+
+    # Given data of another format or schema.
+    # When loads is called.
+    with pytest.raises(ValueError, match=match):
+        loads(data, OtherSystem)
+
+    # Then exception is raised.
+
+
+def test_given_classes_with_different_schemas_when_dumps_is_called_then_fingerprints_differ():
+    """Test given classes with different schemas when dumps is called then fingerprints differ."""
+
+    # Given classes with different schemas.
+    module = OtherSystem(OtherSystemContainer(HostName("r1")))
+
+    # When dumps is called.
+    data = dumps(module)
+
+    # Then fingerprints differ.
+    with pytest.raises(ValueError):
+        loads(data, OpenConfigSystem)
+    assert loads(data, OtherSystem).to_xml() == module.to_xml()
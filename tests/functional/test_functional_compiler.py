@@ -0,0 +1,413 @@
+"""This module contains functional tests for the YANG compiler."""
+
+import io
+import sys
+
+import pytest
+
+from yapyang import compiler, loading, nodes
+from yapyang.compiler import generate, load, parse_yang
+from yapyang.constants import DEFAULTS, IDENTIFIER
+from yapyang.nodes import NodeMeta
+
+TYPES = """
+module example-types {
+  namespace "urn:example:types";
+  prefix et;
+
+  typedef mtu-type {
+    type uint16 { range "68..9216"; }
+    default 1500;
+  }
+
+  grouping counters {
+    typedef counter { type uint64; }
+    leaf in-octets { type counter; }
+  }
+}
+"""
+
+COMMON = """
+submodule example-interfaces-common {
+  belongs-to example-interfaces { prefix ei; }
+  import example-types { prefix et; }
+
+  grouping config {
+    leaf name { type string; }
+    leaf mtu { type et:mtu-type; }
+  }
+}
+"""
+
+INTERFACES = """
+// Interfaces of an example device.
+module example-interfaces {
+  namespace "urn:example:interfaces";
+  prefix "ei";
+
+  import example-types { prefix et; }
+  include example-interfaces-common;
+
+  container interfaces {
+    list interface {
+      key "name";
+      leaf name { type leafref { path "../config/name"; } }
+      container config { uses config; }
+      container state {
+        config false;
+        uses et:counters;
+        leaf-list address { type string; }
+      }
+    }
+  }
+}
+"""
+
+
+LOOPBACK = """
+module example-loopback {
+  namespace "urn:example:loopback";
+  prefix el;
+
+  container interface {
+    leaf name { type string; mandatory true; }
+    leaf description { type string; }
+    choice loopback {
+      leaf loopback-mode { type boolean; }
+      case remote {
+        leaf remote-address { type string; }
+        leaf remote-port { type uint16; default 7; }
+      }
+    }
+  }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def unload():
+    """Removes modules loaded by each test, which are otherwise reused by
+    tests that load the same sources."""
+
+    modules = set(sys.modules)
+    yield
+    for name in set(sys.modules) - modules:
+        if name.startswith("yapyang_models_"):
+            del sys.modules[name]
+            nodes._class_caches.pop(name, None)
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Returns the path of YANG module example-interfaces, whose imports
+    and includes are in the same directory."""
+
+    for name, text in (
+        ("example-types@2024-01-01", TYPES),
+        ("example-interfaces-common", COMMON),
+        ("example-interfaces", INTERFACES),
+    ):
+        (tmp_path / f"{name}.yang").write_text(text)
+    return str(tmp_path / "example-interfaces.yang")
+
+
+def test_given_yang_text_when_parse_yang_is_called_then_statement_tree_returned():
+    """Test given yang text when parse yang is called then statement tree returned."""
+
+    # Given YANG text.
+    text = """
+    module m { // Comment.
+      prefix m; /* Block
+      comment. */
+      leaf l {
+        description "first \\"line\\"
+                     second " + 'line';
+      }
+    }
+    """
+
+    # When parse_yang is called.
+    module = parse_yang(text)
+
+    # Then statement tree returned.
+    leaf = module.find("leaf")
+    assert (module.keyword, module.argument) == ("module", "m")
+    assert module.argument_of("prefix") == "m"
+    assert leaf.argument_of("description") == 'first "line"\nsecond line'
+
+
+@pytest.mark.parametrize(
+    "text", ["module m { leaf l; ", "module m { } }", 'module m { "l"; }']
+)
+def test_given_invalid_yang_text_when_parse_yang_is_called_then_value_error_raised(
+    text,
+):
+    """Test given invalid yang text when parse yang is called then value error raised."""
+
+    # Given invalid YANG text.
+    # When parse_yang is called.
+    # Then ValueError raised.
+    with pytest.raises(ValueError):
+        parse_yang(text)
+
+
+def test_given_yang_module_with_imports_groupings_and_uses_when_loaded_then_node_classes_returned(
+    sources, tmp_path
+):
+    """Test given yang module with imports groupings and uses when loaded then node classes returned."""
+
+    # Given YANG module with imports, groupings and uses.
+    # When loaded.
+    models = load([sources], cache_dir=str(tmp_path / "cache"))
+
+    # Then node classes returned.
+    ns = vars(models)
+    interface = ns["InterfacesInterface"]()
+    interface.append(
+        ns["InterfacesInterfaceName"]("xe-0/0/0"),
+        ns["InterfacesInterfaceConfig"](
+            ns["InterfacesInterfaceConfigName"]("xe-0/0/0")
+        ),
+        ns["InterfacesInterfaceState"](
+            ns["InterfacesInterfaceStateInOctets"](1),
+            ns["InterfacesInterfaceStateAddress"](),
+        ),
+    )
+    module = models.ExampleInterfaces(ns["Interfaces"](interface))
+    xml = module.to_xml()
+    assert models.__all__ == ("ExampleInterfaces",)
+    assert xml == (
+        '<interfaces xmlns="urn:example:interfaces"><interface>'
+        "<name>xe-0/0/0</name>"
+        "<config><name>xe-0/0/0</name><mtu>1500</mtu></config>"
+        "<state><in-octets>1</in-octets></state>"
+        "</interface></interfaces>"
+    )
+    assert models.ExampleInterfaces.from_xml(io.StringIO(xml)).to_xml() == xml
+
+
+def test_given_loaded_yang_module_when_loaded_again_then_cached_module_reused_until_sources_change(
+    sources, tmp_path, monkeypatch
+):
+    """Test given loaded yang module when loaded again then cached module reused until sources change."""
+
+    # Given loaded YANG module.
+    cache_dir = str(tmp_path / "cache")
+    models = load([sources], cache_dir=cache_dir)
+    del sys.modules[models.__name__]
+
+    # When loaded again.
+    def fail(*args, **kwargs):
+        raise AssertionError("Sources were compiled again.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(compiler, "generate", fail)
+        cached = load([sources], cache_dir=cache_dir)
+
+    # Then cached module reused until sources change.
+    assert cached is not models and cached.__name__ == models.__name__
+    (tmp_path / "example-types@2024-01-01.yang").write_text(
+        TYPES.replace("1500", "9000")
+    )
+    changed = load([sources], cache_dir=cache_dir)
+    assert changed.__name__ != models.__name__
+    assert "InterfacesInterfaceConfigMtu(9000)" in generate([sources])
+
+
+def test_given_yang_module_with_unknown_grouping_when_generate_is_called_then_value_error_raised(
+    tmp_path,
+):
+    """Test given yang module with unknown grouping when generate is called then value error raised."""
+
+    # Given YANG module with unknown grouping.
+    path = tmp_path / "m.yang"
+    path.write_text(
+        'module m { namespace "urn:m"; prefix m; container c { uses g; } }'
+    )
+
+    # When generate is called.
+    # Then ValueError raised.
+    with pytest.raises(ValueError, match="Unknown grouping g"):
+        generate([str(path)])
+
+
+def test_given_yang_module_when_loaded_lazily_then_node_classes_built_on_first_access(
+    sources, tmp_path
+):
+    """Test given yang module when loaded lazily then node classes built on first access."""
+
+    # Given YANG module.
+    cache_dir = str(tmp_path / "cache")
+    eager = load([sources], cache_dir=cache_dir)
+
+    # When loaded lazily.
+    models = load([sources], cache_dir=cache_dir, lazy=True)
+
+    # Then node classes built on first access.
+    assert models.__name__ != eager.__name__
+    assert "InterfacesInterface" not in vars(models)
+    assert "InterfacesInterface" in dir(models)
+    xml = list()
+    for package in (eager, models):
+        interface = package.InterfacesInterface()
+        interface.append(
+            package.InterfacesInterfaceName("xe-0/0/0"),
+            package.InterfacesInterfaceConfig(
+                package.InterfacesInterfaceConfigName("xe-0/0/0")
+            ),
+            package.InterfacesInterfaceState(
+                package.InterfacesInterfaceStateInOctets(1),
+                package.InterfacesInterfaceStateAddress(),
+            ),
+        )
+        xml.append(
+            package.ExampleInterfaces(package.Interfaces(interface)).to_xml()
+        )
+    assert "InterfacesInterface" in vars(models)
+    assert models.InterfacesInterface.__module__ == models.__name__
+    assert xml[0] == xml[1]
+    assert (
+        models.ExampleInterfaces.from_xml(io.StringIO(xml[1])).to_xml()
+        == xml[1]
+    )
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        models.Unknown
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_given_module_loaded_with_precompute_when_loaded_again_then_metadata_rehydrated_without_validation(
+    sources, tmp_path, monkeypatch, lazy
+):
+    """Test given module loaded with precompute when loaded again then metadata rehydrated without validation."""
+
+    # Given module loaded with precompute.
+    cache_dir = str(tmp_path / "cache")
+    models = load([sources], cache_dir=cache_dir, lazy=lazy, precompute=True)
+    xml = models.InterfacesInterfaceConfig(
+        models.InterfacesInterfaceConfigName("xe-0/0/0")
+    ).to_xml()
+    meta = models.InterfacesInterfaceConfigMtu.__meta__
+    loading._write_caches()
+    del sys.modules[models.__name__]
+
+    # When loaded again.
+    def fail(*args, **kwargs):
+        raise AssertionError("Metadata was constructed again.")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(NodeMeta, "_construct_meta", fail)
+        patch.setattr(NodeMeta, "_meta_checker", fail)
+        cached = load(
+            [sources], cache_dir=cache_dir, lazy=lazy, precompute=True
+        )
+        mtu = cached.InterfacesInterfaceConfigMtu
+
+    # Then metadata rehydrated without validation.
+    assert cached is not models
+    assert list(mtu.__meta__) == list(meta)
+    assert mtu.__meta__[DEFAULTS] == {IDENTIFIER: "mtu"}
+    assert cached.InterfacesInterfaceConfig.__meta__[DEFAULTS]["mtu"] == mtu(
+        1500
+    )
+    assert (
+        cached.InterfacesInterfaceConfig(
+            cached.InterfacesInterfaceConfigName("xe-0/0/0")
+        ).to_xml()
+        == xml
+    )
+
+
+def test_given_precomputed_module_when_fingerprint_changes_then_metadata_constructed_and_cache_replaced(
+    sources, tmp_path, monkeypatch
+):
+    """Test given precomputed module when fingerprint changes then metadata constructed and cache replaced."""
+
+    # Given precomputed module.
+    cache_dir = str(tmp_path / "cache")
+    models = load([sources], cache_dir=cache_dir, precompute=True)
+    del sys.modules[models.__name__]
+    (path,) = (tmp_path / "cache").glob("*.classes")
+    written = path.read_bytes()
+
+    # When fingerprint changes.
+    monkeypatch.setattr(loading, "_sources_digest", "changed")
+    constructed = list()
+    construct_meta = NodeMeta._construct_meta
+
+    def record(namespace, bases, /):
+        constructed.append(namespace["__qualname__"])
+        construct_meta(namespace, bases)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(NodeMeta, "_construct_meta", record)
+        load([sources], cache_dir=cache_dir, precompute=True)
+
+    # Then metadata constructed and cache replaced.
+    assert "InterfacesInterfaceConfigMtu" in constructed
+    assert path.read_bytes() != written
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize(
+    "xml",
+    [
+        "<interface><name>lo0</name></interface>",
+        "<interface><name>lo0</name><loopback-mode>true</loopback-mode>"
+        "</interface>",
+        "<interface><name>lo0</name><description>a &amp; b</description>"
+        "<remote-address>192.0.2.1</remote-address></interface>",
+    ],
+)
+def test_given_yang_module_with_choice_and_optional_leaves_when_payload_of_a_case_is_parsed_then_absent_leaves_omitted(
+    tmp_path, lazy, xml
+):
+    """Test given yang module with choice and optional leaves when payload of a case is parsed then absent leaves omitted."""
+
+    # Given YANG module with choice and optional leaves.
+    path = tmp_path / "example-loopback.yang"
+    path.write_text(LOOPBACK)
+    models = load([str(path)], cache_dir=str(tmp_path / "cache"), lazy=lazy)
+    xml = xml.replace(
+        "<interface>", '<interface xmlns="urn:example:loopback">'
+    )
+
+    # When payload of a case is parsed.
+    module = models.ExampleLoopback.from_xml(io.StringIO(xml))
+
+    # Then absent leaves omitted.
+    assert module.to_xml() == xml
+    assert module.interface.remote_port is None
+    json = module.to_json()
+    assert (
+        models.ExampleLoopback.from_json(io.StringIO(json)).to_json() == json
+    )
+    assert models.ExampleLoopback.from_bytes(module.to_bytes()).to_xml() == xml
+    with pytest.raises(TypeError, match="Missing required argument: name"):
+        models.Interface()
+
+
+def test_given_yang_module_with_keyless_list_with_choice_when_loaded_then_entries_keyed_by_leaves_outside_of_choice(
+    tmp_path,
+):
+    """Test given yang module with keyless list with choice when loaded then entries keyed by leaves outside of choice."""
+
+    # Given YANG module with keyless list with choice.
+    path = tmp_path / "m.yang"
+    path.write_text(
+        'module m { namespace "urn:m"; prefix m; container stats { '
+        "config false; list counter { leaf name { type string; } "
+        "choice c { leaf x { type uint32; } leaf y { type uint32; } } } } }"
+    )
+
+    # When loaded.
+    models = load([str(path)], cache_dir=str(tmp_path / "cache"))
+
+    # Then entries keyed by leaves outside of choice.
+    xml = (
+        '<stats xmlns="urn:m"><counter><name>a</name><x>1</x></counter>'
+        "<counter><name>b</name><y>2</y></counter></stats>"
+    )
+    module = models.M.from_xml(io.StringIO(xml))
+    assert models.StatsCounter.__meta__[DEFAULTS]["__key__"] == "name"
+    assert module.stats.counter["b"].x is None
+    assert module.to_xml() == xml
@@ -0,0 +1,167 @@
+"""This module contains functional tests for fleet rendering."""
+
+import pytest
+
+from yapyang import render_as_completed, render_many
+from yapyang.fleet import CHUNKS_PER_WORKER
+from yapyang.nodes import ContainerNode, LeafNode, ListNode, ModuleNode
+
+
+class Name(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "name"
+
+    value: str
+
+
+class Mtu(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "mtu"
+
+    value: int
+
+
+class Interface(ListNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "interface"
+    __key__: str = "name"
+
+    name: Name
+    mtu: Mtu
+
+
+class HostName(LeafNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "host-name"
+
+    value: str
+
+
+class System(ContainerNode):
+    """Represents a ModuleNode child node."""
+
+    __identifier__: str = "system"
+
+    host_name: HostName
+    interface: Interface
+
+
+class OpenConfigSystem(ModuleNode):
+    """Represents a subclass of ModuleNode."""
+
+    __identifier__: str = "openconfig-system"
+    __namespace__: str = "http://openconfig.net/yang/system"
+
+    system: System
+
+
+def build(index):
+    """Returns instance of ModuleNode subclass for device index."""
+
+    return OpenConfigSystem(
+        System(
+            HostName(f"r{index}"),
+            Interface.from_rows(
+                (f"xe-0/0/{port}", 1500 + index) for port in range(4)
+            ),
+        )
+    )
+
+
+@pytest.fixture
+def modules():
+    """Returns instances of ModuleNode subclass, one per device."""
+
+    return [build(index) for index in range(10)]
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize("format", ("xml", "json"))
+def test_given_instances_of_module_node_subclass_when_render_many_is_called_then_payloads_returned_in_order(
+    modules, workers, format
+):
+    """Test given instances of module node subclass when render many is called then payloads returned in order."""
+
+    # Given instances of ModuleNode subclass.
+    expected = [getattr(module, f"to_{format}")() for module in modules]
+
+    # When render_many is called.
+    payloads = render_many(modules, format, workers=workers, chunk_size=3)
+
+    # Then payloads returned in order.
+    assert list(payloads) == expected
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_given_instances_of_module_node_subclass_when_render_as_completed_is_called_then_index_and_payload_of_each_instance_returned(
+    modules, workers
+):
+    """Test given instances of module node subclass when render as completed is called then index and payload of each instance returned."""
+
+    # Given instances of ModuleNode subclass.
+    expected = [module.to_xml() for module in modules]
+
+    # When render_as_completed is called.
+    payloads = render_as_completed(modules, workers=workers, chunk_size=3)
+
+    # Then index and payload of each instance returned.
+    assert sorted(payloads) == list(enumerate(expected))
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_given_items_and_build_function_when_render_many_is_called_then_payload_of_node_built_from_each_item_returned(
+    modules, workers
+):
+    """Test given items and build function when render many is called then payload of node built from each item returned."""
+
+    # Given items and build function.
+    items = range(10)
+
+    # When render_many is called.
+    payloads = render_many(items, build=build, workers=workers, chunk_size=3)
+
+    # Then payload of node built from each item returned.
+    assert list(payloads) == [module.to_xml() for module in modules]
+
+
+@pytest.mark.parametrize("render", (render_many, render_as_completed))
+def test_given_many_items_when_first_payload_is_rendered_then_bounded_window_of_items_consumed(
+    render,
+):
+    """Test given many items when first payload is rendered then bounded window of items consumed."""
+
+    # Given many items.
+    consumed = list()
+
+    def items():
+        for index in range(1000):
+            consumed.append(index)
+            yield index
+
+    # When first payload is rendered.
+    payloads = render(items(), build=build, workers=2, chunk_size=1)
+    next(payloads)
+
+    # Then bounded window of items consumed.
+    assert len(consumed) <= 2 * CHUNKS_PER_WORKER + 1
+    assert len(list(payloads)) == 999
+
+
+@pytest.mark.parametrize(
+    "kwargs", (dict(format="yaml"), dict(format="xml", chunk_size=0))
+)
+def test_given_invalid_format_or_chunk_size_when_render_many_is_called_then_exception_is_raised(
+    modules, kwargs
+):
+    """Test given invalid format or chunk size when render many is called then exception is raised."""
+
+    # Given invalid format or chunk size.
+    # When render_many is called.
+    with pytest.raises(ValueError):
+        render_many(modules, **kwargs)
+
+    # Then exception is raised.
@@ -0,0 +1,247 @@
+"""This module contains functional tests for nodes ColumnarListNode."""
+
+import io
+
+import pytest
+
+from yapyang.nodes import (
+    ColumnarListNode,
+    ContainerNode,
+    LeafNode,
+    ListNode,
+    ModuleNode,
+)
+
+
+class Name(LeafNode):
+    """Represents a ColumnarListNode child node."""
+
+    __identifier__: str = "name"
+
+    value: str
+
+
+class Mtu(LeafNode):
+    """Represents a ColumnarListNode child node."""
+
+    __identifier__: str = "mtu"
+
+    value: int
+
+
+class Enabled(LeafNode):
+    """Represents a ColumnarListNode child node."""
+
+    __identifier__: str = "enabled"
+
+    value: bool
+
+
+class Interface(ListNode):
+    """Represents a subclass of ListNode."""
+
+    __identifier__: str = "interface"
+    __key__: str = "name"
+
+    name: Name
+    mtu: Mtu
+    enabled: Enabled
+
+
+class ColumnarInterface(ColumnarListNode):
+    """Represents a subclass of ColumnarListNode."""
+
+    __identifier__: str = "interface"
+    __key__: str = "name"
+
+    name: Name
+    mtu: Mtu
+    enabled: Enabled
+
+
+class Interfaces(ContainerNode):
+    """Represents a ModuleNode child node."""
+
+    __identifier__: str = "interfaces"
+
+    interface: ColumnarInterface
+
+
+class System(ModuleNode):
+    """Represents a subclass of ModuleNode."""
+
+    __identifier__: str = "system"
+    __namespace__: str = "urn:yapyang:system"
+
+    interfaces: Interfaces
+
+
+ROWS = [
+    ("et-0/0/0", 1500, True),
+    ("xe-0/0/1", 9000, False),
+    ("xe-0/0/2", 2**40, True),
+]
+
+
+def test_given_instances_of_list_node_and_columnar_list_node_with_the_same_rows_when_serialized_then_the_same_payloads_returned():
+    """Test given instances of list node and columnar list node with the same rows when serialized then the same payloads returned."""
+
+    # Given instances of ListNode and ColumnarListNode with the same rows.
+    interface = Interface.from_rows(ROWS)
+    columnar = ColumnarInterface.from_rows(ROWS)
+
+    # When serialized.
+    payloads = (
+        columnar.to_xml(attrs={"nc:operation": "merge"}),
+        columnar.to_json(),
+    )
+
+    # Then the same payloads returned.
+    assert payloads == (
+        interface.to_xml(attrs={"nc:operation": "merge"}),
+        interface.to_json(),
+    )
+
+
+def test_given_instance_of_columnar_list_node_with_markup_values_when_to_xml_is_called_then_escaped_payload_of_list_node_returned():
+    """Test given instance of columnar list node with markup values when to xml is called then escaped payload of list node returned."""
+
+    # Given instance of ColumnarListNode with markup values.
+    rows = [("a&b<c", 1500, True), ("{0}", 9000, False)]
+    columnar = ColumnarInterface.from_rows(rows)
+
+    # When to_xml is called.
+    xml = columnar.to_xml()
+
+    # Then escaped payload of ListNode returned.
+    assert xml == Interface.from_rows(rows).to_xml()
+    assert xml == (
+        "<interface><name>a&amp;b&lt;c</name><mtu>1500</mtu>"
+        "<enabled>true</enabled></interface>"
+        "<interface><name>{0}</name><mtu>9000</mtu>"
+        "<enabled>false</enabled></interface>"
+    )
+
+
+def test_given_instance_of_columnar_list_node_when_entry_is_accessed_then_row_view_with_leaf_nodes_returned():
+    """Test given instance of columnar list node when entry is accessed then row view with leaf nodes returned."""
+
+    # Given instance of ColumnarListNode.
+    columnar = ColumnarInterface.from_rows(ROWS)
+
+    # When entry is accessed.
+    entry = columnar["xe-0/0/1"]
+
+    # Then row view with leaf nodes returned.
+    assert (entry.name, entry.mtu, entry.enabled) == (
+        Name("xe-0/0/1"),
+        Mtu(9000),
+        Enabled(False),
+    )
+    assert entry == columnar.get("xe-0/0/1")
+    assert "et-0/0/0" in columnar and "ge-0/0/0" not in columnar
+    assert [entry.name.value for entry in columnar.entries] == [
+        "et-0/0/0",
+        "xe-0/0/1",
+        "xe-0/0/2",
+    ]
+
+
+def test_given_instance_of_columnar_list_node_when_entries_change_then_columns_change_as_list_node_entries():
+    """Test given instance of columnar list node when entries change then columns change as list node entries."""
+
+    # Given instance of ColumnarListNode.
+    interface = Interface.from_rows(ROWS)
+    columnar = ColumnarInterface.from_rows(ROWS)
+
+    # When entries change.
+    for node in (interface, columnar):
+        node["xe-0/0/1"].mtu = Mtu(1514)
+        node.pop("et-0/0/0")
+        node.replace(Name("xe-0/0/2"), Mtu(2**70), Enabled(False))
+        node.upsert(Name("ge-0/0/3"), Mtu(1500), Enabled(True))
+        node.append(Name("xe-0/0/1"), Mtu(1), Enabled(True))
+        node.extend([dict(name="ge-0/0/4", mtu=Mtu(1500), enabled=True)])
+
+    # Then columns change as ListNode entries.
+    assert columnar.to_xml() == interface.to_xml()
+    assert columnar["xe-0/0/2"].mtu == Mtu(2**70)
+
+
+@pytest.mark.parametrize(
+    "change, exception",
+    [
+        (
+            lambda node: setattr(node["et-0/0/0"], "name", Name("x")),
+            AttributeError,
+        ),
+        (lambda node: setattr(node["et-0/0/0"], "mtu", 1500), TypeError),
+        (lambda node: node.extend([("ge-0/0/3", "1500", True)]), TypeError),
+    ],
+)
+def test_given_instance_of_columnar_list_node_when_invalid_change_is_made_then_exception_raised_and_entries_unchanged(
+    change, exception
+):
+    """Test given instance of columnar list node when invalid change is made then exception raised and entries unchanged."""
+
+    # Given instance of ColumnarListNode.
+    columnar = ColumnarInterface.from_rows(ROWS)
+    xml = columnar.to_xml()
+
+    # When invalid change is made.
+    # Then exception raised and entries unchanged.
+    with pytest.raises(exception):
+        change(columnar)
+    assert columnar.to_xml() == xml
+
+
+def test_given_subclass_of_columnar_list_node_with_list_node_arg_when_defined_then_type_error_raised():
+    """Test given subclass of columnar list node with list node arg when defined then type error raised."""
+
+    # Given subclass of ColumnarListNode with ListNode arg.
+    # When defined.
+    # Then TypeError raised.
+    with pytest.raises(TypeError):
+
+        class Unit(ColumnarListNode):
+            __identifier__: str = "unit"
+            __key__: str = "name"
+
+            name: Name
+            interface: Interface
+
+
+def test_given_snapshot_of_module_with_columnar_list_node_when_live_entries_change_then_snapshot_unchanged():
+    """Test given snapshot of module with columnar list node when live entries change then snapshot unchanged."""
+
+    # Given snapshot of module with ColumnarListNode.
+    system = System(Interfaces(ColumnarInterface.from_rows(ROWS)))
+    snapshot = system.snapshot()
+    xml = snapshot.to_xml()
+
+    # When live entries change.
+    system.interfaces.interface["et-0/0/0"].mtu = Mtu(1514)
+    system.interfaces.interface.pop("xe-0/0/1")
+
+    # Then snapshot unchanged.
+    assert snapshot.to_xml() == xml != system.to_xml()
+    with pytest.raises(TypeError):
+        snapshot.interfaces.interface["et-0/0/0"].mtu = Mtu(1514)
+
+
+def test_given_module_with_columnar_list_node_when_parsed_from_its_payloads_and_bytes_then_equal_module_returned():
+    """Test given module with columnar list node when parsed from its payloads and bytes then equal module returned."""
+
+    # Given module with ColumnarListNode.
+    system = System(Interfaces(ColumnarInterface.from_rows(ROWS[:2])))
+
+    # When parsed from its payloads and bytes.
+    modules = (
+        System.from_json(io.StringIO(system.to_json())),
+        System.from_bytes(system.to_bytes()),
+    )
+
+    # Then equal module returned.
+    for module in modules:
+        assert isinstance(module.interfaces.interface, ColumnarInterface)
+        assert module.to_json() == system.to_json()
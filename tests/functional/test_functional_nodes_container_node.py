@@ -1,5 +1,7 @@
 """This module contains functional tests for nodes ContainerNode."""
 
+import pytest
+
 from yapyang.nodes import ContainerNode
 from yapyang.utils import MetaInfo
 
@@ -89,3 +91,65 @@ def test_given_instance_of_container_node_subclass_with_child_nodes_given_child_
 
     # Then XML tree from instance XML element returned.
     assert xml == "<system><interfaces></interfaces></system>"
+
+
+def test_given_child_nodes_have_meta_info_default_with_attrs_and_namespaces_when_to_xml_is_called_then_child_node_xml_elements_contain_escaped_fragment():
+    """Test given child nodes have meta info default with attrs and namespaces when to xml is called then child node xml elements contain escaped fragment."""
+
+    # Given child nodes have MetaInfo default with attrs and namespaces.
+    attrs = {"nc:operation": "delete", "message": 'a < b & "c"\n'}
+
+    class Override(System):
+        """Represents a subclass of ContainerNode."""
+
+        interfaces: Interfaces = MetaInfo(
+            attrs=attrs,
+            namespaces={"nc": "urn:ietf:params:xml:ns:netconf:base:1.0"},
+        )
+
+    attrs["nc:operation"] = "merge"
+
+    # When to_xml is called.
+    xml = Override(Interfaces()).to_xml()
+
+    # Then child node XML elements contain escaped fragment.
+    assert xml == (
+        "<system><interfaces"
+        ' xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0"'
+        ' nc:operation="delete"'
+        ' message="a &lt; b &amp; &quot;c&quot;&#10;">'
+        "</interfaces></system>"
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs, exception",
+    [
+        (dict(attrs={"nc:operation": 1}), TypeError),
+        (dict(attrs={'operation="delete"': ""}), ValueError),
+        (dict(attrs={"nc:": "delete"}), ValueError),
+        (dict(namespaces={"1nc": "urn:nc"}), ValueError),
+    ],
+)
+def test_given_meta_info_with_invalid_attrs_or_namespaces_when_created_then_exception_raised(
+    kwargs, exception
+):
+    """Test given meta info with invalid attrs or namespaces when created then exception raised."""
+
+    # Given MetaInfo with invalid attrs or namespaces.
+    # When created.
+    # Then exception raised.
+    with pytest.raises(exception):
+        MetaInfo(**kwargs)
+
+
+def test_given_meta_info_with_attrs_when_attrs_are_changed_then_type_error_raised():
+    """Test given meta info with attrs when attrs are changed then type error raised."""
+
+    # Given MetaInfo with attrs.
+    meta_info = MetaInfo(attrs={"nc:operation": "delete"})
+
+    # When attrs are changed.
+    # Then TypeError raised.
+    with pytest.raises(TypeError):
+        meta_info.attrs["nc:operation"] = "merge"  # type: ignore[index]
@@ -1,5 +1,9 @@
 """This module contains functional tests for nodes LeafListNode."""
 
+import io
+
+import pytest
+
 from yapyang.nodes import LeafListNode
 
 
@@ -42,3 +46,52 @@ def test_given_instance_of_leaf_list_node_subclass_with_entries_when_to_xml_is_c
         xml
         == f'<user operation="create">{john}</user><user operation="create">{jane}</user>'
     )
+
+
+def test_given_instance_of_leaf_list_node_subclass_with_markup_entries_when_write_xml_is_called_then_escaped_xml_elements_written():
+    """Test given instance of leaf list node subclass with markup entries when write xml is called then escaped xml elements written."""
+
+    # Given instance of LeafListNode subclass with markup entries.
+    user = User()
+    user.extend(("R&D", "<admin>"))
+    sink = io.StringIO()
+
+    # When write_xml is called.
+    user.write_xml(sink)
+
+    # Then escaped XML elements written.
+    assert sink.getvalue() == "<user>R&amp;D</user><user>&lt;admin&gt;</user>"
+
+
+def test_given_values_when_from_rows_is_called_then_instance_of_leaf_list_node_subclass_with_entry_for_each_value_returned():
+    """Test given values when from rows is called then instance of leaf list node subclass with entry for each value returned."""
+
+    # Given values.
+    values = ("John Doe", "Jane Doe", "John Doe")
+
+    # When from_rows is called.
+    user = User.from_rows(values)
+
+    # Then instance of LeafListNode subclass with entry for each value
+    # returned.
+    assert list(user.entries) == ["John Doe", "Jane Doe"]
+
+
+def test_given_instance_of_leaf_list_node_subclass_when_extend_is_called_with_invalid_value_then_exception_is_raised_and_no_entries_appended():
+    """Test given instance of leaf list node subclass when extend is called with invalid value then exception is raised and no entries appended."""
+
+    # Given instance of LeafListNode subclass.
+    user = User()
+
+    # When extend is called with invalid value.
+    with pytest.raises(TypeError) as exc:
+        user.extend(["John Doe", 1])
+
+    # Then exception has expected message.
+    assert (
+        str(exc.value)
+        == f"Expected argument of type {str} for value, got type {int}."
+    )
+
+    # Then no entries appended.
+    assert not user.entries
@@ -1,5 +1,9 @@
 """This module contains functional tests for nodes LeafNode."""
 
+import pickle
+
+import pytest
+
 from yapyang.nodes import LeafNode
 
 
@@ -11,6 +15,14 @@ class Name(LeafNode):
     value: str
 
 
+class Ratio(LeafNode):
+    """Represents a subclass of LeafNode with a float value."""
+
+    __identifier__: str = "ratio"
+
+    value: float
+
+
 def test_given_instance_of_leaf_node_subclass_when_to_xml_is_called_then_instance_xml_element_returned():
     """Test given instance of leaf node subclass when to xml is called then instance xml element returned."""
 
@@ -33,3 +45,87 @@ def test_given_instance_of_leaf_node_subclass_when_to_xml_is_called_with_attrs_t
 
     # Then instance XML element with attrs returned.
     assert xml == '<name nc:operation="delete">xe-0/0/0</name>'
+
+
+def test_given_instance_of_leaf_node_subclass_with_markup_value_when_iter_xml_is_called_then_escaped_xml_element_yielded():
+    """Test given instance of leaf node subclass with markup value when iter xml is called then escaped xml element yielded."""
+
+    # Given instance of LeafNode subclass with markup value.
+    name = Name("a&b<c>")
+
+    # When iter_xml is called.
+    xml = "".join(name.iter_xml())
+
+    # Then escaped XML element yielded.
+    assert xml == "<name>a&amp;b&lt;c&gt;</name>"
+
+
+def test_given_instances_of_leaf_node_subclass_with_equal_values_when_compared_and_hashed_then_equal():
+    """Test given instances of leaf node subclass with equal values when compared and hashed then equal."""
+
+    # Given instances of LeafNode subclass with equal values.
+    first, second = Name("xe-0/0/0"), Name("xe-0/0/0")
+
+    # When compared and hashed.
+
+    # Then equal.
+    assert first == second
+    assert hash(first) == hash(second)
+    assert len({first, second}) == 1
+
+    # Then not equal to instances with other values or classes.
+    class Description(LeafNode):
+        value: str
+
+    assert first != Name("xe-0/0/1")
+    assert first != Description("xe-0/0/0")
+
+
+def test_given_instance_of_leaf_node_subclass_when_value_is_set_then_exception_is_raised():
+    """Test given instance of leaf node subclass when value is set then exception is raised."""
+
+    # Given instance of LeafNode subclass.
+    name = Name("xe-0/0/0")
+
+    # When value is set.
+    with pytest.raises(AttributeError) as exc:
+        name.value = "xe-0/0/1"
+
+    # Then exception has expected message.
+    assert (
+        str(exc.value)
+        == "Name is immutable, assign a new instance to its parent."
+    )
+
+
+def test_given_instance_of_leaf_node_subclass_when_pickled_and_unpickled_then_equal_instance_returned():
+    """Test given instance of leaf node subclass when pickled and unpickled then equal instance returned."""
+
+    # Given instance of LeafNode subclass.
+    name = Name("xe-0/0/0")
+
+    # When pickled and unpickled.
+    restored = pickle.loads(pickle.dumps(name))
+
+    # Then equal instance returned.
+    assert restored == name
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+def test_given_instance_of_leaf_node_subclass_with_non_finite_float_value_when_to_json_is_called_then_exception_is_raised(
+    value: float,
+):
+    """Test given instance of leaf node subclass with non finite float value when to json is called then exception is raised."""
+
+    # Given instance of LeafNode subclass with non finite float value.
+    ratio = Ratio(value)
+
+    # When to_json is called.
+    with pytest.raises(ValueError) as exc:
+        ratio.to_json()
+
+    # Then exception has expected message.
+    assert str(exc.value) == (
+        f"Out of range float values are not JSON compliant: {value!r}"
+    )
+    assert Ratio(0.5).to_json() == "0.5"
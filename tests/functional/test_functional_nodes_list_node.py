@@ -1,5 +1,10 @@
 """This module contains functional tests for nodes ListNode."""
 
+import io
+import pickle
+
+import pytest
+
 from yapyang.nodes import ListNode, LeafNode
 from yapyang.utils import MetaInfo
 
@@ -12,6 +17,14 @@ class Name(LeafNode):
     value: str
 
 
+class Unit(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "unit"
+
+    value: int
+
+
 class Interface(ListNode):
     """Represents a subclass of ListNode."""
 
@@ -21,6 +34,63 @@ class Interface(ListNode):
     name: Name
 
 
+class SubInterface(ListNode):
+    """Represents a subclass of ListNode with composite key."""
+
+    __identifier__: str = "subinterface"
+    __key__: str = "name,unit"
+
+    name: Name
+    unit: Unit
+
+
+class Get(LeafNode):
+    """Represents a ListNode child node named as a ListNode method."""
+
+    __identifier__: str = "get"
+
+    value: str
+
+
+class Entries(LeafNode):
+    """Represents a ListNode child node named as a ListNode attribute."""
+
+    __identifier__: str = "entries"
+
+    value: str
+
+
+class Method(ListNode):
+    """Represents a subclass of ListNode whose args are named as ListNode
+    attributes."""
+
+    __identifier__: str = "method"
+    __key__: str = "get"
+
+    get: Get
+    entries: Entries
+
+
+def test_given_list_node_subclass_with_args_named_as_list_node_attributes_when_entries_are_used_then_list_node_attributes_not_shadowed():
+    """Test given list node subclass with args named as list node attributes when entries are used then list node attributes not shadowed."""
+
+    # Given ListNode subclass with args named as ListNode attributes.
+    instance = Method()
+
+    # When entries are used.
+    instance.append(Get("a"), Entries("b"))
+    instance.upsert(Get("c"), Entries("d"))
+
+    # Then ListNode attributes not shadowed.
+    assert instance.get("a").entries == Entries("b")
+    assert [entry.get for entry in instance.entries] == [Get("a"), Get("c")]
+    assert instance.to_xml() == (
+        "<method><get>a</get><entries>b</entries></method>"
+        "<method><get>c</get><entries>d</entries></method>"
+    )
+    assert instance.pop("c").entries == Entries("d")
+
+
 def test_given_instance_of_list_node_subclass_with_entries_when_to_xml_is_called_then_xml_tree_from_each_entry_xml_element_returned():
     """Test given instance of list node subclass with entries when to xml is called then xml tree from each entry xml element returned."""
 
@@ -98,3 +168,243 @@ def test_given_instance_of_list_node_subclass_with_child_nodes_given_child_nodes
 
     # Then XML tree from each entry XML element returned.
     assert xml == "<interface><name>xe-0/0/0</name></interface>"
+
+
+def test_given_instance_of_list_node_subclass_with_entries_when_write_xml_is_called_with_sink_then_xml_tree_from_each_entry_written_to_sink():
+    """Test given instance of list node subclass with entries when write xml is called with sink then xml tree from each entry written to sink."""
+
+    # Given instance of ListNode subclass with entries.
+    interface = Interface()
+    interface.append(Name("et-0/0/0"))
+    interface.append(Name("xe-0/0/1"))
+
+    # Given sink.
+    sink = io.StringIO()
+
+    # When write_xml is called with sink.
+    interface.write_xml(sink)
+
+    # Then XML tree from each entry written to sink.
+    assert (
+        sink.getvalue()
+        == "<interface><name>et-0/0/0</name></interface><interface><name>xe-0/0/1</name></interface>"
+    )
+
+
+def test_given_instance_of_list_node_subclass_with_entries_when_indexed_by_key_then_entry_returned():
+    """Test given instance of list node subclass with entries when indexed by key then entry returned."""
+
+    # Given instance of ListNode subclass with entries.
+    interface = Interface()
+    interface.append(Name("et-0/0/0"))
+    interface.append(xe := Name("xe-0/0/1"))
+
+    # When indexed by key.
+    entry = interface["xe-0/0/1"]
+
+    # Then entry returned.
+    assert entry.name is xe
+    assert "xe-0/0/1" in interface
+    assert interface.get("ge-0/0/2") is None
+    with pytest.raises(KeyError):
+        interface["ge-0/0/2"]
+
+
+def test_given_instance_of_list_node_subclass_with_composite_key_when_indexed_by_key_tuple_then_entry_returned():
+    """Test given instance of list node subclass with composite key when indexed by key tuple then entry returned."""
+
+    # Given instance of ListNode subclass with composite key entries.
+    subinterface = SubInterface()
+    subinterface.append(Name("xe-0/0/1"), Unit(0))
+    subinterface.append(Name("xe-0/0/1"), unit := Unit(1))
+
+    # When indexed by key tuple.
+    entry = subinterface[("xe-0/0/1", 1)]
+
+    # Then entry returned.
+    assert entry.unit is unit
+    assert ("xe-0/0/1", 0) in subinterface
+
+
+def test_given_instance_of_list_node_subclass_with_entry_when_append_is_called_with_same_key_then_entries_unchanged():
+    """Test given instance of list node subclass with entry when append is called with same key then entries unchanged."""
+
+    # Given instance of ListNode subclass with entry.
+    interface = Interface()
+    interface.append(first := Name("xe-0/0/1"))
+
+    # When append is called with same key.
+    interface.append(Name("xe-0/0/1"))
+
+    # Then entries unchanged.
+    (entry,) = interface.entries
+    assert entry.name is first
+
+
+def test_given_instance_of_list_node_subclass_with_entries_when_pop_is_called_with_key_then_entry_removed_and_returned():
+    """Test given instance of list node subclass with entries when pop is called with key then entry removed and returned."""
+
+    # Given instance of ListNode subclass with entries.
+    interface = Interface()
+    interface.append(Name("et-0/0/0"))
+    interface.append(xe := Name("xe-0/0/1"))
+
+    # When pop is called with key.
+    entry = interface.pop("xe-0/0/1")
+
+    # Then entry removed and returned.
+    assert entry.name is xe
+    assert "xe-0/0/1" not in interface
+    assert interface.pop("xe-0/0/1", None) is None
+    with pytest.raises(KeyError):
+        interface.pop("xe-0/0/1")
+
+
+def test_given_instance_of_list_node_subclass_with_entries_when_replace_is_called_then_entry_replaced_in_position():
+    """Test given instance of list node subclass with entries when replace is called then entry replaced in position."""
+
+    # Given instance of ListNode subclass with entries.
+    subinterface = SubInterface()
+    subinterface.append(Name("et-0/0/0"), Unit(0))
+    subinterface.append(Name("xe-0/0/1"), Unit(0))
+
+    # When replace is called.
+    subinterface.replace(name := Name("et-0/0/0"), Unit(0))
+
+    # Then entry replaced in position.
+    first, _ = subinterface.entries
+    assert first.name is name
+
+    # Then replace of missing key raises exception.
+    with pytest.raises(KeyError):
+        subinterface.replace(Name("ge-0/0/2"), Unit(0))
+
+
+def test_given_instance_of_list_node_subclass_with_entries_when_upsert_is_called_then_entry_replaced_or_appended():
+    """Test given instance of list node subclass with entries when upsert is called then entry replaced or appended."""
+
+    # Given instance of ListNode subclass with entries.
+    interface = Interface()
+    interface.append(Name("et-0/0/0"))
+
+    # When upsert is called with existing and missing keys.
+    interface.upsert(et := Name("et-0/0/0"))
+    interface.upsert(xe := Name("xe-0/0/1"))
+
+    # Then entry replaced or appended.
+    assert [entry.name for entry in interface.entries] == [et, xe]
+
+
+def test_given_entries_of_list_node_subclass_with_equal_keys_when_added_to_set_then_deduplicated():
+    """Test given entries of list node subclass with equal keys when added to set then deduplicated."""
+
+    # Given entries of ListNode subclass with equal keys.
+    first, second = SubInterface(), SubInterface()
+    first.append(Name("xe-0/0/1"), Unit(0))
+    second.append(Name("xe-0/0/1"), Unit(0))
+    second.append(Name("xe-0/0/1"), Unit(1))
+
+    # When added to set.
+    entries = {*first.entries, *second.entries}
+
+    # Then deduplicated.
+    assert len(entries) == 2
+
+
+def test_given_instance_of_list_node_subclass_with_entries_when_pickled_and_unpickled_then_entries_restored():
+    """Test given instance of list node subclass with entries when pickled and unpickled then entries restored."""
+
+    # Given instance of ListNode subclass with entries.
+    subinterface = SubInterface()
+    subinterface.append(Name("xe-0/0/1"), Unit(0))
+    subinterface.append(Name("xe-0/0/1"), Unit(1))
+
+    # When pickled and unpickled.
+    restored = pickle.loads(pickle.dumps(subinterface))
+
+    # Then entries restored.
+    assert restored.to_xml() == subinterface.to_xml()
+    assert ("xe-0/0/1", 1) in restored
+
+
+def test_given_instance_of_list_node_subclass_when_extend_is_called_with_tuple_and_dict_rows_then_entries_appended_in_order():
+    """Test given instance of list node subclass when extend is called with tuple and dict rows then entries appended in order."""
+
+    # Given instance of ListNode subclass.
+    subinterface = SubInterface()
+
+    # When extend is called with tuple and dict rows.
+    subinterface.extend(
+        [
+            (Name("xe-0/0/1"), Unit(0)),
+            ("xe-0/0/1", 1),
+            {"unit": 0, "name": "et-0/0/0"},
+        ]
+    )
+
+    # Then entries appended in order, leaf values initialize leaf nodes.
+    assert list(subinterface._entries) == [
+        ("xe-0/0/1", 0),
+        ("xe-0/0/1", 1),
+        ("et-0/0/0", 0),
+    ]
+    assert subinterface[("et-0/0/0", 0)].unit == Unit(0)
+
+
+def test_given_instance_of_list_node_subclass_when_extend_is_called_with_invalid_row_then_exception_is_raised_and_no_entries_appended():
+    """Test given instance of list node subclass when extend is called with invalid row then exception is raised and no entries appended."""
+
+    # Given instance of ListNode subclass.
+    subinterface = SubInterface()
+
+    # When extend is called with invalid row.
+    with pytest.raises(TypeError) as exc:
+        subinterface.extend([("xe-0/0/1", 0), ("xe-0/0/1", "1")])
+
+    # Then exception has expected message.
+    assert (
+        str(exc.value)
+        == f"Expected argument of type {int} for value, got type {str}."
+    )
+
+    # Then no entries appended.
+    assert not subinterface.entries
+
+
+def test_given_columns_when_from_columns_is_called_then_instance_of_list_node_subclass_with_entry_for_each_row_returned():
+    """Test given columns when from columns is called then instance of list node subclass with entry for each row returned."""
+
+    # Given columns.
+    columns = {"unit": [0, 1], "name": ["xe-0/0/1", "xe-0/0/1"]}
+
+    # When from_columns is called.
+    subinterface = SubInterface.from_columns(columns)
+
+    # Then instance of ListNode subclass with entry for each row returned.
+    assert isinstance(subinterface, SubInterface)
+    assert list(subinterface._entries) == [("xe-0/0/1", 0), ("xe-0/0/1", 1)]
+
+    # Then rows equal to from_rows.
+    assert (
+        subinterface.to_xml()
+        == SubInterface.from_rows([("xe-0/0/1", 0), ("xe-0/0/1", 1)]).to_xml()
+    )
+
+
+def test_given_snapshot_of_instance_of_list_node_subclass_when_entries_are_added_and_removed_then_snapshot_is_unchanged():
+    """Test given snapshot of instance of list node subclass when entries are added and removed then snapshot is unchanged."""
+
+    # Given snapshot of instance of ListNode subclass.
+    subinterface = SubInterface.from_rows((("xe-0/0/1", 0), ("xe-0/0/1", 1)))
+    snapshot = subinterface.snapshot()
+
+    # When entries are added and removed.
+    subinterface.pop(("xe-0/0/1", 0))
+    subinterface.append(Name("xe-0/0/2"), Unit(0))
+
+    # Then snapshot is unchanged.
+    assert list(snapshot._entries) == [("xe-0/0/1", 0), ("xe-0/0/1", 1)]
+    assert list(subinterface._entries) == [("xe-0/0/1", 1), ("xe-0/0/2", 0)]
+
+    # Then snapshot shares entries.
+    assert snapshot[("xe-0/0/1", 1)] is subinterface[("xe-0/0/1", 1)]
@@ -1,6 +1,21 @@
 """This module contains functional tests for nodes ModuleNode."""
 
-from yapyang.nodes import ContainerNode, ModuleNode
+import io
+import json
+import pickle
+import weakref
+
+import pytest
+
+from yapyang.nodes import (
+    ContainerNode,
+    LeafListNode,
+    LeafNode,
+    ListNode,
+    ModuleNode,
+)
+from yapyang.fields import compile_fields
+from yapyang.queries import CACHE_SIZE, compile_query
 from yapyang.utils import MetaInfo
 
 
@@ -19,6 +34,118 @@ class JunosEsConfInterfaces(ModuleNode):
     interfaces: JunosInterfaces = JunosInterfaces()
 
 
+class Name(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "name"
+
+    value: str
+
+
+class Mtu(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "mtu"
+
+    value: int
+
+
+class Enabled(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "enabled"
+
+    value: bool
+
+
+class Interface(ListNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "interface"
+    __key__: str = "name"
+    __cache__: bool = True
+
+    name: Name
+    mtu: Mtu
+    enabled: Enabled
+
+
+class User(LeafListNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "user"
+
+    value: str
+
+
+class HostName(LeafNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "host-name"
+
+    value: str
+
+
+class System(ContainerNode):
+    """Represents a ModuleNode child node."""
+
+    __identifier__: str = "system"
+
+    host_name: HostName
+    interface: Interface
+    user: User
+
+
+class OpenConfigSystem(ModuleNode):
+    """Represents a subclass of ModuleNode."""
+
+    __identifier__: str = "openconfig-system"
+    __namespace__: str = "http://openconfig.net/yang/system"
+
+    system: System
+
+
+class OpenConfigSystemWithHostName(ModuleNode):
+    """Represents a subclass of ModuleNode with a leaf child node."""
+
+    __identifier__: str = "openconfig-system"
+    __namespace__: str = "http://openconfig.net/yang/system"
+
+    host_name: HostName
+    system: System
+
+
+def test_given_instance_of_module_node_subclass_with_leaf_child_node_when_to_xml_is_called_then_leaf_element_with_namespace_returned():
+    """Test given instance of module node subclass with leaf child node when to xml is called then leaf element with namespace returned."""
+
+    # Given instance of ModuleNode subclass with leaf child node.
+    instance = OpenConfigSystemWithHostName(
+        HostName("r1&r2"), System(HostName("r1"), Interface(), User())
+    )
+
+    # When to_xml is called.
+    xml = instance.to_xml()
+
+    # Then leaf element with namespace returned.
+    assert xml == (
+        '<host-name xmlns="http://openconfig.net/yang/system">r1&amp;r2'
+        "</host-name>"
+        '<system xmlns="http://openconfig.net/yang/system">'
+        "<host-name>r1</host-name></system>"
+    )
+    assert instance.to_xml(attrs={"nc:operation": "merge"}).startswith(
+        '<host-name xmlns="http://openconfig.net/yang/system" '
+        'nc:operation="merge">r1&amp;r2</host-name>'
+    )
+    assert instance.to_xml(fields="host-name") == (
+        '<host-name xmlns="http://openconfig.net/yang/system">r1&amp;r2'
+        "</host-name>"
+    )
+    assert instance.to_json(fields="host-name") == (
+        '{"openconfig-system:host-name":"r1&r2"}'
+    )
+
+
 def test_given_instance_of_module_node_subclass_with_child_nodes_when_to_xml_is_called_then_xml_tree_from_instance_returned():
     """Test given instance of module node subclass with child nodes when to xml is called then xml tree from instance returned."""
 
@@ -74,3 +201,961 @@ def test_given_instance_of_module_node_subclass_with_child_nodes_given_child_nod
         xml
         == '<interfaces xmlns="http://yang.juniper.net/junos-es/conf/interfaces"></interfaces>'
     )
+
+
+def test_given_instance_of_module_node_subclass_with_child_nodes_when_write_xml_is_called_with_sink_then_xml_tree_from_instance_written_to_sink():
+    """Test given instance of module node subclass with child nodes when write xml is called with sink then xml tree from instance written to sink."""
+
+    # Given instance of ModuleNode subclass with child nodes.
+    module = JunosEsConfInterfaces()
+
+    # Given sink.
+    sink = io.StringIO()
+
+    # When write_xml is called with sink.
+    module.write_xml(sink)
+
+    # Then XML tree from instance written to sink.
+    assert sink.getvalue() == module.to_xml()
+
+
+def test_given_instance_of_module_node_subclass_with_child_nodes_when_iter_xml_is_called_then_xml_chunks_yielded_depth_first():
+    """Test given instance of module node subclass with child nodes when iter xml is called then xml chunks yielded depth first."""
+
+    # Given instance of ModuleNode subclass with child nodes.
+    module = JunosEsConfInterfaces()
+
+    # When iter_xml is called.
+    chunks = list(module.iter_xml())
+
+    # Then XML chunks yielded depth first.
+    assert chunks == [
+        '<interfaces xmlns="http://yang.juniper.net/junos-es/conf/interfaces">',
+        "</interfaces>",
+    ]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_given_xml_of_instance_of_module_node_subclass_when_from_xml_is_called_then_instance_with_same_xml_returned(
+    lazy,
+):
+    """Test given xml of instance of module node subclass when from xml is called then instance with same xml returned."""
+
+    # Given XML of instance of ModuleNode subclass.
+    interface = Interface()
+    interface.append(Name("xe-0/0/0"), Mtu(1500), Enabled(True))
+    interface.append(Name("xe-0/0/1"), Mtu(9000), Enabled(False))
+    user = User.from_rows(("John Doe", "Jane Doe"))
+    module = OpenConfigSystem(System(HostName("r1"), interface, user))
+    xml = module.to_xml()
+
+    # When from_xml is called.
+    parsed = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=lazy)
+
+    # Then instance with same XML returned.
+    assert parsed.to_xml() == xml
+    assert parsed.system.interface["xe-0/0/1"].mtu == Mtu(9000)
+    assert parsed.system.interface["xe-0/0/1"].enabled == Enabled(False)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_given_xml_of_instance_of_module_node_subclass_with_markup_and_bool_leaves_when_from_xml_is_called_then_instance_with_same_xml_returned(
+    lazy,
+):
+    """Test given xml of instance of module node subclass with markup and bool leaves when from xml is called then instance with same xml returned."""
+
+    # Given XML of instance of ModuleNode subclass with markup and bool
+    # leaves.
+    interface = Interface()
+    interface.append(Name("a&b<c"), Mtu(1500), Enabled(True))
+    user = User.from_rows(("R&D", "<admin>"))
+    module = OpenConfigSystem(System(HostName("r1 & r2"), interface, user))
+    xml = module.to_xml()
+    assert (
+        xml == '<system xmlns="http://openconfig.net/yang/system">'
+        "<host-name>r1 &amp; r2</host-name>"
+        "<interface><name>a&amp;b&lt;c</name><mtu>1500</mtu>"
+        "<enabled>true</enabled></interface>"
+        "<user>R&amp;D</user><user>&lt;admin&gt;</user></system>"
+    )
+
+    # When from_xml is called.
+    parsed = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=lazy)
+
+    # Then instance with same XML returned.
+    assert parsed.to_xml() == xml
+    assert parsed.system.host_name == HostName("r1 & r2")
+    assert parsed.system.interface["a&b<c"].enabled == Enabled(True)
+    assert list(parsed.system.user.entries) == ["R&D", "<admin>"]
+
+    # Then XML of eager and lazy instances is equal once changed.
+    parsed.system.host_name = HostName("r3 < r4")
+    assert parsed.to_xml() == xml.replace("r1 &amp; r2", "r3 &lt; r4")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_given_netconf_rpc_reply_with_unknown_elements_when_from_xml_is_called_then_instance_from_known_elements_returned(
+    lazy,
+):
+    """Test given netconf rpc reply with unknown elements when from xml is called then instance from known elements returned."""
+
+    # Given NETCONF rpc-reply with unknown elements.
+    xml = (
+        '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+        "<data>"
+        '<system xmlns="http://openconfig.net/yang/system">'
+        "<host-name>r1</host-name>"
+        "<clock><timezone-name>UTC</timezone-name></clock>"
+        "<interface><name>xe-0/0/0</name><mtu>1500</mtu>"
+        "<enabled>true</enabled><description>uplink</description>"
+        "</interface>"
+        "</system>"
+        "</data>"
+        "</rpc-reply>"
+    )
+
+    # When from_xml is called.
+    module = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=lazy)
+
+    # Then instance from known elements returned.
+    assert module.system.host_name == HostName("r1")
+    assert not module.system.user.entries
+    (entry,) = module.system.interface.entries
+    assert (entry.name, entry.mtu, entry.enabled) == (
+        Name("xe-0/0/0"),
+        Mtu(1500),
+        Enabled(True),
+    )
+
+
+def test_given_instance_of_module_node_subclass_with_child_nodes_when_to_json_is_called_then_rfc_7951_json_from_instance_returned():
+    """Test given instance of module node subclass with child nodes when to json is called then rfc 7951 json from instance returned."""
+
+    # Given instance of ModuleNode subclass with child nodes.
+    interface = Interface()
+    interface.append(Name("xe-0/0/0"), Mtu(1500), Enabled(True))
+    interface.append(Name('xe-"1"'), Mtu(9000), Enabled(False))
+    user = User.from_rows(("John Doe", "Jane Doe"))
+    module = OpenConfigSystem(System(HostName("r1"), interface, user))
+
+    # When to_json is called.
+    text = module.to_json()
+
+    # Then RFC 7951 JSON from instance returned.
+    assert json.loads(text) == {
+        "openconfig-system:system": {
+            "host-name": "r1",
+            "interface": [
+                {"name": "xe-0/0/0", "mtu": 1500, "enabled": True},
+                {"name": 'xe-"1"', "mtu": 9000, "enabled": False},
+            ],
+            "user": ["John Doe", "Jane Doe"],
+        }
+    }
+
+
+def test_given_instance_of_module_node_subclass_with_empty_list_nodes_when_write_json_is_called_with_sink_then_json_without_empty_lists_written_to_sink():
+    """Test given instance of module node subclass with empty list nodes when write json is called with sink then json without empty lists written to sink."""
+
+    # Given instance of ModuleNode subclass with empty list nodes.
+    module = OpenConfigSystem(System(HostName("r1"), Interface(), User()))
+
+    # Given sink.
+    sink = io.StringIO()
+
+    # When write_json is called with sink.
+    module.write_json(sink)
+
+    # Then JSON without empty lists written to sink.
+    assert sink.getvalue() == '{"openconfig-system:system":{"host-name":"r1"}}'
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_given_json_of_instance_of_module_node_subclass_when_from_json_is_called_then_instance_with_same_json_returned(
+    lazy,
+):
+    """Test given json of instance of module node subclass when from json is called then instance with same json returned."""
+
+    # Given JSON of instance of ModuleNode subclass.
+    interface = Interface()
+    interface.append(Name("xe-0/0/0"), Mtu(1500), Enabled(True))
+    interface.append(Name('xe-"1"'), Mtu(9000), Enabled(False))
+    user = User.from_rows(("John Doe", "Jane Doe"))
+    module = OpenConfigSystem(System(HostName("r1"), interface, user))
+    text = module.to_json()
+
+    # When from_json is called.
+    parsed = OpenConfigSystem.from_json(io.StringIO(text), lazy=lazy)
+
+    # Then instance with same JSON returned.
+    assert parsed.to_json() == text
+    assert parsed.system.interface['xe-"1"'].mtu == Mtu(9000)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_given_restconf_reply_with_unknown_members_when_from_json_is_called_then_instance_from_known_members_returned(
+    lazy,
+):
+    """Test given restconf reply with unknown members when from json is called then instance from known members returned."""
+
+    # Given RESTCONF reply with unknown members.
+    text = json.dumps(
+        {
+            "ietf-restconf:data": {
+                "openconfig-system:system": {
+                    "host-name": "r1",
+                    "clock": {"timezone-name": "UTC"},
+                    "interface": [
+                        {
+                            "name": "xe-0/0/0",
+                            "mtu": "1500",
+                            "enabled": True,
+                            "description": ["uplink", {"a": [1]}],
+                        }
+                    ],
+                },
+                "other-module:system": {"host-name": "r2"},
+            }
+        }
+    )
+
+    # When from_json is called.
+    module = OpenConfigSystem.from_json(io.BytesIO(text.encode()), lazy=lazy)
+
+    # Then instance from known members returned.
+    assert module.system.host_name == HostName("r1")
+    assert not module.system.user.entries
+    (entry,) = module.system.interface.entries
+    assert (entry.name, entry.mtu, entry.enabled) == (
+        Name("xe-0/0/0"),
+        Mtu(1500),
+        Enabled(True),
+    )
+
+
+def test_given_netconf_rpc_reply_when_from_xml_is_called_with_lazy_then_untouched_children_serialized_verbatim():
+    """Test given netconf rpc reply when from xml is called with lazy then untouched children serialized verbatim."""
+
+    # Given NETCONF rpc-reply.
+    system = (
+        '<system xmlns="http://openconfig.net/yang/system">'
+        "<host-name>r1</host-name><!-- uplinks -->"
+        "<interface><name>xe-0/0/0</name><mtu>01500</mtu>"
+        "<enabled>true</enabled><description>uplink</description>"
+        "</interface>"
+        "</system>"
+    )
+    xml = (
+        '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+        f"<data>{system}</data>"
+        "</rpc-reply>"
+    )
+
+    # When from_xml is called with lazy.
+    module = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=True)
+
+    # Then untouched children serialized verbatim.
+    assert module.to_xml() == system
+    assert isinstance(module.system, System)
+    assert module.system.interface["xe-0/0/0"].mtu == Mtu(1500)
+
+
+def test_given_lazily_parsed_instance_of_module_node_subclass_when_pickled_then_equal_instance_returned():
+    """Test given lazily parsed instance of module node subclass when pickled then equal instance returned."""
+
+    # Given lazily parsed instance of ModuleNode subclass.
+    xml = (
+        '<system xmlns="http://openconfig.net/yang/system">'
+        "<host-name>r1</host-name>"
+        "<interface><name>xe-0/0/0</name><mtu>1500</mtu>"
+        "<enabled>true</enabled></interface>"
+        "</system>"
+    )
+    module = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=True)
+
+    # When pickled.
+    restored = pickle.loads(pickle.dumps(module))
+
+    # Then equal instance returned.
+    assert type(restored.system) is System
+    assert restored.to_xml() == xml
+
+
+def test_given_restconf_reply_when_from_json_is_called_with_lazy_then_untouched_children_serialized_verbatim():
+    """Test given restconf reply when from json is called with lazy then untouched children serialized verbatim."""
+
+    # Given RESTCONF reply.
+    system = json.dumps({"host-name": "r1", "clock": {}}, indent=2)
+    text = (
+        f'{{"ietf-restconf:data": {{"openconfig-system:system": {system}}}}}'
+    )
+
+    # When from_json is called with lazy.
+    module = OpenConfigSystem.from_json(io.StringIO(text), lazy=True)
+
+    # Then untouched children serialized verbatim.
+    assert module.to_json() == f'{{"openconfig-system:system":{system}}}'
+    assert module.system.host_name == HostName("r1")
+    assert (
+        module.to_json() == '{"openconfig-system:system":{"host-name":"r1"}}'
+    )
+
+
+@pytest.mark.parametrize("format", ["xml", "json"])
+def test_given_lazily_parsed_instance_of_module_node_subclass_when_nodes_are_changed_then_serialization_equals_eagerly_parsed_instance(
+    format,
+):
+    """Test given lazily parsed instance of module node subclass when nodes are changed then serialization equals eagerly parsed instance."""
+
+    # Given lazily parsed instance of ModuleNode subclass.
+    interface = Interface()
+    interface.append(Name("xe-0/0/0"), Mtu(1500), Enabled(True))
+    user = User.from_rows(("John Doe",))
+    module = OpenConfigSystem(System(HostName("r1"), interface, user))
+    parse = getattr(OpenConfigSystem, f"from_{format}")
+    text = getattr(module, f"to_{format}")()
+    lazy, eager = parse(io.StringIO(text), lazy=True), parse(io.StringIO(text))
+
+    # When nodes are changed.
+    for parsed in (lazy, eager):
+        parsed.system.interface.append(
+            Name("xe-0/0/1"), Mtu(9000), Enabled(False)
+        )
+        parsed.system.user.append("Jane Doe")
+
+    # Then serialization equals eagerly parsed instance.
+    assert lazy.to_xml() == eager.to_xml()
+    assert lazy.to_json() == eager.to_json()
+    assert not lazy.diff(eager)
+
+
+@pytest.mark.parametrize(
+    "markup",
+    [
+        "<name><![CDATA[xe-0/0/0</interface></system>]]></name>",
+        "<!-- <system><interface> --><name>xe-0/0/0</name>",
+        "<?pi </interface> ?><name>xe-0/0/0</name>",
+    ],
+)
+def test_given_xml_with_tags_in_comments_cdata_and_processing_instructions_when_from_xml_is_called_with_lazy_then_instance_equals_eagerly_parsed_instance(
+    markup,
+):
+    """Test given xml with tags in comments cdata and processing instructions when from xml is called with lazy then instance equals eagerly parsed instance."""
+
+    # Given XML with tags in comments, CDATA and processing instructions.
+    xml = (
+        '<system xmlns="http://openconfig.net/yang/system">'
+        "<host-name>r1</host-name>"
+        f"<interface>{markup}<mtu>1500</mtu><enabled>true</enabled>"
+        "</interface>"
+        "<interface><name>xe-0/0/1</name><mtu>9000</mtu>"
+        "<enabled>false</enabled></interface>"
+        "</system>"
+    )
+
+    # When from_xml is called with lazy.
+    lazy = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=True)
+
+    # Then instance equals eagerly parsed instance.
+    eager = OpenConfigSystem.from_xml(io.StringIO(xml))
+    assert len(eager.system.interface.entries) == 2
+    assert lazy.to_json() == eager.to_json()
+    assert not lazy.diff(eager)
+
+
+def test_given_running_and_intended_instances_of_module_node_subclass_when_to_edit_config_is_called_then_edit_config_of_changes_returned():
+    """Test given running and intended instances of module node subclass when to edit config is called then edit config of changes returned."""
+
+    # Given running instance of ModuleNode subclass.
+    interface = Interface.from_rows(
+        (("xe-0/0/0", 1500, True), ("xe-0/0/1", 1500, True))
+    )
+    user = User.from_rows(("John Doe", "Jane Doe"))
+    running = OpenConfigSystem(System(HostName("r1"), interface, user))
+
+    # Given intended instance of ModuleNode subclass.
+    interface = Interface.from_rows(
+        (("xe-0/0/0", 9000, True), ("xe-0/0/2", 1500, False))
+    )
+    user = User.from_rows(("John Doe", "Joe Bloggs"))
+    intended = OpenConfigSystem(System(HostName("r1"), interface, user))
+
+    # When to_edit_config is called.
+    xml = intended.to_edit_config(running)
+
+    # Then edit config of changes returned.
+    assert xml == (
+        '<edit-config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" '
+        'xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+        "<target><running/></target><config>"
+        '<system xmlns="http://openconfig.net/yang/system">'
+        '<interface nc:operation="delete"><name>xe-0/0/1</name></interface>'
+        "<interface><name>xe-0/0/0</name>"
+        '<mtu nc:operation="replace">9000</mtu></interface>'
+        '<interface nc:operation="merge"><name>xe-0/0/2</name>'
+        "<mtu>1500</mtu><enabled>false</enabled></interface>"
+        '<user nc:operation="delete">Jane Doe</user>'
+        '<user nc:operation="merge">Joe Bloggs</user>'
+        "</system>"
+        "</config></edit-config>"
+    )
+
+
+def test_given_equal_instances_of_module_node_subclass_when_diff_is_called_then_no_changes_returned():
+    """Test given equal instances of module node subclass when diff is called then no changes returned."""
+
+    # Given equal instances of ModuleNode subclass.
+    running, intended = (
+        OpenConfigSystem(
+            System(
+                HostName("r1"),
+                Interface.from_rows((("xe-0/0/0", 1500, True),)),
+                User.from_rows(("John Doe",)),
+            )
+        )
+        for _ in range(2)
+    )
+
+    # When diff is called.
+    changes = intended.diff(running)
+
+    # Then no changes returned.
+    assert changes == []
+
+
+def test_given_instances_of_different_module_node_subclasses_when_diff_is_called_then_exception_is_raised():
+    """Test given instances of different module node subclasses when diff is called then exception is raised."""
+
+    # Given instances of different ModuleNode subclasses.
+    running = JunosEsConfInterfaces()
+    intended = OpenConfigSystem(System(HostName("r1"), Interface(), User()))
+
+    # When diff is called.
+    with pytest.raises(TypeError) as exc:
+        intended.diff(running)
+
+    # Then exception has expected message.
+    assert (
+        str(exc.value)
+        == f"Expected instances of the same class, got {JunosEsConfInterfaces} and {OpenConfigSystem}."
+    )
+
+
+def test_given_serialized_instance_of_module_node_subclass_when_nodes_are_changed_then_serialization_contains_changes():
+    """Test given serialized instance of module node subclass when nodes are changed then serialization contains changes."""
+
+    # Given serialized instance of ModuleNode subclass.
+    interface = Interface.from_rows(
+        (("xe-0/0/0", 1500, True), ("xe-0/0/1", 1500, True))
+    )
+    module = OpenConfigSystem(System(HostName("r1"), interface, User()))
+    module.to_xml(), module.to_json()
+    untouched = interface["xe-0/0/1"]._xml
+
+    # When nodes are changed.
+    interface["xe-0/0/0"].mtu = Mtu(9000)
+    interface.append(Name("xe-0/0/2"), Mtu(1500), Enabled(False))
+    module.system.user.append("John Doe")
+    module.system.host_name = HostName("r2")
+
+    # Then serialization contains changes.
+    expected = OpenConfigSystem(
+        System(
+            HostName("r2"),
+            Interface.from_rows(
+                (
+                    ("xe-0/0/0", 9000, True),
+                    ("xe-0/0/1", 1500, True),
+                    ("xe-0/0/2", 1500, False),
+                )
+            ),
+            User.from_rows(("John Doe",)),
+        )
+    )
+    assert module.to_xml() == expected.to_xml()
+    assert module.to_json() == expected.to_json()
+
+    # Then fragments of unchanged entries are reused.
+    assert interface["xe-0/0/1"]._xml is untouched
+
+
+def test_given_serialized_list_entries_with_default_container_when_default_container_of_one_entry_is_changed_then_serialization_contains_change():
+    """Test given serialized list entries with default container when default container of one entry is changed then serialization contains change."""
+
+    # Given serialized list entries with default container.
+    class Description(LeafNode):
+        __identifier__ = "description"
+
+        value: str
+
+    class Config(ContainerNode):
+        __identifier__ = "config"
+
+        description: Description = Description("default")
+
+    class Port(ListNode):
+        __identifier__ = "port"
+        __key__ = "name"
+        __cache__ = True
+
+        name: Name
+        config: Config = Config()
+
+    port = Port.from_rows((("xe-0/0/0",), ("xe-0/0/1",)))
+    port.to_xml(), port.to_json()
+
+    # When default container of one entry is changed.
+    port["xe-0/0/0"].config.description = Description("changed")
+
+    # Then serialization contains change.
+    assert port.to_xml() == (
+        "<port><name>xe-0/0/0</name>"
+        "<config><description>changed</description></config></port>"
+        "<port><name>xe-0/0/1</name>"
+        "<config><description>default</description></config></port>"
+    )
+    assert port.to_json() == (
+        '[{"name":"xe-0/0/0","config":{"description":"changed"}},'
+        '{"name":"xe-0/0/1","config":{"description":"default"}}]'
+    )
+
+    # Then class default is unchanged.
+    assert Port.__meta__["__defaults__"]["config"].description == Description(
+        "default"
+    )
+
+
+def test_given_serialized_instance_of_module_node_subclass_when_nested_container_is_replaced_then_serialization_contains_replacement():
+    """Test given serialized instance of module node subclass when nested container is replaced then serialization contains replacement."""
+
+    # Given serialized instance of ModuleNode subclass.
+    module = OpenConfigSystem(System(HostName("r1"), Interface(), User()))
+    module.to_xml()
+
+    # When nested container is replaced.
+    module.system = System(HostName("r2"), Interface(), User())
+
+    # Then serialization contains replacement.
+    assert "<host-name>r2</host-name>" in module.to_xml()
+
+
+def test_given_snapshot_of_instance_of_module_node_subclass_when_instance_is_changed_then_snapshot_is_unchanged():
+    """Test given snapshot of instance of module node subclass when instance is changed then snapshot is unchanged."""
+
+    # Given snapshot of instance of ModuleNode subclass.
+    interface = Interface.from_rows(
+        (("xe-0/0/0", 1500, True), ("xe-0/0/1", 1500, True))
+    )
+    module = OpenConfigSystem(
+        System(HostName("r1"), interface, User.from_rows(("John Doe",)))
+    )
+    xml = module.to_xml()
+    snapshot = module.snapshot()
+
+    # When instance is changed.
+    entry = interface["xe-0/0/0"]
+    entry.mtu = Mtu(9000)
+    entry.enabled = Enabled(False)
+    interface.pop("xe-0/0/1")
+    module.system.user.append("Jane Doe")
+    module.system.host_name = HostName("r2")
+
+    # Then snapshot is unchanged.
+    assert snapshot.to_xml() == xml
+
+    # Then references to changed nodes remain valid.
+    assert interface["xe-0/0/0"] is entry
+    assert entry.mtu == Mtu(9000)
+    assert module.system.interface is interface
+
+    # Then snapshot shares unchanged nodes.
+    assert module.snapshot().system.user is module.system.user
+    assert [change.operation for change in module.diff(snapshot)] == [
+        "replace",
+        "delete",
+        "replace",
+        "replace",
+        "merge",
+    ]
+
+
+def test_given_dropped_snapshots_of_instance_of_module_node_subclass_when_instance_is_changed_then_snapshots_are_collected():
+    """Test given dropped snapshots of instance of module node subclass when instance is changed then snapshots are collected."""
+
+    # Given dropped snapshots of instance of ModuleNode subclass.
+    interface = Interface.from_rows((("xe-0/0/0", 1500, True),))
+    module = OpenConfigSystem(System(HostName("r1"), interface, User()))
+    snapshots = [weakref.ref(module.snapshot()) for _ in range(100)]
+    kept = module.snapshot()
+
+    # When instance is changed.
+    interface["xe-0/0/0"].mtu = Mtu(9000)
+    module.system.host_name = HostName("r2")
+
+    # Then snapshots are collected.
+    assert all(snapshot() is None for snapshot in snapshots)
+    assert kept.system.host_name == HostName("r1")
+    assert kept.system.interface["xe-0/0/0"].mtu == Mtu(1500)
+
+    # Then frozen parents of live nodes are only those still referenced.
+    del kept
+    module.system.host_name = HostName("r3")
+    assert module.system._parent is module
+
+
+@pytest.mark.parametrize(
+    "change",
+    (
+        lambda snapshot: setattr(snapshot, "system", None),
+        lambda snapshot: setattr(snapshot.system, "host_name", HostName("r2")),
+        lambda snapshot: snapshot.system.user.append("Jane Doe"),
+        lambda snapshot: snapshot.system.interface.pop("xe-0/0/0"),
+    ),
+)
+def test_given_snapshot_of_instance_of_module_node_subclass_when_snapshot_is_changed_then_exception_is_raised(
+    change,
+):
+    """Test given snapshot of instance of module node subclass when snapshot is changed then exception is raised."""
+
+    # Given snapshot of instance of ModuleNode subclass.
+    module = OpenConfigSystem(
+        System(
+            HostName("r1"),
+            Interface.from_rows((("xe-0/0/0", 1500, True),)),
+            User(),
+        )
+    )
+    snapshot = module.snapshot()
+    module.system.host_name = HostName("r2")
+    module.system.user.append("John Doe")
+    module.system.interface.pop("xe-0/0/0")
+
+    # When snapshot is changed.
+    with pytest.raises(TypeError) as error:
+        change(snapshot)
+
+    # Then exception is raised.
+    assert "belongs to a snapshot and is immutable" in str(error.value)
+
+
+def system_with_interfaces():
+    """Returns instance of OpenConfigSystem with interfaces and users."""
+
+    return OpenConfigSystem(
+        System(
+            HostName("r1"),
+            Interface.from_rows(
+                (
+                    ("xe-0/0/0", 1500, True),
+                    ("xe-0/0/1", 9000, False),
+                    ("xe-0/0/2", 1500, False),
+                )
+            ),
+            User.from_rows(("John Doe", "Jane Doe")),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/system/host-name", [HostName("r1")]),
+        ("/oc-sys:system/oc-sys:host-name", [HostName("r1")]),
+        ("/system/interface[name='xe-0/0/1']/mtu", [Mtu(9000)]),
+        ('/system/interface[ name = "xe-0/0/1" ]/mtu', [Mtu(9000)]),
+        ("/system/interface[name='xe-0/0/9']/mtu", []),
+        (
+            "/system/interface[mtu='1500']/name",
+            [Name("xe-0/0/0"), Name("xe-0/0/2")],
+        ),
+        (
+            "/system/interface[mtu='1500'][enabled='false']/name",
+            [Name("xe-0/0/2")],
+        ),
+        ("/system/interface[2]/name", [Name("xe-0/0/1")]),
+        ("/system/user", ["John Doe", "Jane Doe"]),
+        ("/system/user[.='Jane Doe']", ["Jane Doe"]),
+        ("/system/user[3]", []),
+    ],
+)
+def test_given_instance_of_module_node_subclass_when_select_is_called_then_nodes_selected_by_path_returned(
+    path, expected
+):
+    """Test given instance of module node subclass when select is called then nodes selected by path returned."""
+
+    # Given instance of ModuleNode subclass.
+    instance = system_with_interfaces()
+
+    # When select is called.
+    nodes = instance.select(path)
+
+    # Then nodes selected by path returned.
+    assert nodes == expected
+
+
+def test_given_instance_of_module_node_subclass_when_select_is_called_with_list_key_then_entry_looked_up_by_key():
+    """Test given instance of module node subclass when select is called with list key then entry looked up by key."""
+
+    # Given instance of ModuleNode subclass.
+    instance = system_with_interfaces()
+    interfaces = instance.system.interface
+
+    # When select is called with list key.
+    (entry,) = instance.select("/system/interface[name='xe-0/0/2']")
+
+    # Then entry looked up by key, once compiled for every instance.
+    query = compile_query(
+        OpenConfigSystem, "/system/interface[name='xe-0/0/2']"
+    )
+    assert entry is interfaces["xe-0/0/2"]
+    assert query.steps[-1][2] == "xe-0/0/2"
+    assert query is compile_query(
+        OpenConfigSystem, "/system/interface[name='xe-0/0/2']"
+    )
+    assert (
+        OpenConfigSystem(System(HostName("r2"), Interface(), User())).select(
+            "/system/interface[name='xe-0/0/2']"
+        )
+        == []
+    )
+
+
+def test_given_queries_of_paths_with_distinct_literals_when_compiled_then_least_recently_used_evicted():
+    """Test given queries of paths with distinct literals when compiled then least recently used evicted."""
+
+    # Given queries of paths with distinct literals.
+    compile_query.cache_clear()
+    paths = [
+        f"/system/interface[name='xe-0/0/{index}']"
+        for index in range(CACHE_SIZE + 1)
+    ]
+    first = compile_query(OpenConfigSystem, paths[0])
+
+    # When compiled.
+    for path in paths[1:]:
+        compile_query(OpenConfigSystem, path)
+
+    # Then least recently used evicted.
+    assert compile_query.cache_info().currsize == CACHE_SIZE
+    assert compile_query(OpenConfigSystem, paths[-1]).path == paths[-1]
+    assert compile_query(OpenConfigSystem, paths[0]) is not first
+
+
+def test_given_fields_of_distinct_expressions_when_compiled_then_least_recently_used_evicted():
+    """Test given fields of distinct expressions when compiled then least recently used evicted."""
+
+    # Given fields of distinct expressions.
+    compile_fields.cache_clear()
+    size = compile_fields.cache_info().maxsize
+    expressions = [
+        f"{' ' * index}system/host-name" for index in range(size + 1)
+    ]
+    first = compile_fields(OpenConfigSystem, expressions[0])
+
+    # When compiled.
+    for expression in expressions[1:]:
+        compile_fields(OpenConfigSystem, expression)
+
+    # Then least recently used evicted.
+    assert compile_fields.cache_info().currsize == size
+    assert compile_fields(OpenConfigSystem, expressions[0]) is not first
+
+
+@pytest.mark.parametrize(
+    "path, message",
+    [
+        ("system", "Invalid path system."),
+        ("/system/unknown", "Unknown node unknown in /system/unknown."),
+        (
+            "/system/host-name/value",
+            "Unknown node value in /system/host-name/value, leaf nodes have no children.",
+        ),
+        (
+            "/system/interface[unknown='x']",
+            "Unknown leaf unknown in predicate of /system/interface[unknown='x'].",
+        ),
+        (
+            "/system/interface[mtu='x']",
+            "Invalid value 'x' of mtu in /system/interface[mtu='x'].",
+        ),
+        (
+            "/system[host-name='r1']",
+            "Invalid predicate [host-name='r1'] of container in /system[host-name='r1'].",
+        ),
+        (
+            "/system/interface[name=x]",
+            "Invalid predicate in /system/interface[name=x].",
+        ),
+        (
+            "/system/user[0]",
+            "Invalid position 0 in /system/user[0], positions start at 1.",
+        ),
+    ],
+)
+def test_given_invalid_path_when_select_is_called_then_value_error_raised(
+    path, message
+):
+    """Test given invalid path when select is called then value error raised."""
+
+    # Given invalid path.
+    instance = system_with_interfaces()
+
+    # When select is called.
+    with pytest.raises(ValueError) as exc:
+        instance.select(path)
+
+    # Then ValueError raised.
+    assert str(exc.value) == message
+
+
+def test_given_lazily_parsed_instance_of_module_node_subclass_when_select_is_called_then_nodes_selected_by_path_returned():
+    """Test given lazily parsed instance of module node subclass when select is called then nodes selected by path returned."""
+
+    # Given lazily parsed instance of ModuleNode subclass.
+    xml = system_with_interfaces().to_xml()
+    instance = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=True)
+
+    # When select is called.
+    nodes = instance.select("/system/interface[name='xe-0/0/1']/enabled")
+
+    # Then nodes selected by path returned.
+    assert nodes == [Enabled(False)]
+
+
+@pytest.mark.parametrize(
+    "fields, xml, json_text",
+    [
+        (
+            "system/host-name",
+            "<system><host-name>r1</host-name></system>",
+            '{"system":{"host-name":"r1"}}',
+        ),
+        (
+            "oc-sys:system(oc-sys:user)",
+            "<system><user>John Doe</user><user>Jane Doe</user></system>",
+            '{"system":{"user":["John Doe","Jane Doe"]}}',
+        ),
+        (
+            "system(user;interface/enabled);system/interface(mtu)",
+            "<system><interface><name>xe-0/0/0</name><mtu>1500</mtu>"
+            "<enabled>true</enabled></interface>"
+            "<interface><name>xe-0/0/1</name><mtu>9000</mtu>"
+            "<enabled>false</enabled></interface>"
+            "<interface><name>xe-0/0/2</name><mtu>1500</mtu>"
+            "<enabled>false</enabled></interface>"
+            "<user>John Doe</user><user>Jane Doe</user></system>",
+            '{"system":{"interface":['
+            '{"name":"xe-0/0/0","mtu":1500,"enabled":true},'
+            '{"name":"xe-0/0/1","mtu":9000,"enabled":false},'
+            '{"name":"xe-0/0/2","mtu":1500,"enabled":false}],'
+            '"user":["John Doe","Jane Doe"]}}',
+        ),
+        (
+            "system/interface(name);system/interface",
+            "<system><interface><name>xe-0/0/0</name><mtu>1500</mtu>"
+            "<enabled>true</enabled></interface>"
+            "<interface><name>xe-0/0/1</name><mtu>9000</mtu>"
+            "<enabled>false</enabled></interface>"
+            "<interface><name>xe-0/0/2</name><mtu>1500</mtu>"
+            "<enabled>false</enabled></interface></system>",
+            '{"system":{"interface":['
+            '{"name":"xe-0/0/0","mtu":1500,"enabled":true},'
+            '{"name":"xe-0/0/1","mtu":9000,"enabled":false},'
+            '{"name":"xe-0/0/2","mtu":1500,"enabled":false}]}}',
+        ),
+    ],
+)
+def test_given_instance_of_module_node_subclass_when_to_xml_and_to_json_are_called_with_fields_then_selected_descendants_returned(
+    fields, xml, json_text
+):
+    """Test given instance of module node subclass when to xml and to json are called with fields then selected descendants returned."""
+
+    # Given instance of ModuleNode subclass.
+    instance = system_with_interfaces()
+    complete = instance.to_xml()
+
+    # When to_xml and to_json are called with fields.
+    selected_xml = instance.to_xml(fields=fields)
+    selected_json = instance.to_json(fields=fields)
+
+    # Then selected descendants returned, list entries with their keys.
+    namespace = 'xmlns="http://openconfig.net/yang/system"'
+    assert selected_xml == xml.replace("<system>", f"<system {namespace}>", 1)
+    assert selected_json == json_text.replace(
+        '"system"', '"openconfig-system:system"', 1
+    )
+    assert instance.to_xml() == complete
+
+
+def test_given_instance_of_container_node_subclass_when_write_xml_is_called_with_fields_and_attrs_then_selected_descendants_written():
+    """Test given instance of container node subclass when write xml is called with fields and attrs then selected descendants written."""
+
+    # Given instance of ContainerNode subclass.
+    system = system_with_interfaces().system
+    sink = io.StringIO()
+
+    # When write_xml is called with fields and attrs.
+    system.write_xml(
+        sink, attrs=dict(operation="merge"), fields="interface(mtu)"
+    )
+
+    # Then selected descendants written.
+    assert sink.getvalue() == (
+        '<system operation="merge">'
+        "<interface><name>xe-0/0/0</name><mtu>1500</mtu></interface>"
+        "<interface><name>xe-0/0/1</name><mtu>9000</mtu></interface>"
+        "<interface><name>xe-0/0/2</name><mtu>1500</mtu></interface>"
+        "</system>"
+    )
+
+
+def test_given_lazily_parsed_instance_of_module_node_subclass_when_to_xml_is_called_with_fields_then_unselected_children_not_parsed():
+    """Test given lazily parsed instance of module node subclass when to xml is called with fields then unselected children not parsed."""
+
+    # Given lazily parsed instance of ModuleNode subclass.
+    xml = system_with_interfaces().to_xml()
+    instance = OpenConfigSystem.from_xml(io.StringIO(xml), lazy=True)
+
+    # When to_xml is called with fields.
+    selected = instance.to_xml(fields="system/host-name")
+
+    # Then unselected children not parsed.
+    assert selected.endswith("<host-name>r1</host-name></system>")
+    interface = object.__getattribute__(instance.system, "interface")
+    assert type(interface) is Interface.__dict__["_cls_lazy"]
+
+
+@pytest.mark.parametrize(
+    "fields, message",
+    [
+        ("system(", "Invalid fields system(, expected identifier at token 3."),
+        ("system)", "Invalid fields system), unexpected )."),
+        (
+            "system/;",
+            "Invalid fields system/;, expected identifier at token 3.",
+        ),
+        ("system/#", "Invalid fields system/#."),
+        (
+            "system/unknown",
+            "Unknown node unknown of System in fields system/unknown.",
+        ),
+        (
+            "system/host-name(value)",
+            "Invalid fields system/host-name(value), host-name has no children.",
+        ),
+    ],
+)
+def test_given_invalid_fields_when_to_xml_is_called_then_value_error_raised(
+    fields, message
+):
+    """Test given invalid fields when to xml is called then value error raised."""
+
+    # Given invalid fields.
+    instance = system_with_interfaces()
+
+    # When to_xml is called.
+    with pytest.raises(ValueError) as exc:
+        instance.to_xml(fields=fields)
+
+    # Then ValueError raised.
+    assert str(exc.value) == message
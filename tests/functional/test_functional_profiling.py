@@ -0,0 +1,120 @@
+"""This module contains functional tests for profiling."""
+
+import io
+
+import pytest
+
+from yapyang import profile
+from yapyang.nodes import ContainerNode, LeafNode, ListNode, ModuleNode
+
+
+class Name(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "name"
+
+    value: str
+
+
+class Mtu(LeafNode):
+    """Represents a ListNode child node."""
+
+    __identifier__: str = "mtu"
+
+    value: int
+
+
+class Interface(ListNode):
+    """Represents a ContainerNode child node."""
+
+    __identifier__: str = "interface"
+    __key__: str = "name"
+
+    name: Name
+    mtu: Mtu
+
+
+class System(ContainerNode):
+    """Represents a ModuleNode child node."""
+
+    __identifier__: str = "system"
+
+    interface: Interface
+
+
+class OpenConfigSystem(ModuleNode):
+    """Represents a subclass of ModuleNode."""
+
+    __identifier__: str = "openconfig-system"
+    __namespace__: str = "http://openconfig.net/yang/system"
+
+    system: System
+
+
+def build(interfaces: int) -> OpenConfigSystem:
+    """Returns a module with interfaces list entries."""
+
+    interface = Interface()
+    for port in range(interfaces):
+        interface.append(Name(f"xe-0/0/{port}"), Mtu(1500))
+    return OpenConfigSystem(System(interface))
+
+
+def test_given_module_when_built_and_serialized_in_profile_then_counts_and_bytes_recorded_per_class():
+    """Test given module when built and serialized in profile then counts and bytes recorded per class."""
+
+    # Given module.
+    # When built and serialized in profile.
+    with profile() as stats:
+        module = build(3)
+        xml, text = module.to_xml(), module.to_json()
+
+    # Then counts and bytes recorded per class.
+    records = stats.records
+    assert records[Name]["construct"].calls == 3
+    assert records[Interface]["append"].calls == 3
+    assert records[System]["construct"].calls == 1
+    for operation, payload in (("xml", xml), ("json", text)):
+        assert records[OpenConfigSystem][operation].calls == 1
+        assert sum(
+            operations[operation].bytes
+            for operations in records.values()
+            if operation in operations
+        ) == len(payload.encode())
+    assert records[Interface]["xml"].bytes > records[System]["xml"].bytes
+    sink = io.StringIO()
+    stats.dump(sink)
+    assert [f"{__name__}.Interface", "append", "3"] in [
+        line.split()[:3] for line in sink.getvalue().splitlines()
+    ]
+
+
+def test_given_profile_when_exited_then_node_classes_have_no_wrappers():
+    """Test given profile when exited then node classes have no wrappers."""
+
+    # Given profile.
+    methods = (System.__dict__["__init__"], Interface.append)
+
+    # When exited.
+    with pytest.raises(ValueError):
+        with profile():
+            assert System.__dict__["__init__"] is not methods[0]
+            assert "append" in Interface.__dict__
+            raise ValueError
+
+    # Then node classes have no wrappers.
+    assert (System.__dict__["__init__"], Interface.append) == methods
+    assert "append" not in Interface.__dict__
+    assert build(1).to_xml()
+
+
+def test_given_enabled_profile_when_profile_is_entered_then_runtime_error_raised():
+    """Test given enabled profile when profile is entered then runtime error raised."""
+
+    # Given enabled profile.
+    with profile():
+        # When profile is entered.
+        # Then RuntimeError raised.
+        with pytest.raises(RuntimeError):
+            with profile():
+                pass
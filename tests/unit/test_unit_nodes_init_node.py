@@ -1,5 +1,6 @@
 """This module contains unit tests for nodes InitNode."""
 
+import inspect
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,27 +13,30 @@ class InitNodeSubclass(InitNode):
 
     __identifier__ = "init_node_subclass"
 
+    firstname: str
+    lastname: str
+
 
 @patch.object(Node, "__init__")
-def test_given_init_node_subclass_when_instantiated_then_node_initializer_called(
+def test_given_uninitialized_instance_of_init_node_subclass_when_init_node_initializer_is_called_then_node_initializer_called(
     node_init,
 ):
-    """Test given init node subclass when instantiated then node initializer called."""
+    """Test given uninitialized instance of init node subclass when init node initializer is called then node initializer called."""
 
-    # Given InitNode subclass.
+    # Given uninitialized instance of InitNode subclass.
+    instance = InitNodeSubclass.__new__(InitNodeSubclass)
 
-    # When instantiated.
-    with pytest.raises(AttributeError):
-        # Then exception is raised for attributes that Node __init__
-        # Mock did not create.
-        InitNodeSubclass()
+    # When InitNode initializer is called.
+    with pytest.raises(TypeError):
+        # Then exception is raised for missing required arguments.
+        InitNode.__init__(instance)
 
     # Then Node __init__ Mock was called.
     node_init.assert_called()
 
 
-def test_given_init_node_subclass_when_instantiated_with_args_and_kwargs_then_cls_meta_args_resolver_yielded_cls_arg_value_pairs_are_set_as_attributes():
-    """Test given init node subclass when instantiated with args and kwargs then cls meta args resolver yielded cls arg value pairs are set as attributes."""
+def test_given_uninitialized_instance_of_init_node_subclass_when_init_node_initializer_is_called_with_args_and_kwargs_then_cls_meta_args_resolver_yielded_cls_arg_value_pairs_are_set_as_attributes():
+    """Test given uninitialized instance of init node subclass when init node initializer is called with args and kwargs then cls meta args resolver yielded cls arg value pairs are set as attributes."""
 
     # Given args and kwargs.
     args = (1, 2, 3, 4, 5)
@@ -51,8 +55,11 @@ def test_given_init_node_subclass_when_instantiated_with_args_and_kwargs_then_cl
     mock = MagicMock(return_value=mock_iterator)
     InitNodeSubclass._cls_meta_args_resolver = mock
 
-    # When instantiated with args and kwargs.
-    instance = InitNodeSubclass(*args, **kwargs)
+    # Given uninitialized instance of InitNode subclass.
+    instance = InitNodeSubclass.__new__(InitNodeSubclass)
+
+    # When InitNode initializer is called with args and kwargs.
+    InitNode.__init__(instance, *args, **kwargs)
 
     # Then Mock _cls_meta_args_resolver was called with args and kwargs.
     InitNodeSubclass._cls_meta_args_resolver.assert_called_once_with(
@@ -65,3 +72,20 @@ def test_given_init_node_subclass_when_instantiated_with_args_and_kwargs_then_cl
     # Then cls_arg, value pairs are set as attributes.
     for cls_arg, value in cls_arg_value_pairs:
         assert getattr(instance, cls_arg) is value
+
+
+def test_given_init_node_subclass_when_created_then_initializer_constructed_with_fixed_signature():
+    """Test given init node subclass when created then initializer constructed with fixed signature."""
+
+    # Given InitNode subclass.
+
+    # When created.
+    initializer = InitNodeSubclass.__init__
+
+    # Then initializer constructed for class.
+    assert initializer is not InitNode.__init__
+    assert initializer.__qualname__ == "InitNodeSubclass.__init__"
+
+    # Then initializer has fixed signature of class meta args.
+    parameters = inspect.signature(initializer).parameters
+    assert list(parameters) == ["__self", "firstname", "lastname", "__extra"]
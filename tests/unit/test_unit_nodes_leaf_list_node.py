@@ -22,7 +22,7 @@ def test_given_leaf_list_node_subclass_when_instantiated_then_entries_attribute_
     user = LeafListNodeSubclass()
 
     # Then entries attribute created.
-    assert "entries" in user.__dict__
+    assert "entries" in LeafListNode.__slots__
     assert isinstance(user.entries, OrderedSet)
 
 
@@ -41,8 +41,8 @@ def test_given_leaf_list_node_subclass_when_instantiated_then_node_initializer_c
     node_init.assert_called()
 
 
-def test_given_instance_of_leaf_list_node_subclass_when_append_is_called_with_value_then_cls_meta_args_resolver_yielded_value_is_added_to_entries():
-    """Test given instance of leaf list node subclass when append is called with value then cls meta args resolver yielded value is added to entries."""
+def test_given_instance_of_leaf_list_node_subclass_when_leaf_list_node_append_is_called_with_value_then_cls_meta_args_resolver_yielded_value_is_added_to_entries():
+    """Test given instance of leaf list node subclass when leaf list node append is called with value then cls meta args resolver yielded value is added to entries."""
 
     # Given value.
     value = ("mock_value",)
@@ -63,8 +63,8 @@ def test_given_instance_of_leaf_list_node_subclass_when_append_is_called_with_va
     # Given instance of LeafListNode subclass.
     instance = LeafListNodeSubclass()
 
-    # When append is called with value.
-    instance.append(*value)
+    # When LeafListNode append is called with value.
+    LeafListNode.append(instance, *value)
 
     # Then Mock _cls_meta_args_resolver was called with value.
     LeafListNodeSubclass._cls_meta_args_resolver.assert_called_once_with(
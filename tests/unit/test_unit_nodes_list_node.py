@@ -1,11 +1,11 @@
 """This module contains unit tests for nodes ListNode."""
 
+import inspect
 import random
 import string
+from collections.abc import ValuesView
 from unittest.mock import MagicMock, patch
 
-import pytest
-from ordered_set import OrderedSet
 
 from yapyang.nodes import LeafNode, ListEntry, ListNode, Node
 
@@ -28,17 +28,20 @@ class ListNodeSubclass(ListNode):
     lastname: FirstOrLastName
 
 
-def test_given_list_node_subclass_when_instantiated_then_entries_attribute_created():
-    """Test given list node subclass when instantiated then entries attribute created."""
+def test_given_list_node_subclass_when_instantiated_then_entries_key_index_created():
+    """Test given list node subclass when instantiated then entries key index created."""
 
     # Given ListNode subclass.
 
     # When instantiated.
     interface = ListNodeSubclass()
 
-    # Then entries attribute created.
-    assert "entries" in interface.__dict__
-    assert isinstance(interface.entries, OrderedSet)
+    # Then entries key index created.
+    assert "_entries" in ListNode.__slots__
+    assert isinstance(interface._entries, dict)
+
+    # Then entries are a view of key index.
+    assert isinstance(interface.entries, ValuesView)
 
 
 @patch.object(Node, "__init__")
@@ -50,17 +53,14 @@ def test_given_list_node_subclass_when_instantiated_then_node_initializer_called
     # Given ListNode subclass.
 
     # When instantiated.
-    with pytest.raises(AttributeError):
-        # Then exception is raised for attributes that Node __init__
-        # Mock did not create.
-        ListNodeSubclass()
+    ListNodeSubclass()
 
     # Then Node __init__ Mock was called.
     node_init.assert_called()
 
 
-def test_given_instance_of_list_node_subclass_when_append_is_called_with_args_and_kwargs_then_cls_meta_args_resolver_yielded_cls_arg_value_pairs_are_set_as_attributes_of_new_list_entry():
-    """Test given instance of list node subclass when append is called with args and kwargs then cls meta args resolver yielded cls arg value pairs are set as attributes of new list entry."""
+def test_given_instance_of_list_node_subclass_when_list_node_create_entry_is_called_with_args_and_kwargs_then_cls_meta_args_resolver_yielded_cls_arg_value_pairs_are_set_as_attributes_of_new_list_entry():
+    """Test given instance of list node subclass when list node create entry is called with args and kwargs then cls meta args resolver yielded cls arg value pairs are set as attributes of new list entry."""
 
     # Given args and kwargs.
     args = (1, 2, 3, 4, 5)
@@ -85,8 +85,8 @@ def test_given_instance_of_list_node_subclass_when_append_is_called_with_args_an
     # Given instance of ListNode subclass.
     instance = ListNodeSubclass()
 
-    # When append is called with args and kwargs.
-    instance.append(*args, **kwargs)
+    # When ListNode create entry is called with args and kwargs.
+    entry = ListNode._create_entry(instance, *args, **kwargs)
 
     # Then Mock _cls_meta_args_resolver was called with args and kwargs.
     ListNodeSubclass._cls_meta_args_resolver.assert_called_once_with(
@@ -96,10 +96,26 @@ def test_given_instance_of_list_node_subclass_when_append_is_called_with_args_an
     # Then Mock iterator __iter__ was called.
     mock_iterator.__iter__.assert_called()
 
-    # Then new entry in entries.
-    (entry,) = instance.entries
+    # Then new entry returned.
     assert isinstance(entry, ListEntry)
 
     # Then cls_arg, value pairs are set as attributes of entry.
     for cls_arg, value in cls_arg_value_pairs:
         assert getattr(entry, cls_arg) is value
+
+
+def test_given_list_node_subclass_when_created_then_create_entry_constructed_with_fixed_signature():
+    """Test given list node subclass when created then create entry constructed with fixed signature."""
+
+    # Given ListNode subclass.
+
+    # When created.
+    create_entry = ListNodeSubclass._create_entry
+
+    # Then create entry constructed for class.
+    assert create_entry is not ListNode._create_entry
+    assert create_entry.__qualname__ == "ListNodeSubclass._create_entry"
+
+    # Then create entry has fixed signature of class meta args.
+    parameters = inspect.signature(create_entry).parameters
+    assert list(parameters) == ["__self", "firstname", "lastname", "__extra"]
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from yapyang.nodes import NodeMeta
+from yapyang.nodes import ContainerNode, InitNode, LeafNode, NodeMeta
 from yapyang.utils import MetaInfo
 
 ANNOTATIONS: str = "__annotations__"
@@ -107,6 +107,42 @@ def test_given_namespace_with_no_attribute_annotations_that_has_defaults_when_co
     assert namespace[cls_attribute] is cls_attribute_default
 
 
+def test_given_namespace_with_attribute_annotations_when_construct_meta_is_called_then_namespace_slots_contain_attributes():
+    """Test given namespace with attribute annotations when construct meta is called then namespace slots contain attributes."""
+
+    # Given namespace that contains attribute annotations and slots.
+    namespace = {
+        ANNOTATIONS: {"__identifier__": str, "identifier": str},
+        "__slots__": ("_entries",),
+    }
+
+    # When construct meta is called.
+    NodeMeta._construct_meta(namespace, ())
+
+    # Then namespace slots contain given slots and attributes.
+    assert namespace["__slots__"] == ("_entries", "identifier")
+
+    # Then namespace contains class meta.
+    assert namespace["_cls_meta"] is namespace[META]
+
+
+def test_given_base_with_meta_args_when_construct_meta_is_called_with_same_attribute_annotations_then_namespace_slots_do_not_contain_inherited_attributes():
+    """Test given base with meta args when construct meta is called with same attribute annotations then namespace slots do not contain inherited attributes."""
+
+    # Given base with meta args.
+    base = Mock()
+    base.__meta__ = {ARGS: {"identifier": str}, DEFAULTS: {}}
+
+    # Given namespace that contains same attribute annotation.
+    namespace = {ANNOTATIONS: {"identifier": str}}
+
+    # When construct meta is called.
+    NodeMeta._construct_meta(namespace, (base,))
+
+    # Then namespace slots do not contain inherited attributes.
+    assert namespace["__slots__"] == ()
+
+
 def test_given_base_with_meta_when_construct_meta_is_called_then_base_meta_copied_to_namespace_meta():
     """Test given base with meta when construct meta is called then base meta copied to namespace meta."""
 
@@ -439,8 +475,17 @@ def test_given_namespace_meta_when_meta_checker_is_called_then_meta_default_chec
 
 @patch.object(NodeMeta, "_construct_meta")
 @patch.object(NodeMeta, "_meta_checker")
+@patch.object(NodeMeta, "_construct_xml_renderer")
+@patch.object(NodeMeta, "_construct_json_renderer")
+@patch.object(NodeMeta, "_construct_list_entry")
+@patch.object(NodeMeta, "_construct_initializer")
 def test_given_name_bases_and_namespace_when_new_is_called_then_calls_private_methods_in_order(
-    mock_meta_checker: Mock, mock_construct_meta: Mock
+    mock_construct_initializer: Mock,
+    mock_construct_list_entry: Mock,
+    mock_construct_json_renderer: Mock,
+    mock_construct_xml_renderer: Mock,
+    mock_meta_checker: Mock,
+    mock_construct_meta: Mock,
 ):
     """Test given name bases and namespace when new is called then calls private methods in order."""
 
@@ -456,6 +501,15 @@ def test_given_name_bases_and_namespace_when_new_is_called_then_calls_private_me
 
     mock_construct_meta.side_effect = side_effect
 
+    # Given Mock parent that records calls of private methods.
+    parent = Mock()
+    parent.attach_mock(mock_construct_meta, "construct_meta")
+    parent.attach_mock(mock_meta_checker, "meta_checker")
+    parent.attach_mock(mock_construct_xml_renderer, "construct_xml_renderer")
+    parent.attach_mock(mock_construct_json_renderer, "construct_json_renderer")
+    parent.attach_mock(mock_construct_list_entry, "construct_list_entry")
+    parent.attach_mock(mock_construct_initializer, "construct_initializer")
+
     # When new is called.
     NodeMeta.__new__(NodeMeta, name, bases, namespace)
 
@@ -464,3 +518,284 @@ def test_given_name_bases_and_namespace_when_new_is_called_then_calls_private_me
 
     # Then meta checker is called once with name, bases and namespace metadata.
     mock_meta_checker.assert_called_once_with(name, bases, namespace_meta)
+
+    # Then construct xml renderer is called once with namespace.
+    mock_construct_xml_renderer.assert_called_once_with(bases, namespace)
+
+    # Then construct json renderer is called once with bases and namespace.
+    mock_construct_json_renderer.assert_called_once_with(bases, namespace)
+
+    # Then construct list entry is called once with namespace and no
+    # codes.
+    mock_construct_list_entry.assert_called_once_with(namespace, codes=None)
+
+    # Then construct initializer is called once with name, bases,
+    # namespace and no codes.
+    mock_construct_initializer.assert_called_once_with(
+        name, bases, namespace, codes=None
+    )
+
+    # Then private methods are called in order.
+    assert [call[0] for call in parent.mock_calls] == [
+        "construct_meta",
+        "meta_checker",
+        "construct_xml_renderer",
+        "construct_json_renderer",
+        "construct_list_entry",
+        "construct_initializer",
+    ]
+
+
+def test_given_namespace_meta_with_leaf_child_and_meta_info_attrs_when_construct_xml_renderer_is_called_then_namespace_contains_precomputed_xml_renderer():
+    """Test given namespace meta with leaf child and meta info attrs when construct xml renderer is called then namespace contains precomputed xml renderer."""
+
+    # Given leaf node.
+    class Name(LeafNode):
+        __identifier__ = "name"
+
+        value: str
+
+    # Given namespace meta with leaf child and MetaInfo attrs.
+    namespace = {
+        META: {
+            "__identifier__": str,
+            ARGS: {"name": Name},
+            DEFAULTS: {
+                "__identifier__": "interface",
+                "name": MetaInfo(attrs={"nc:operation": "delete"}),
+            },
+        }
+    }
+
+    # When construct xml renderer is called.
+    NodeMeta._construct_xml_renderer((), namespace)
+
+    # Then namespace contains precomputed XML renderer, constructed on
+    # first access.
+    renderer = namespace["_cls_xml_renderer"].construct(None)
+    assert renderer.start_tag == "<interface>"
+    assert renderer.end_tag == "</interface>"
+
+    # Then leaf child start and end tags are precomputed with attrs.
+    ((_, element_attrs, start_tag, end_tag, _),) = renderer.children
+    assert element_attrs == ' nc:operation="delete"'
+    assert start_tag == '<name nc:operation="delete">'
+    assert end_tag == "</name>"
+
+
+def test_given_namespace_meta_without_identifier_default_when_construct_xml_renderer_is_called_then_namespace_does_not_contain_xml_renderer():
+    """Test given namespace meta without identifier default when construct xml renderer is called then namespace does not contain xml renderer."""
+
+    # Given namespace meta without identifier default.
+    namespace = {META: {"__identifier__": str, ARGS: {}, DEFAULTS: {}}}
+
+    # When construct xml renderer is called.
+    NodeMeta._construct_xml_renderer((), namespace)
+
+    # Then namespace does not contain XML renderer.
+    assert "_cls_xml_renderer" not in namespace
+
+
+def test_given_module_namespace_meta_with_leaf_child_when_construct_json_renderer_is_called_then_namespace_contains_json_renderer_with_qualified_member_names():
+    """Test given module namespace meta with leaf child when construct json renderer is called then namespace contains json renderer with qualified member names."""
+
+    # Given leaf node.
+    class Name(LeafNode):
+        __identifier__ = "name"
+
+        value: str
+
+    # Given module namespace meta with leaf child.
+    namespace = {
+        META: {
+            "__identifier__": str,
+            "__namespace__": str,
+            ARGS: {"name": Name},
+            DEFAULTS: {"__identifier__": "openconfig-interfaces"},
+        }
+    }
+
+    # When construct json renderer is called.
+    NodeMeta._construct_json_renderer((), namespace)
+
+    # Then namespace contains JSON renderer with qualified member names.
+    ((_, member, encode, omit_empty),) = (
+        namespace["_cls_json_renderer"].construct(None).children
+    )
+    assert member == '"openconfig-interfaces:name":'
+    assert encode("xe-0/0/0") == '"xe-0/0/0"'
+    assert omit_empty is False
+
+
+def test_given_namespace_meta_with_composite_key_of_leaf_children_when_construct_list_entry_is_called_then_namespace_contains_list_entry_with_key_accessor_of_leaf_values():
+    """Test given namespace meta with composite key of leaf children when construct list entry is called then namespace contains list entry with key accessor of leaf values."""
+
+    # Given leaf node.
+    class Name(LeafNode):
+        __identifier__ = "name"
+
+        value: str
+
+    # Given namespace meta with composite key of leaf children.
+    namespace = {
+        META: {
+            ARGS: {"name": Name, "unit": Name},
+            DEFAULTS: {"__key__": "name,unit"},
+        }
+    }
+
+    # When construct list entry is called.
+    NodeMeta._construct_list_entry(namespace)
+
+    # Then namespace contains list entry with a slot for each arg.
+    entry_cls = namespace["_cls_entry"].construct(None)
+    assert entry_cls.__slots__ == ("name", "unit")
+
+    # Then list entry key accessor returns leaf values.
+    entry = entry_cls(Name("xe-0/0/0"), Name("0"))
+    assert entry._key(entry) == ("xe-0/0/0", "0")
+
+
+def test_given_namespace_meta_with_key_not_in_args_when_construct_list_entry_is_called_then_exception_is_raised():
+    """Test given namespace meta with key not in args when construct list entry is called then exception is raised."""
+
+    # Given namespace meta with key not in args.
+    namespace = {META: {ARGS: {}, DEFAULTS: {"__key__": "name"}}}
+
+    # When construct list entry is called.
+    with pytest.raises(TypeError) as exc:
+        NodeMeta._construct_list_entry(namespace)
+
+    # Then exception has expected message.
+    assert str(exc.value) == "Key name is not an argument."
+
+
+def test_given_namespace_meta_of_init_node_subclass_when_construct_initializer_is_called_then_namespace_initializer_resolves_args_and_defaults():
+    """Test given namespace meta of init node subclass when construct initializer is called then namespace initializer resolves args and defaults."""
+
+    # Given namespace meta of InitNode subclass.
+    namespace = {
+        META: {
+            ARGS: {"firstname": str, "lastname": str},
+            DEFAULTS: {
+                "__identifier__": "person",
+                "lastname": MetaInfo(default="Doe"),
+            },
+        }
+    }
+
+    # When construct initializer is called.
+    NodeMeta._construct_initializer("Person", (InitNode,), namespace)
+
+    # Then namespace initializer resolves args and defaults.
+    initializer = namespace["__init__"].construct(None)
+    instance = Mock()
+    initializer(instance, "Jane")
+    assert (instance.firstname, instance.lastname) == ("Jane", "Doe")
+    initializer(instance, lastname="Roe", firstname="John")
+    assert (instance.firstname, instance.lastname) == ("John", "Roe")
+
+
+def test_given_namespace_meta_of_init_node_subclass_when_construct_initializer_is_called_then_namespace_initializer_raises_class_meta_args_resolver_exceptions():
+    """Test given namespace meta of init node subclass when construct initializer is called then namespace initializer raises class meta args resolver exceptions."""
+
+    # Given namespace meta of InitNode subclass.
+    namespace = {
+        META: {
+            ARGS: {"firstname": str},
+            DEFAULTS: {"__identifier__": "person"},
+        }
+    }
+
+    # When construct initializer is called.
+    NodeMeta._construct_initializer("Person", (InitNode,), namespace)
+    initializer = namespace["__init__"].construct(None)
+
+    # Then missing required argument exception is raised.
+    with pytest.raises(TypeError) as exc:
+        initializer(Mock())
+    assert str(exc.value) == "Missing required argument: firstname"
+
+    # Then argument not of annotation exception is raised.
+    with pytest.raises(TypeError) as exc:
+        initializer(Mock(), 1)
+    assert (
+        str(exc.value)
+        == f"Expected argument of type {str} for firstname, got type {int}."
+    )
+
+    # Then too many arguments are checked against expected.
+    instance = Mock()
+    initializer(instance, "Jane", "Doe")
+    instance._check_given_args_not_greater_than_expected.assert_called_once_with(
+        2
+    )
+
+
+def test_given_namespace_meta_with_explicit_initializer_when_construct_initializer_is_called_then_namespace_initializer_unchanged():
+    """Test given namespace meta with explicit initializer when construct initializer is called then namespace initializer unchanged."""
+
+    # Given namespace meta with explicit initializer.
+    initializer = Mock()
+    namespace = {
+        META: {ARGS: {}, DEFAULTS: {"__identifier__": "person"}},
+        "__init__": initializer,
+    }
+
+    # When construct initializer is called.
+    NodeMeta._construct_initializer("Person", (InitNode,), namespace)
+
+    # Then namespace initializer unchanged.
+    assert namespace["__init__"] is initializer
+
+
+def test_given_namespaces_meta_with_equal_args_when_construct_initializer_is_called_then_initializers_share_code():
+    """Test given namespaces meta with equal args when construct initializer is called then initializers share code."""
+
+    # Given namespaces meta with equal args and different annotations.
+    first = {META: {ARGS: {"value": str}, DEFAULTS: {"__identifier__": "a"}}}
+    second = {META: {ARGS: {"value": int}, DEFAULTS: {"__identifier__": "b"}}}
+
+    # When construct initializer is called.
+    NodeMeta._construct_initializer("A", (InitNode,), first)
+    NodeMeta._construct_initializer("B", (InitNode,), second)
+
+    # Then initializers share code.
+    first_initializer = first["__init__"].construct(None)
+    second_initializer = second["__init__"].construct(None)
+    assert first_initializer.__code__ is second_initializer.__code__
+
+    # Then initializers type check their own annotation.
+    with pytest.raises(TypeError):
+        first_initializer(Mock(), 1)
+    second_initializer(Mock(), 1)
+
+
+def test_given_node_class_when_renderers_and_initializer_are_accessed_then_they_are_constructed_once_on_first_access():
+    """Test given node class when renderers and initializer are accessed then they are constructed once on first access."""
+
+    # Given leaf node.
+    class Name(LeafNode):
+        __identifier__ = "name"
+
+        value: str
+
+    # Given node class.
+    class Person(ContainerNode):
+        __identifier__ = "person"
+
+        name: Name
+
+    # Then renderers and initializer are deferred until first access.
+    for name in ("_cls_xml_renderer", "_cls_json_renderer", "__init__"):
+        assert type(Person.__dict__[name]).__name__ == "_Deferred"
+
+    # When renderers and initializer are accessed.
+    person = Person(Name("Jane"))
+    renderer = Person._cls_xml_renderer
+
+    # Then they replace the deferred attributes of the class.
+    assert Person.__dict__["_cls_xml_renderer"] is renderer
+    assert Person._cls_xml_renderer is renderer
+    assert callable(Person.__dict__["__init__"])
+    assert person.to_xml() == "<person><name>Jane</name></person>"
@@ -0,0 +1,60 @@
+"""This module contains unit tests for parsers JSONTokenizer."""
+
+import io
+
+import pytest
+
+from yapyang.parsers import JSONTokenizer
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 3, 7, 65536))
+def test_given_json_text_split_into_chunks_when_next_is_called_until_end_then_tokens_of_text_returned(
+    chunk_size: int,
+):
+    """Test given json text split into chunks when next is called until end then tokens of text returned."""
+
+    # Given JSON text split into chunks.
+    tokenizer = JSONTokenizer(
+        io.BytesIO(
+            '{"a:b" : [12345, -1.5e3, true, false, null, "x\\"\\u00e9yé"]}\n'.encode()
+        ),
+        chunk_size=chunk_size,
+    )
+
+    # When next is called until end.
+    tokens = list(iter(tokenizer.next, ("", None)))
+
+    # Then tokens of text returned.
+    assert tokens == [
+        ("{", None),
+        ("string", "a:b"),
+        (":", None),
+        ("[", None),
+        ("scalar", 12345),
+        (",", None),
+        ("scalar", -1500.0),
+        (",", None),
+        ("scalar", True),
+        (",", None),
+        ("scalar", False),
+        (",", None),
+        ("scalar", None),
+        (",", None),
+        ("string", 'x"éyé'),
+        ("]", None),
+        ("}", None),
+    ]
+
+
+def test_given_invalid_json_text_when_next_is_called_then_exception_is_raised():
+    """Test given invalid json text when next is called then exception is raised."""
+
+    # Given invalid JSON text.
+    tokenizer = JSONTokenizer(io.StringIO("nope"))
+
+    # When next is called.
+    with pytest.raises(ValueError) as exc:
+        tokenizer.next()
+
+    # Then exception has expected message.
+    assert str(exc.value) == "Unexpected JSON text: nope"
@@ -14,7 +14,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from .nodes import ContainerNode, LeafListNode, LeafNode, ListNode, ModuleNode
+from .diffs import Change
+from .fleet import render_as_completed, render_many
+from .nodes import (
+    ColumnarListNode,
+    ContainerNode,
+    LeafListNode,
+    LeafNode,
+    ListNode,
+    ModuleNode,
+)
+from .profiling import profile
 from .utils import MetaInfo
 from .version import __version__  # noqa
 
@@ -23,8 +33,13 @@ __all__ = (
     "ModuleNode",
     "ContainerNode",
     "ListNode",
+    "ColumnarListNode",
     "LeafListNode",
     "LeafNode",
     # Utilities.
     "MetaInfo",
+    "Change",
+    "render_many",
+    "render_as_completed",
+    "profile",
 )
@@ -0,0 +1,323 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import marshal
+import operator
+import typing as t
+
+from yapyang.constants import (
+    ARGS,
+    DEFAULTS,
+    IDENTIFIER,
+    LEAF,
+    LEAF_LIST,
+    LIST,
+    NAMESPACE,
+)
+from yapyang.utils import is_optional_arg, retrieve_leaf_value_accessor
+
+__all__ = ("dumps", "loads")
+
+# Leading bytes of binary data, the format name and version.
+MAGIC = b"YPB\x01"
+FINGERPRINT_SIZE = 8
+MARSHAL_VERSION = 4
+
+# Encoders, decoders and fingerprints constructed for each node class.
+_encoders: t.Dict[type, t.Callable[[t.Any], t.Any]] = dict()
+_decoders: t.Dict[type, t.Callable[[t.Any], t.Any]] = dict()
+_fingerprints: t.Dict[type, bytes] = dict()
+
+
+def _kind(cls: type, /) -> t.Optional[str]:
+    """Returns the kind of YANG node class is, or None when class is not a
+    node."""
+
+    # Nodes import this module.
+    from yapyang.nodes import NodeMeta
+
+    return NodeMeta._node_kind(cls)
+
+
+def _iter_fields(
+    cls: t.Any, /
+) -> t.Iterator[t.Tuple[str, t.Any, t.Optional[str]]]:
+    """Yields class arg, annotation and kind of each class meta arg."""
+
+    for cls_arg, annotation in cls.__meta__[ARGS].items():
+        yield cls_arg, annotation, _kind(annotation)
+
+
+def _describe(cls: t.Any, /) -> tuple:
+    """Returns the schema of class, the kind, identifier, namespace and key
+    of class and the schema of each class meta arg."""
+
+    defaults = cls.__meta__[DEFAULTS]
+    return (
+        _kind(cls),
+        defaults.get(IDENTIFIER),
+        defaults.get(NAMESPACE),
+        defaults.get("__key__"),
+        tuple(
+            (
+                cls_arg,
+                _describe(annotation)
+                if kind
+                else getattr(annotation, "__qualname__", repr(annotation)),
+            )
+            for cls_arg, annotation, kind in _iter_fields(cls)
+        ),
+    )
+
+
+def fingerprint(cls: t.Any, /) -> bytes:
+    """Returns the schema fingerprint of node class, which changes when the
+    schema of class or of any descendant class changes."""
+
+    if (digest := _fingerprints.get(cls)) is None:
+        digest = _fingerprints[cls] = hashlib.blake2b(
+            repr(_describe(cls)).encode(), digest_size=FINGERPRINT_SIZE
+        ).digest()
+    return digest
+
+
+def _value_getter(
+    cls_arg: str,
+    annotation: t.Any,
+    kind: t.Optional[str],
+    optional: bool,
+    /,
+) -> t.Callable[[t.Any], t.Any]:
+    """Returns a function that returns the encoded value of class arg of a
+    node or entry, None for absent optional leaves."""
+
+    if kind == LEAF:
+        (value_arg,) = annotation.__meta__[ARGS]
+        return retrieve_leaf_value_accessor(cls_arg, value_arg, optional)
+    getter = operator.attrgetter(cls_arg)
+    if kind is None:
+        return getter
+    encode = _encoder(annotation)
+    return lambda node: encode(getter(node))
+
+
+def _encoder(cls: t.Any, /) -> t.Callable[[t.Any], t.Any]:
+    """Returns a function that returns the positional values of a node of
+    class. Leaves are values, leaf lists lists of values, lists a column
+    of values for each arg, and other nodes a list of values for each
+    arg."""
+
+    if (encode := _encoders.get(cls)) is not None:
+        return encode
+
+    kind = _kind(cls)
+    getters = [
+        _value_getter(
+            cls_arg,
+            annotation,
+            arg_kind,
+            is_optional_arg(cls.__meta__, cls_arg),
+        )
+        for cls_arg, annotation, arg_kind in _iter_fields(cls)
+    ]
+    if kind == LEAF:
+        (encode,) = getters
+    elif kind == LEAF_LIST:
+
+        def encode(node: t.Any) -> t.Any:
+            return list(node.entries)
+
+    elif kind == LIST and cls._cls_columnar:
+
+        def encode(node: t.Any) -> t.Any:
+            return list(map(list, node._iter_columns()))
+
+    elif kind == LIST:
+
+        def encode(node: t.Any) -> t.Any:
+            entries = list(node.entries)
+            return [list(map(getter, entries)) for getter in getters]
+
+    else:
+
+        def encode(node: t.Any) -> t.Any:
+            return [getter(node) for getter in getters]
+
+    _encoders[cls] = encode
+    return encode
+
+
+def _column_decoder(
+    cls_arg: str,
+    annotation: t.Any,
+    kind: t.Optional[str],
+    optional: bool,
+    /,
+) -> t.Callable[[t.List[t.Any]], t.List[t.Any]]:
+    """Returns a function that returns the values of class arg of list
+    entries from a column. Leaves are created once per distinct value and
+    shared by the entries, values are type checked per column. None of
+    optional leaves stays None."""
+
+    new = object.__new__
+    setattr = object.__setattr__
+
+    if kind == LEAF:
+        ((value_arg, value_annotation),) = annotation.__meta__[ARGS].items()
+
+        value_types = (
+            {value_annotation, type(None)} if optional else {value_annotation}
+        )
+
+        def decode(column: t.List[t.Any]) -> t.List[t.Any]:
+            if not set(map(type, column)) <= value_types:
+                # Leaf initializer raises for values of other types.
+                return list(map(annotation, column))
+            leaves = dict.fromkeys(column)
+            for value in leaves:
+                if value is None:
+                    continue
+                leaf = new(annotation)
+                setattr(leaf, value_arg, value)
+                leaves[value] = leaf
+            return list(map(leaves.__getitem__, column))
+
+    elif kind is None:
+
+        def decode(column: t.List[t.Any]) -> t.List[t.Any]:
+            for value in column:
+                if (value_type := type(value)) is not annotation:
+                    raise TypeError(
+                        f"Expected argument of type {annotation} for {cls_arg}, got type {value_type}."
+                    )
+            return column
+
+    else:
+        decode_node = _decoder(annotation)
+
+        def decode(column: t.List[t.Any]) -> t.List[t.Any]:
+            return list(map(decode_node, column))
+
+    return decode
+
+
+def _decoder(cls: t.Any, /) -> t.Callable[[t.Any], t.Any]:
+    """Returns a function that returns a new node of class from positional
+    values. See _encoder."""
+
+    if (decode := _decoders.get(cls)) is not None:
+        return decode
+
+    kind = _kind(cls)
+    fields = list(_iter_fields(cls))
+    if kind == LEAF:
+        decode = cls
+    elif kind == LEAF_LIST:
+
+        def decode(values: t.Any) -> t.Any:
+            node = cls()
+            node.extend(values)
+            return node
+
+    elif kind == LIST and cls._cls_columnar:
+
+        def decode(values: t.Any) -> t.Any:
+            node = cls()
+            # Columns are type checked as they are appended.
+            node._append_columns(values)
+            return node
+
+    elif kind == LIST:
+        columns = [
+            _column_decoder(*field, is_optional_arg(cls.__meta__, field[0]))
+            for field in fields
+        ]
+        entry_cls = cls._cls_entry
+        key = entry_cls._key
+
+        def decode(values: t.Any) -> t.Any:
+            if (
+                len(values) != len(columns)
+                or len({len(column) for column in values}) > 1
+            ):
+                raise ValueError(f"Malformed columns of {cls.__name__}.")
+            entries = list(
+                map(
+                    entry_cls,
+                    *(
+                        decode_column(column)
+                        for decode_column, column in zip(columns, values)
+                    ),
+                )
+            )
+            node = cls()
+            node._entries = dict(zip(map(key, entries), entries))
+            for entry in entries:
+                object.__setattr__(entry, "_parent", node)
+            return node
+
+    else:
+        arg_decoders = [
+            _decoder(annotation) if arg_kind else None
+            for _, annotation, arg_kind in fields
+        ]
+
+        def decode(values: t.Any) -> t.Any:
+            if len(values) != len(arg_decoders):
+                raise ValueError(f"Malformed values of {cls.__name__}.")
+            # None of optional leaves is type checked by the initializer.
+            return cls(
+                *(
+                    value
+                    if decode_value is None or value is None
+                    else decode_value(value)
+                    for decode_value, value in zip(arg_decoders, values)
+                )
+            )
+
+    _decoders[cls] = decode
+    return decode
+
+
+def dumps(node: t.Any, /) -> bytes:
+    """Returns the compact binary encoding of node, the schema fingerprint
+    of the node class followed by the positional values of the node tree
+    without arg names."""
+
+    cls = node.__class__
+    return b"".join(
+        (
+            MAGIC,
+            fingerprint(cls),
+            marshal.dumps(_encoder(cls)(node), MARSHAL_VERSION),
+        )
+    )
+
+
+def loads(data: bytes, cls: t.Any, /) -> t.Any:
+    """Returns a new node of class from its compact binary encoding. When
+    data was not encoded from a node with the same schema raises
+    ValueError. Data is trusted, as with pickle."""
+
+    start = len(MAGIC) + FINGERPRINT_SIZE
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Expected data in yapyang binary format.")
+    if data[len(MAGIC) : start] != fingerprint(cls):
+        raise ValueError(
+            f"Schema fingerprint of data does not match {cls.__name__}."
+        )
+    return _decoder(cls)(marshal.loads(memoryview(data)[start:]))
@@ -0,0 +1,868 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import hashlib
+import importlib.util
+import json
+import keyword
+import os
+import re
+import sys
+import tempfile
+import types
+import typing as t
+
+from yapyang.constants import CONTAINER, LEAF, LEAF_LIST, LIST
+from yapyang.loading import Spec, register_class_cache
+from yapyang.nodes import ContainerNode, ListEntry, ListNode, ModuleNode
+
+__all__ = ("parse_yang", "generate", "load")
+
+# Version of generated source, cached modules of other versions are not
+# reused.
+GENERATOR_VERSION = 3
+
+# Python value type of each YANG built-in type, other types are str.
+BUILTIN_TYPES: t.Dict[str, type] = {
+    **dict.fromkeys(
+        (
+            "int8",
+            "int16",
+            "int32",
+            "int64",
+            "uint8",
+            "uint16",
+            "uint32",
+            "uint64",
+        ),
+        int,
+    ),
+    "decimal64": float,
+    "boolean": bool,
+    **dict.fromkeys(
+        (
+            "string",
+            "enumeration",
+            "bits",
+            "binary",
+            "leafref",
+            "identityref",
+            "instance-identifier",
+            "empty",
+            "union",
+        ),
+        str,
+    ),
+}
+
+# Base class of the generated class of each kind of YANG data node.
+BASE_CLASSES: t.Dict[str, str] = {
+    CONTAINER: "ContainerNode",
+    LIST: "ListNode",
+    LEAF_LIST: "LeafListNode",
+    LEAF: "LeafNode",
+}
+
+# Attribute names of nodes and list entries, which class args must not
+# shadow.
+RESERVED = frozenset(
+    (
+        *dir(ModuleNode),
+        *dir(ContainerNode),
+        *dir(ListNode),
+        *dir(ListEntry),
+    )
+)
+
+# Statements whose data nodes are part of the parent data node.
+TRANSPARENT = frozenset(("choice", "case"))
+
+# Tokens of YANG sources, whitespace and comments are skipped.
+TOKEN = re.compile(
+    r"""
+    (?:\s+|//[^\n]*|/\*.*?\*/)
+    |(?P<punctuation>[{};])
+    |"(?P<double>(?:[^"\\]|\\.)*)"
+    |'(?P<single>[^']*)'
+    |(?P<unquoted>(?:[^\s;{}"'/]|/(?![/*]))+)
+    """,
+    re.S | re.X,
+)
+ESCAPES: t.Dict[str, str] = {"n": "\n", "t": "\t", '"': '"', "\\": "\\"}
+
+
+class Statement:
+    """YANG statement, a keyword with an optional argument and
+    substatements."""
+
+    __slots__ = ("keyword", "argument", "substatements", "line")
+
+    def __init__(
+        self, keyword: str, argument: t.Optional[str], line: int, /
+    ) -> None:
+        """Initializer that takes keyword, argument and the source line."""
+
+        self.keyword = keyword
+        self.argument = argument
+        self.substatements: t.List["Statement"] = list()
+        self.line = line
+
+    def __repr__(self) -> str:
+        """Returns representation of statement with keyword and
+        argument."""
+
+        return (
+            f"{self.__class__.__name__}({self.keyword!r}, {self.argument!r})"
+        )
+
+    def find(self, keyword: str, /) -> t.Optional["Statement"]:
+        """Returns the first substatement of keyword, or None."""
+
+        for statement in self.substatements:
+            if statement.keyword == keyword:
+                return statement
+        return None
+
+    def find_all(self, keyword: str, /) -> t.Iterator["Statement"]:
+        """Yields each substatement of keyword."""
+
+        for statement in self.substatements:
+            if statement.keyword == keyword:
+                yield statement
+
+    def argument_of(self, keyword: str, /) -> t.Optional[str]:
+        """Returns the argument of the first substatement of keyword, or
+        None."""
+
+        statement = self.find(keyword)
+        return None if statement is None else statement.argument
+
+
+def _unescape(text: str, column: int, /) -> str:
+    """Returns the value of a double quoted string that starts at column,
+    escapes are replaced and whitespace of continuation lines up to the
+    column of the opening quote is stripped."""
+
+    lines = text.split("\n")
+    for index in range(1, len(lines)):
+        line = lines[index].expandtabs(8)
+        indent = len(line) - len(line.lstrip(" "))
+        lines[index] = line[min(indent, column + 1) :]
+    text = "\n".join(
+        line.rstrip(" \t") if index < len(lines) - 1 else line
+        for index, line in enumerate(lines)
+    )
+    return re.sub(
+        r"\\(.)", lambda match: ESCAPES.get(match[1], match[0]), text
+    )
+
+
+def _iter_tokens(text: str, /) -> t.Iterator[t.Tuple[str, str, int]]:
+    """Yields kind, value and offset of each token of YANG text. Kinds
+    are punctuation, quoted and unquoted."""
+
+    position = 0
+    while position < len(text):
+        if (match := TOKEN.match(text, position)) is None:
+            line = text.count("\n", 0, position) + 1
+            raise ValueError(f"Invalid YANG syntax at line {line}.")
+        position = match.end()
+        if (value := match["punctuation"]) is not None:
+            yield "punctuation", value, match.start()
+        elif (value := match["double"]) is not None:
+            column = match.start() - (text.rfind("\n", 0, match.start()) + 1)
+            yield "quoted", _unescape(value, column), match.start()
+        elif (value := match["single"]) is not None:
+            yield "quoted", value, match.start()
+        elif (value := match["unquoted"]) is not None:
+            yield "unquoted", value, match.start()
+
+
+def parse_yang(text: str, /) -> Statement:
+    """Returns the module or submodule statement of YANG text. Raises
+    ValueError for invalid syntax."""
+
+    def line_of(offset: int) -> int:
+        return text.count("\n", 0, offset) + 1
+
+    root = Statement("", None, 0)
+    stack = [root]
+    # Keyword and argument of the statement being parsed, and whether
+    # argument is a quoted string that may be concatenated.
+    statement: t.Optional[Statement] = None
+    concatenation = quoted = False
+    for kind, value, offset in _iter_tokens(text):
+        if statement is None:
+            if kind == "punctuation" and value == "}":
+                if len(stack) == 1:
+                    raise ValueError(
+                        f"Unexpected }} at line {line_of(offset)}."
+                    )
+                stack.pop()
+                continue
+            if kind != "unquoted":
+                raise ValueError(
+                    f"Expected keyword at line {line_of(offset)}, got {value!r}."
+                )
+            statement = Statement(value, None, line_of(offset))
+        elif kind == "punctuation":
+            if concatenation:
+                raise ValueError(
+                    f"Expected string after + at line {line_of(offset)}."
+                )
+            stack[-1].substatements.append(statement)
+            if value == "{":
+                stack.append(statement)
+            elif value == "}":
+                raise ValueError(
+                    f"Expected ; or {{ at line {line_of(offset)}."
+                )
+            statement = None
+            quoted = False
+        elif concatenation:
+            if kind != "quoted":
+                raise ValueError(
+                    f"Expected string after + at line {line_of(offset)}."
+                )
+            statement.argument = f"{statement.argument}{value}"
+            concatenation = False
+        elif quoted and kind == "unquoted" and value == "+":
+            concatenation = True
+        elif statement.argument is None:
+            statement.argument = value
+            quoted = kind == "quoted"
+        else:
+            raise ValueError(
+                f"Unexpected string at line {line_of(offset)}: {value!r}."
+            )
+
+    if statement is not None or len(stack) > 1:
+        raise ValueError("Unexpected end of YANG text.")
+    if len(root.substatements) != 1 or root.substatements[0].keyword not in (
+        "module",
+        "submodule",
+    ):
+        raise ValueError("Expected a single module or submodule statement.")
+    return root.substatements[0]
+
+
+class Context:
+    """Lexical context of a module or submodule, its module name,
+    namespace, own prefix and the module name of each import prefix."""
+
+    __slots__ = ("module", "namespace", "prefix", "imports")
+
+    def __init__(
+        self,
+        module: str,
+        namespace: t.Optional[str],
+        prefix: t.Optional[str],
+        imports: t.Dict[str, str],
+        /,
+    ) -> None:
+        self.module = module
+        self.namespace = namespace
+        self.prefix = prefix
+        self.imports = imports
+
+
+class Scope:
+    """Groupings and typedefs visible to statements, each with the scope
+    it was defined in, and the enclosing scope."""
+
+    __slots__ = ("context", "groupings", "typedefs", "parent")
+
+    def __init__(
+        self,
+        context: Context,
+        parent: t.Optional["Scope"] = None,
+        /,
+        *,
+        groupings: t.Optional[dict] = None,
+        typedefs: t.Optional[dict] = None,
+    ) -> None:
+        self.context = context
+        self.parent = parent
+        self.groupings: t.Dict[str, t.Tuple[Statement, Scope]] = (
+            dict() if groupings is None else groupings
+        )
+        self.typedefs: t.Dict[str, t.Tuple[Statement, Scope]] = (
+            dict() if typedefs is None else typedefs
+        )
+
+    def define(self, statement: Statement, /) -> "Scope":
+        """Returns scope of the substatements of statement, a new scope
+        when statement defines groupings or typedefs."""
+
+        groupings = list(statement.find_all("grouping"))
+        typedefs = list(statement.find_all("typedef"))
+        if not groupings and not typedefs:
+            return self
+        scope = Scope(self.context, self)
+        for grouping in groupings:
+            scope.groupings[grouping.argument or ""] = (grouping, scope)
+        for typedef in typedefs:
+            scope.typedefs[typedef.argument or ""] = (typedef, scope)
+        return scope
+
+
+class Compiler:
+    """Compiler of YANG modules into the source of node classes. Modules
+    and submodules are found by name in search paths."""
+
+    def __init__(self, search_paths: t.Iterable[str], /) -> None:
+        """Initializer that takes the directories of YANG sources."""
+
+        self.search_paths = list(search_paths)
+        # Top scope of each loaded module, shared by its submodules.
+        self._modules: t.Dict[str, Scope] = dict()
+        self._class_names: t.Set[str] = set()
+        self._classes: t.Dict[str, Spec] = dict()
+
+    def _find(self, name: str, /) -> str:
+        """Returns the path of the latest revision of module name."""
+
+        candidates = list()
+        for directory in self.search_paths:
+            for file_name in os.listdir(directory):
+                stem, extension = os.path.splitext(file_name)
+                if extension == ".yang" and (
+                    stem == name or stem.startswith(f"{name}@")
+                ):
+                    candidates.append(
+                        (stem, os.path.join(directory, file_name))
+                    )
+        if not candidates:
+            raise FileNotFoundError(f"YANG module {name} not found.")
+        return max(candidates)[1]
+
+    @staticmethod
+    def _read(path: str, /) -> Statement:
+        """Returns the module or submodule statement of YANG file."""
+
+        with open(path, encoding="utf-8") as file:
+            return parse_yang(file.read())
+
+    def _context(self, statement: Statement, /) -> Context:
+        """Returns the context of module or submodule statement."""
+
+        imports = {
+            import_statement.argument_of("prefix") or "": (
+                import_statement.argument or ""
+            )
+            for import_statement in statement.find_all("import")
+        }
+        if statement.keyword == "module":
+            return Context(
+                statement.argument or "",
+                statement.argument_of("namespace"),
+                statement.argument_of("prefix"),
+                imports,
+            )
+        belongs_to = statement.find("belongs-to")
+        if belongs_to is None:
+            raise ValueError(
+                f"Submodule {statement.argument} has no belongs-to."
+            )
+        return Context(
+            belongs_to.argument or "",
+            None,
+            belongs_to.argument_of("prefix"),
+            imports,
+        )
+
+    def load_module(
+        self, statement: Statement, /
+    ) -> t.Tuple[Scope, t.List[t.Tuple[Statement, Scope]]]:
+        """Returns the top scope of module statement and each statement
+        with its scope, of module and its included submodules."""
+
+        context = self._context(statement)
+        scope = self._modules[context.module] = Scope(context)
+        units = [(statement, scope)]
+        pending = [statement]
+        included = set()
+        while pending:
+            for include in pending.pop().find_all("include"):
+                if (name := include.argument or "") in included:
+                    continue
+                included.add(name)
+                submodule = self._read(self._find(name))
+                sub_context = self._context(submodule)
+                sub_context.namespace = context.namespace
+                units.append(
+                    (
+                        submodule,
+                        Scope(
+                            sub_context,
+                            groupings=scope.groupings,
+                            typedefs=scope.typedefs,
+                        ),
+                    )
+                )
+                pending.append(submodule)
+        for unit, unit_scope in units:
+            for grouping in unit.find_all("grouping"):
+                scope.groupings[grouping.argument or ""] = (
+                    grouping,
+                    unit_scope,
+                )
+            for typedef in unit.find_all("typedef"):
+                scope.typedefs[typedef.argument or ""] = (typedef, unit_scope)
+        return scope, units
+
+    def _module_scope(self, name: str, /) -> Scope:
+        """Returns the top scope of imported module name, loaded once."""
+
+        if (scope := self._modules.get(name)) is None:
+            statement = self._read(self._find(name))
+            if statement.keyword != "module":
+                raise ValueError(f"Imported {name} is not a module.")
+            scope, _ = self.load_module(statement)
+        return scope
+
+    def _lookup(
+        self, scope: Scope, name: str, table: str, line: int, /
+    ) -> t.Tuple[Statement, Scope]:
+        """Returns the grouping or typedef, by table, of name resolved
+        from scope, and the scope it was defined in."""
+
+        prefix, _, local = name.rpartition(":")
+        context = scope.context
+        if prefix and prefix != context.prefix:
+            if (module := context.imports.get(prefix)) is None:
+                raise ValueError(
+                    f"Unknown prefix {prefix} at line {line} of {context.module}."
+                )
+            search: t.Optional[Scope] = self._module_scope(module)
+        else:
+            search = scope
+        while search is not None:
+            if (found := getattr(search, table).get(local)) is not None:
+                return found
+            search = search.parent
+        raise ValueError(
+            f"Unknown {table[:-1]} {name} at line {line} of {context.module}."
+        )
+
+    def resolve_type(
+        self, statement: Statement, scope: Scope, /
+    ) -> t.Tuple[type, t.Optional[str]]:
+        """Returns the value type and default of the type of leaf or leaf
+        list statement, typedefs are resolved to built-in types."""
+
+        type_statement = statement.find("type")
+        if type_statement is None:
+            raise ValueError(
+                f"Expected type of {statement.argument} at line {statement.line}."
+            )
+        return self._resolve(
+            type_statement, statement.argument_of("default"), scope
+        )
+
+    def _resolve(
+        self,
+        type_statement: Statement,
+        default: t.Optional[str],
+        scope: Scope,
+        /,
+    ) -> t.Tuple[type, t.Optional[str]]:
+        """Returns the value type of type statement and default, when None
+        the default of the first typedef with one."""
+
+        name = type_statement.argument or ""
+        while name not in BUILTIN_TYPES:
+            typedef, scope = self._lookup(
+                scope, name, "typedefs", type_statement.line
+            )
+            if default is None:
+                default = typedef.argument_of("default")
+            if (base := typedef.find("type")) is None:
+                raise ValueError(
+                    f"Expected type of typedef {typedef.argument}."
+                )
+            type_statement, name = base, base.argument or ""
+        if name != "union":
+            return BUILTIN_TYPES[name], default
+        # Unions of members of different value types are str.
+        value_types = {
+            self._resolve(member, None, scope)[0]
+            for member in type_statement.find_all("type")
+        }
+        return (value_types.pop() if len(value_types) == 1 else str), default
+
+    def iter_data_nodes(
+        self, statement: Statement, scope: Scope, /, *, choice: bool = False
+    ) -> t.Iterator[t.Tuple[Statement, Scope, bool]]:
+        """Yields each data node substatement of statement with its scope
+        and whether it is within a choice, uses are expanded and choices
+        and cases are flattened."""
+
+        scope = scope.define(statement)
+        for substatement in statement.substatements:
+            keyword = substatement.keyword
+            if keyword in (CONTAINER, LIST, LEAF_LIST, LEAF):
+                yield substatement, scope, choice
+            elif keyword in TRANSPARENT:
+                yield from self.iter_data_nodes(
+                    substatement, scope, choice=True
+                )
+            elif keyword == "uses":
+                grouping, grouping_scope = self._lookup(
+                    scope,
+                    substatement.argument or "",
+                    "groupings",
+                    substatement.line,
+                )
+                yield from self.iter_data_nodes(
+                    grouping, grouping_scope, choice=choice
+                )
+
+    def _class_name(self, path: t.List[str], /) -> str:
+        """Returns a unique class name from the identifiers of path."""
+
+        name = "".join(
+            part.capitalize()
+            for identifier in path
+            for part in re.split(r"[^0-9A-Za-z]+", identifier)
+        )
+        name = name if name.isidentifier() else f"Node{name}"
+        unique, count = name, 1
+        while unique in self._class_names:
+            count += 1
+            unique = f"{name}{count}"
+        self._class_names.add(unique)
+        return unique
+
+    @staticmethod
+    def _arg_name(identifier: str, /) -> str:
+        """Returns the class arg of a child identifier."""
+
+        name = re.sub(r"\W", "_", identifier)
+        if keyword.iskeyword(name) or name in RESERVED:
+            name = f"{name}_"
+        return name
+
+    def _emit_children(
+        self,
+        statement: Statement,
+        scope: Scope,
+        path: t.List[str],
+        /,
+        *,
+        keys: t.Collection[str] = (),
+    ) -> t.List[t.Tuple[str, str, t.Any, bool]]:
+        """Emits the class of each data node of statement, and returns
+        the class arg, class name, default leaf value and whether the
+        leaf is optional of each. Leaves are optional unless they are
+        keys or mandatory, or have a default, outside of a choice."""
+
+        fields: t.List[t.Tuple[str, str, t.Any, bool]] = list()
+        arg_names: t.Set[str] = set()
+        for child, child_scope, choice in self.iter_data_nodes(
+            statement, scope
+        ):
+            identifier = child.argument or ""
+            if (arg_name := self._arg_name(identifier)) in arg_names:
+                raise ValueError(
+                    f"Duplicate child {identifier} of {'/'.join(path)}."
+                )
+            arg_names.add(arg_name)
+            class_name, default = self._emit_node(
+                child, child_scope, [*path, identifier]
+            )
+            optional = child.keyword == LEAF and (
+                choice
+                or (
+                    identifier not in keys
+                    and default is None
+                    and child.argument_of("mandatory") != "true"
+                )
+            )
+            fields.append(
+                (arg_name, class_name, None if choice else default, optional)
+            )
+        return fields
+
+    def _emit_node(
+        self, statement: Statement, scope: Scope, path: t.List[str], /
+    ) -> t.Tuple[str, t.Any]:
+        """Emits the classes of data node statement and its descendants,
+        and returns the class name and for leaves the default value."""
+
+        kind = statement.keyword
+        identifier = statement.argument or ""
+        name = self._class_name(path)
+        base = BASE_CLASSES[kind]
+        if kind in (LEAF, LEAF_LIST):
+            value_type, default = self.resolve_type(statement, scope)
+            self._classes[name] = (
+                base,
+                identifier,
+                dict(),
+                (("value", value_type.__name__, None, False),),
+            )
+            if kind == LEAF_LIST or default is None:
+                return name, None
+            return name, _convert_default(value_type, default)
+
+        metadata = dict()
+        keys: t.List[str] = list()
+        if kind == LIST:
+            keys = (statement.argument_of("key") or "").split()
+            if not keys:
+                # Keyless lists, of state data, are keyed by every leaf
+                # outside of choices, leaves of choices are optional.
+                keys = [
+                    child.argument or ""
+                    for child, _, choice in self.iter_data_nodes(
+                        statement, scope
+                    )
+                    if child.keyword == LEAF and not choice
+                ]
+                if not keys:
+                    raise ValueError(
+                        f"Keyless list {'/'.join(path)} has no leaves "
+                        "outside of choices to key its entries."
+                    )
+            metadata["key"] = ",".join(map(self._arg_name, keys))
+        fields = self._emit_children(statement, scope, path, keys=keys)
+        self._classes[name] = (base, identifier, metadata, tuple(fields))
+        return name, None
+
+    def compile(self, paths: t.Iterable[str], /, *, lazy: bool = False) -> str:
+        """Returns the source of a Python module with the node classes of
+        YANG modules at paths, a ModuleNode subclass for each module with
+        data nodes. When lazy is True classes are built on first access,
+        see loading.lazy_classes."""
+
+        self._classes = dict()
+        module_names = list()
+        for path in paths:
+            statement = self._read(path)
+            if statement.keyword != "module":
+                raise ValueError(f"Expected module, got submodule at {path}.")
+            scope, units = self.load_module(statement)
+            context = scope.context
+            fields: t.List[t.Tuple[str, str, t.Any, bool]] = list()
+            for unit, unit_scope in units:
+                fields.extend(self._emit_children(unit, unit_scope, []))
+            if not fields:
+                continue
+            module_name = self._class_name([context.module])
+            self._classes[module_name] = (
+                "ModuleNode",
+                context.module,
+                dict(namespace=context.namespace or ""),
+                tuple(fields),
+            )
+            module_names.append(module_name)
+
+        render = _render_lazy if lazy else _render_classes
+        return "\n".join(
+            (
+                "# Generated by yapyang from YANG modules, do not edit.",
+                "",
+                *render(self._classes),
+                "",
+                "",
+                f"__all__ = {_literal(tuple(module_names))}",
+                "",
+            )
+        )
+
+
+def _render_classes(classes: t.Dict[str, Spec], /) -> t.Iterator[str]:
+    """Yields source lines of a class statement of each class spec."""
+
+    yield "from yapyang.nodes import ("
+    for base in sorted({*BASE_CLASSES.values(), "ModuleNode"}):
+        yield f"    {base},"
+    yield ")"
+    for name, (base, identifier, metadata, fields) in classes.items():
+        yield from ("", "", f"class {name}({base}):")
+        yield f"    __identifier__ = {_literal(identifier)}"
+        for attr, value in metadata.items():
+            yield f"    __{attr}__ = {_literal(value)}"
+        yield ""
+        for cls_arg, annotation, default, optional in fields:
+            if optional:
+                yield f"    {cls_arg}: {annotation} = None"
+            elif default is None:
+                yield f"    {cls_arg}: {annotation}"
+            else:
+                yield (
+                    f"    {cls_arg}: {annotation} = "
+                    f"{annotation}({_literal(default)})"
+                )
+
+
+def _render_lazy(classes: t.Dict[str, Spec], /) -> t.Iterator[str]:
+    """Yields source lines of module __getattr__ and __dir__ functions
+    that build classes from their specs on first access."""
+
+    yield "from yapyang.loading import lazy_classes"
+    yield ""
+    yield "__getattr__, __dir__ = lazy_classes("
+    yield "    globals(),"
+    yield "    {"
+    for name, spec in classes.items():
+        yield f"        {_literal(name)}: {_literal(spec)},"
+    yield "    },"
+    yield ")"
+
+
+def _literal(value: t.Any, /) -> str:
+    """Returns Python source of value, strings are double quoted."""
+
+    if type(value) is str:
+        return json.dumps(value)
+    if type(value) is tuple:
+        items = ", ".join(map(_literal, value))
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    if type(value) is dict:
+        pairs = (f"{_literal(k)}: {_literal(v)}" for k, v in value.items())
+        return f"{{{', '.join(pairs)}}}"
+    return repr(value)
+
+
+def _convert_default(value_type: type, default: str, /) -> t.Any:
+    """Returns YANG default text as a value of type, or None when the
+    text is not a value of type."""
+
+    try:
+        if value_type is bool:
+            return {"true": True, "false": False}[default]
+        if value_type is int:
+            # Leading zeros are octal, as in YANG.
+            octal = re.fullmatch(r"[-+]?0[0-7]+", default)
+            return int(default, 8 if octal else 0)
+        return value_type(default)
+    except (KeyError, ValueError):
+        return None
+
+
+def generate(
+    paths: t.Iterable[str],
+    /,
+    *,
+    search_paths: t.Optional[t.Iterable[str]] = None,
+    lazy: bool = False,
+) -> str:
+    """Returns the source of a Python module with node classes generated
+    from YANG modules at paths. Imported modules and included submodules
+    are found in search paths, by default the directories of paths.
+    Groupings are expanded where they are used, typedefs are resolved to
+    built-in types and choices are flattened into their parent. When lazy
+    is True each class is built on first access, see
+    loading.lazy_classes."""
+
+    paths = list(paths)
+    if search_paths is None:
+        search_paths = dict.fromkeys(
+            os.path.dirname(os.path.abspath(path)) for path in paths
+        )
+    return Compiler(search_paths).compile(paths, lazy=lazy)
+
+
+def _digest(
+    paths: t.List[str], search_paths: t.List[str], lazy: bool, /
+) -> str:
+    """Returns the content hash of YANG modules at paths and of every
+    YANG source in search paths, for lazy or eager generated source."""
+
+    sources = {os.path.abspath(path) for path in paths}
+    for directory in search_paths:
+        for file_name in os.listdir(directory):
+            if file_name.endswith(".yang"):
+                sources.add(
+                    os.path.abspath(os.path.join(directory, file_name))
+                )
+    digest = hashlib.sha256(f"{GENERATOR_VERSION}\0{lazy}\0".encode())
+    for path in paths:
+        digest.update(f"{os.path.basename(path)}\0".encode())
+    for source in sorted(sources, key=os.path.basename):
+        with open(source, "rb") as file:
+            content = file.read()
+        digest.update(f"{os.path.basename(source)}\0{len(content)}\0".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def load(
+    paths: t.Iterable[str],
+    /,
+    *,
+    search_paths: t.Optional[t.Iterable[str]] = None,
+    cache_dir: t.Optional[str] = None,
+    lazy: bool = False,
+    precompute: bool = False,
+) -> types.ModuleType:
+    """Returns a Python module with node classes generated from YANG
+    modules at paths, see generate. Generated modules are cached in cache
+    dir, by default yapyang in the user cache directory, keyed by a
+    content hash of the sources, so unchanged sources are not compiled
+    again. Modules are imported once per process. When lazy is True each
+    class is built on first access. When precompute is True the finalized
+    metadata and compiled initializers of classes are cached too, and
+    reused without validation while sources and yapyang are unchanged,
+    see loading.ClassCache."""
+
+    paths = list(paths)
+    if search_paths is None:
+        search_paths = dict.fromkeys(
+            os.path.dirname(os.path.abspath(path)) for path in paths
+        )
+    search_paths = list(search_paths)
+    digest = _digest(paths, search_paths, lazy)
+    module_name = f"yapyang_models_{digest[:16]}"
+    if (module := sys.modules.get(module_name)) is not None:
+        return module
+
+    if cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "yapyang",
+        )
+    os.makedirs(cache_dir, exist_ok=True)
+    cached = os.path.join(cache_dir, f"{module_name}.py")
+    if not os.path.exists(cached):
+        source = generate(paths, search_paths=search_paths, lazy=lazy)
+        # Written atomically, so that concurrent loads never import a
+        # partial module.
+        descriptor, temporary = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            file.write(source)
+        os.replace(temporary, cached)
+
+    class_cache = None
+    if precompute:
+        class_cache = register_class_cache(
+            module_name, f"{cached[:-3]}.classes", digest
+        )
+    spec = importlib.util.spec_from_file_location(module_name, cached)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    # Registered before execution, so that classes can be pickled.
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)  # type: ignore[union-attr]
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    if class_cache is not None:
+        class_cache.write()
+    return module
@@ -25,6 +25,31 @@ DEFAULTS: str = "__defaults__"
 UNSET: object = object()
 
 XML_ELEMENT_TEMPLATE: str = "<{0}{1}>{2}</{0}>"
+XML_START_TAG_TEMPLATE: str = "<{0}{1}>"
+XML_END_TAG_TEMPLATE: str = "</{0}>"
 XML_ATTRIBUTE_TEMPLATE: str = ' {0}="{1}"'
 
+JSON_MEMBER_TEMPLATE: str = '"{0}":'
+JSON_QUALIFIED_MEMBER_TEMPLATE: str = '"{0}:{1}":'
+
 IDENTIFIER: str = "__identifier__"
+NAMESPACE: str = "__namespace__"
+
+# Kinds of YANG nodes that children of a node can be.
+CONTAINER: str = "container"
+LIST: str = "list"
+LEAF_LIST: str = "leaf-list"
+LEAF: str = "leaf"
+
+NETCONF_NAMESPACE: str = "urn:ietf:params:xml:ns:netconf:base:1.0"
+
+# NETCONF edit-config operations.
+MERGE: str = "merge"
+REPLACE: str = "replace"
+DELETE: str = "delete"
+
+# Array typecodes of columns of columnar list nodes for each leaf value type,
+# values of other types are stored in lists.
+COLUMN_TYPECODES: dict = {int: "q", float: "d", bool: "b"}
+
+FUNCTION_TEMPLATE: str = "def {0}({1}):\n{2}"
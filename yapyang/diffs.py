@@ -0,0 +1,222 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import typing as t
+
+from yapyang.constants import (
+    CONTAINER,
+    DEFAULTS,
+    DELETE,
+    LEAF,
+    LEAF_LIST,
+    MERGE,
+    NETCONF_NAMESPACE,
+    REPLACE,
+    XML_ELEMENT_TEMPLATE,
+)
+from yapyang.utils import concatenate_xml_element_attrs
+
+__all__ = ("Change",)
+
+# Step of a change path, a tuple of node class and for list nodes the
+# entry otherwise None.
+Step = t.Tuple[t.Any, t.Any]
+
+
+class Change:
+    """Change of a YANG node between two trees."""
+
+    __slots__ = ("operation", "path", "cls", "kind", "value")
+
+    def __init__(
+        self,
+        operation: str,
+        path: t.Tuple[Step, ...],
+        cls: t.Any,
+        kind: str,
+        value: t.Any,
+        /,
+    ) -> None:
+        """Initializer that takes the NETCONF operation, the path of
+        parent steps, the class and kind of the changed node and the
+        value, which is the leaf node, the leaf list value or the list
+        entry."""
+
+        self.operation = operation
+        self.path = path
+        self.cls = cls
+        self.kind = kind
+        self.value = value
+
+    def __repr__(self) -> str:
+        """Returns representation of change with path identifiers."""
+
+        identifiers = "/".join(
+            cls.__meta__[DEFAULTS]["__identifier__"] for cls, _ in self.path
+        )
+        return (
+            f"{self.__class__.__name__}({self.operation!r}, "
+            f"{identifiers!r}, {self.cls.__name__})"
+        )
+
+
+def _diff_children(
+    cls: t.Any,
+    running: t.Any,
+    intended: t.Any,
+    path: t.Tuple[Step, ...],
+    changes: t.List[Change],
+    /,
+) -> None:
+    """Appends changes of children of class from running to intended."""
+
+    for cls_arg, child_cls, kind, _ in cls._cls_xml_renderer.elements.values():
+        old, new = getattr(running, cls_arg), getattr(intended, cls_arg)
+        if old is new:
+            # Subtrees shared by both trees are unchanged.
+            continue
+
+        if kind == LEAF:
+            if new is None:
+                # Optional leaves that become absent are deleted.
+                changes.append(Change(DELETE, path, child_cls, kind, old))
+            elif old != new:
+                changes.append(Change(REPLACE, path, child_cls, kind, new))
+        elif kind == CONTAINER:
+            _diff_children(
+                child_cls, old, new, (*path, (child_cls, None)), changes
+            )
+        elif kind == LEAF_LIST:
+            for value in old.entries:
+                if value not in new.entries:
+                    changes.append(
+                        Change(DELETE, path, child_cls, kind, value)
+                    )
+            for value in new.entries:
+                if value not in old.entries:
+                    changes.append(Change(MERGE, path, child_cls, kind, value))
+        else:
+            old_entries, new_entries = old._entries, new._entries
+            for key, entry in old_entries.items():
+                if key not in new_entries:
+                    changes.append(
+                        Change(DELETE, path, child_cls, kind, entry)
+                    )
+            for key, entry in new_entries.items():
+                if (old_entry := old_entries.get(key)) is None:
+                    changes.append(Change(MERGE, path, child_cls, kind, entry))
+                elif old_entry is not entry:
+                    _diff_children(
+                        child_cls,
+                        old_entry,
+                        entry,
+                        (*path, (child_cls, entry)),
+                        changes,
+                    )
+
+
+def diff(running: t.Any, intended: t.Any, /) -> t.List[Change]:
+    """Returns the minimal changes from running to intended, instances of
+    the same node class, depth-first. List entries are matched by key."""
+
+    if (cls := running.__class__) is not intended.__class__:
+        raise TypeError(
+            f"Expected instances of the same class, got {cls} and {intended.__class__}."
+        )
+
+    changes: t.List[Change] = list()
+    _diff_children(cls, running, intended, (), changes)
+    return changes
+
+
+def _iter_key_xml(cls: t.Any, entry: t.Any, /) -> t.Iterator[str]:
+    """Yields XML element of each key leaf of list entry."""
+
+    for cls_arg in cls.__meta__[DEFAULTS]["__key__"].split(","):
+        yield from getattr(entry, cls_arg)._iter_xml("")
+
+
+def _iter_change_xml(change: Change, element_attrs: str, /) -> t.Iterator[str]:
+    """Yields XML chunks of changed node, the node element contains
+    element attrs."""
+
+    cls, value = change.cls, change.value
+    renderer = cls._cls_xml_renderer
+    if (kind := change.kind) == LEAF:
+        yield from value._iter_xml(element_attrs)
+    elif kind == LEAF_LIST:
+        yield XML_ELEMENT_TEMPLATE.format(
+            renderer.identifier, element_attrs, renderer.encode(value)
+        )
+    else:
+        yield renderer.render_start_tag(element_attrs)
+        if change.operation == DELETE:
+            yield from _iter_key_xml(cls, value)
+        else:
+            yield from renderer.iter_children(value)
+        yield renderer.end_tag
+
+
+def iter_edit_config(
+    module_cls: t.Any,
+    changes: t.Iterable[Change],
+    /,
+    *,
+    target: str = "running",
+) -> t.Iterator[str]:
+    """Yields XML chunks of a NETCONF edit-config of changes to a module
+    of module class. Changed nodes contain an operation attribute, and
+    list entries on the path to a change contain their key leaves."""
+
+    xmlns = ""
+    if namespace := module_cls._cls_xml_renderer.namespace:
+        xmlns = concatenate_xml_element_attrs(dict(xmlns=namespace))
+
+    yield (
+        f'<edit-config xmlns="{NETCONF_NAMESPACE}" '
+        f'xmlns:nc="{NETCONF_NAMESPACE}">'
+        f"<target><{target}/></target><config>"
+    )
+    opened: t.List[Step] = list()
+    for change in changes:
+        path = change.path
+        common = 0
+        for (cls, entry), (opened_cls, opened_entry) in zip(path, opened):
+            if cls is not opened_cls or entry is not opened_entry:
+                break
+            common += 1
+
+        while len(opened) > common:
+            yield opened.pop()[0]._cls_xml_renderer.end_tag
+        for cls, entry in path[common:]:
+            yield cls._cls_xml_renderer.render_start_tag(
+                "" if opened else xmlns
+            )
+            if entry is not None:
+                yield from _iter_key_xml(cls, entry)
+            opened.append((cls, entry))
+
+        yield from _iter_change_xml(
+            change,
+            ("" if path else xmlns)
+            + concatenate_xml_element_attrs(
+                {"nc:operation": change.operation}
+            ),
+        )
+
+    while opened:
+        yield opened.pop()[0]._cls_xml_renderer.end_tag
+    yield "</config></edit-config>"
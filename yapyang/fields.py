@@ -0,0 +1,288 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import re
+import typing as t
+
+from yapyang.constants import ARGS, CONTAINER, DEFAULTS, LEAF, LEAF_LIST, LIST
+from yapyang.utils import JSONRenderer, XMLRenderer
+
+__all__ = ("Fields", "compile_fields", "parse_fields")
+
+# Token of a fields expression, an optionally prefixed identifier or a
+# separator.
+TOKEN = re.compile(r"\s*(?:(?:[^\W\d][\w.-]*:)?([^\W\d][\w.-]*)|([/();]))")
+# Kind of module classes, whose children are rendered without an element
+# of the module.
+MODULE = "module"
+# Number of compiled fields kept, the least recently used are evicted so
+# that distinct expressions do not grow memory without bound.
+CACHE_SIZE = 1024
+
+# Selected children by identifier, each the selection of its children or
+# None when every descendant is selected.
+Selection = t.Dict[str, t.Any]
+
+
+def _merge(
+    selection: Selection,
+    path: t.List[str],
+    children: t.Optional[Selection],
+    /,
+) -> None:
+    """Adds path of identifiers with selection of children of its last
+    node to selection. Nodes selected as a whole stay whole."""
+
+    *parents, identifier = path
+    for parent in parents:
+        if parent in selection and selection[parent] is None:
+            return
+        selection = selection.setdefault(parent, dict())
+    if children is None or selection.get(identifier, dict()) is None:
+        selection[identifier] = None
+        return
+    existing = selection.setdefault(identifier, dict())
+    for child, grandchildren in children.items():
+        _merge(existing, [child], grandchildren)
+
+
+def parse_fields(expression: str, /) -> Selection:
+    """Returns the selection of a RESTCONF (RFC 8040) fields expression,
+    such as interface(name;config/mtu);system/host-name. Module prefixes
+    of identifiers are ignored."""
+
+    tokens: t.List[str] = list()
+    end = 0
+    for match in TOKEN.finditer(expression):
+        if match.start() != end:
+            break
+        end = match.end()
+        tokens.append(match.group(1) or match.group(2))
+    if expression[end:].strip():
+        raise ValueError(f"Invalid fields {expression}.")
+    position = 0
+
+    def take(expected: t.Optional[str] = None) -> str:
+        nonlocal position
+        token = tokens[position] if position < len(tokens) else ""
+        is_identifier = token not in ("", "/", "(", ")", ";")
+        if (expected is None and not is_identifier) or (
+            expected is not None and token != expected
+        ):
+            raise ValueError(
+                f"Invalid fields {expression}, expected "
+                f"{expected or 'identifier'} at token {position + 1}."
+            )
+        position += 1
+        return token
+
+    def peek() -> str:
+        return tokens[position] if position < len(tokens) else ""
+
+    def parse_expression() -> Selection:
+        selection: Selection = dict()
+        while True:
+            path = [take()]
+            while peek() == "/":
+                take("/")
+                path.append(take())
+            children = None
+            if peek() == "(":
+                take("(")
+                children = parse_expression()
+                take(")")
+            _merge(selection, path, children)
+            if peek() != ";":
+                return selection
+            take(";")
+
+    selection = parse_expression()
+    if position != len(tokens):
+        raise ValueError(
+            f"Invalid fields {expression}, unexpected {tokens[position]}."
+        )
+    return selection
+
+
+class Fields:
+    """Plan of the selected children of a node class, with XML and JSON
+    renderers of only the selected children, see compile_fields."""
+
+    __slots__ = ("kind", "xml", "json")
+
+    def __init__(
+        self, cls: t.Any, selection: Selection, expression: str, /
+    ) -> None:
+        """Initializer that compiles selection of children of class, from
+        fields expression, raises ValueError when a selected node is not
+        a child. List entries always select their key leaves."""
+
+        # Nodes import this module.
+        from yapyang.nodes import LeafListNode, LeafNode, ListNode, ModuleNode
+
+        if issubclass(cls, (LeafNode, LeafListNode)):
+            raise ValueError(
+                f"Invalid fields {expression}, {cls.__name__} has no children."
+            )
+        self.kind = CONTAINER
+        if issubclass(cls, ModuleNode):
+            self.kind = MODULE
+        elif issubclass(cls, ListNode):
+            self.kind = LIST
+
+        xml_renderer: XMLRenderer = cls._cls_xml_renderer
+        json_renderer: JSONRenderer = cls._cls_json_renderer
+        elements = xml_renderer.elements
+        selected = dict()
+        for identifier, children in selection.items():
+            if (element := elements.get(identifier)) is None:
+                raise ValueError(
+                    f"Unknown node {identifier} of {cls.__name__} in "
+                    f"fields {expression}."
+                )
+            if children and element[2] in (LEAF, LEAF_LIST):
+                raise ValueError(
+                    f"Invalid fields {expression}, {identifier} has no "
+                    "children."
+                )
+            selected[element[0]] = (element[1], children)
+        if self.kind == LIST and selected:
+            for key_arg in cls.__meta__[DEFAULTS]["__key__"].split(","):
+                selected[key_arg] = (cls.__meta__[ARGS][key_arg], None)
+
+        # Renderer children are in the order of args, JSON renderer
+        # children of node args only.
+        xml_children = dict(zip(cls.__meta__[ARGS], xml_renderer.children))
+        json_children = dict(
+            zip(
+                (element[0] for element in elements.values()),
+                json_renderer.children,
+            )
+        )
+        xml_plan = list()
+        json_plan = list()
+        for cls_arg in cls.__meta__[ARGS]:
+            if cls_arg not in selected:
+                continue
+            child_cls, children = selected[cls_arg]
+            xml_child, json_child = (
+                xml_children[cls_arg],
+                json_children[cls_arg],
+            )
+            if children:
+                child = Fields(child_cls, children, expression)
+                accessor = _view_accessor(xml_child[0], child)
+                xml_child = (accessor, xml_child[1], None, None, None)
+                json_child = (accessor, json_child[1], None, json_child[3])
+            xml_plan.append(xml_child)
+            json_plan.append(json_child)
+
+        self.xml = XMLRenderer(
+            xml_renderer.identifier,
+            tuple(xml_plan),
+            elements,
+            namespace=xml_renderer.namespace,
+        )
+        self.json = JSONRenderer(tuple(json_plan))
+
+    def iter_xml(self, node: t.Any, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from the selected descendants of
+        node, node elements contain element attrs."""
+
+        return View(node, self)._iter_xml(element_attrs)
+
+    def iter_json(self, node: t.Any, /) -> t.Iterator[str]:
+        """Yields JSON chunks depth-first from the selected descendants of
+        node."""
+
+        return View(node, self)._iter_json()
+
+
+class View:
+    """Node rendered with the selected children of fields only. Caches of
+    node are neither used nor changed."""
+
+    __slots__ = ("node", "fields")
+
+    def __init__(self, node: t.Any, fields: Fields, /) -> None:
+        """Initializer that takes the node and fields of its class."""
+
+        self.node = node
+        self.fields = fields
+
+    def _is_empty(self) -> bool:
+        """Returns True when node has no entries."""
+
+        return self.node._is_empty()
+
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from node, see ModuleNode,
+        ContainerNode and ListNode."""
+
+        renderer = self.fields.xml
+        kind = self.fields.kind
+        if kind == MODULE:
+            yield from renderer.iter_module_children(self.node, element_attrs)
+        elif kind == LIST:
+            start_tag = renderer.render_start_tag(element_attrs)
+            for entry in self.node.entries:
+                yield start_tag
+                yield from renderer.iter_children(entry)
+                yield renderer.end_tag
+        else:
+            yield renderer.render_start_tag(element_attrs)
+            yield from renderer.iter_children(self.node)
+            yield renderer.end_tag
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON chunks depth-first from node, see ModuleNode,
+        ContainerNode and ListNode."""
+
+        iter_members = self.fields.json.iter_members
+        if self.fields.kind != LIST:
+            yield "{"
+            yield from iter_members(self.node)
+            yield "}"
+            return
+        separator = "["
+        for entry in self.node.entries:
+            yield f"{separator}{{"
+            yield from iter_members(entry)
+            yield "}"
+            separator = ","
+        yield "]" if separator == "," else "[]"
+
+
+def _view_accessor(
+    accessor: t.Callable[[t.Any], t.Any], fields: Fields, /
+) -> t.Callable[[t.Any], View]:
+    """Returns an accessor of the view of the child that accessor
+    returns, rendered with the selected children of fields."""
+
+    def view_accessor(instance: t.Any) -> View:
+        return View(accessor(instance), fields)
+
+    return view_accessor
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def compile_fields(cls: t.Any, expression: str, /) -> Fields:
+    """Returns the fields of expression compiled against node class, the
+    most recently used fields are reused for every instance, see
+    CACHE_SIZE."""
+
+    return Fields(cls, parse_fields(expression), expression)
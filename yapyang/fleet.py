@@ -0,0 +1,181 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import collections
+import concurrent.futures
+import itertools
+import os
+import typing as t
+
+if t.TYPE_CHECKING:
+    from yapyang.nodes import Node
+
+__all__ = ("render_many", "render_as_completed")
+
+# Serializer method of nodes for each format.
+FORMATS: t.Dict[str, str] = dict(xml="to_xml", json="to_json")
+# Chunks submitted to the pool per worker and not yet yielded, which
+# bounds the items and payloads held in memory.
+CHUNKS_PER_WORKER = 2
+
+
+def _render_chunk(
+    method: str,
+    build: t.Optional[t.Callable[[t.Any], "Node"]],
+    items: t.List[t.Any],
+    /,
+) -> t.List[str]:
+    """Returns the payload of each node, or node built from each item,
+    rendered by method. Runs in worker processes."""
+
+    nodes = items if build is None else map(build, items)
+    return [getattr(node, method)() for node in nodes]
+
+
+def _iter_chunks(
+    items: t.Iterable[t.Any], chunk_size: int, /
+) -> t.Iterator[t.List[t.Any]]:
+    """Yields lists of up to chunk size items."""
+
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _window(workers: t.Optional[int], /) -> int:
+    """Returns the number of chunks kept in flight for workers, one per
+    CPU when None."""
+
+    return CHUNKS_PER_WORKER * (workers or os.cpu_count() or 1)
+
+
+def _resolve_method(format: str, chunk_size: int, /) -> str:
+    """Returns the serializer method for format, and checks chunk size."""
+
+    if (method := FORMATS.get(format)) is None:
+        raise ValueError(
+            f"Expected format of {', '.join(FORMATS)}, got {format}."
+        )
+    if chunk_size < 1:
+        raise ValueError(
+            f"Expected chunk size of 1 or more, got {chunk_size}."
+        )
+    return method
+
+
+def _iter_as_completed(
+    items: t.Iterable[t.Any],
+    method: str,
+    build: t.Optional[t.Callable[[t.Any], "Node"]],
+    workers: t.Optional[int],
+    chunk_size: int,
+    /,
+) -> t.Iterator[t.Tuple[int, str]]:
+    """Yields the index and payload of each item as chunks complete. A
+    bounded window of chunks is in flight, refilled as chunks complete."""
+
+    if workers == 1:
+        yield from enumerate(_iter_in_order(items, method, build, 1, 1))
+        return
+
+    window = _window(workers)
+    chunks = _iter_chunks(items, chunk_size)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures: t.Dict[concurrent.futures.Future, int] = dict()
+        start = 0
+        while True:
+            for chunk in itertools.islice(chunks, window - len(futures)):
+                future = executor.submit(_render_chunk, method, build, chunk)
+                futures[future] = start
+                start += len(chunk)
+            if not futures:
+                return
+            done, _ = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                yield from enumerate(future.result(), futures.pop(future))
+
+
+def _iter_in_order(
+    items: t.Iterable[t.Any],
+    method: str,
+    build: t.Optional[t.Callable[[t.Any], "Node"]],
+    workers: t.Optional[int],
+    chunk_size: int,
+    /,
+) -> t.Iterator[str]:
+    """Yields the payload of each item in the order of items. A bounded
+    window of chunks is in flight, refilled as payloads are yielded."""
+
+    if workers == 1:
+        for chunk in _iter_chunks(items, chunk_size):
+            yield from _render_chunk(method, build, chunk)
+        return
+
+    chunks = _iter_chunks(items, chunk_size)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = collections.deque(
+            executor.submit(_render_chunk, method, build, chunk)
+            for chunk in itertools.islice(chunks, _window(workers))
+        )
+        while futures:
+            payloads = futures.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                futures.append(
+                    executor.submit(_render_chunk, method, build, chunk)
+                )
+            yield from payloads
+
+
+def render_as_completed(
+    items: t.Iterable[t.Any],
+    /,
+    format: str = "xml",
+    *,
+    build: t.Optional[t.Callable[[t.Any], "Node"]] = None,
+    workers: t.Optional[int] = None,
+    chunk_size: int = 64,
+) -> t.Iterator[t.Tuple[int, str]]:
+    """Returns an iterator of the index and payload of each item rendered
+    in format, xml or json, as chunks of items complete in a pool of
+    worker processes, one per CPU unless workers is given. Items are
+    nodes, or the arguments of build, a function that returns the node
+    of an item in the worker. Shipping compact items to build is cheaper
+    than shipping nodes, which are pickled and rebuilt by the workers.
+    Items and build are pickled, so classes and build must be
+    importable. When workers is 1 items are rendered in the current
+    process. Items are consumed as chunks are submitted, at most
+    CHUNKS_PER_WORKER chunks per worker ahead of the payloads yielded."""
+
+    method = _resolve_method(format, chunk_size)
+    return _iter_as_completed(items, method, build, workers, chunk_size)
+
+
+def render_many(
+    items: t.Iterable[t.Any],
+    /,
+    format: str = "xml",
+    *,
+    build: t.Optional[t.Callable[[t.Any], "Node"]] = None,
+    workers: t.Optional[int] = None,
+    chunk_size: int = 64,
+) -> t.Iterator[str]:
+    """Returns an iterator of the payload of each item rendered in format,
+    xml or json, in the order of items. See render_as_completed."""
+
+    method = _resolve_method(format, chunk_size)
+    return _iter_in_order(items, method, build, workers, chunk_size)
@@ -0,0 +1,269 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import atexit
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import threading
+import types
+import typing as t
+
+from yapyang import constants, nodes, utils
+from yapyang.constants import ANNOTATIONS, ARGS, DEFAULTS, IDENTIFIER
+from yapyang.nodes import (
+    ContainerNode,
+    LeafListNode,
+    LeafNode,
+    ListNode,
+    ModuleNode,
+    NodeMeta,
+)
+
+__all__ = ("lazy_classes", "ClassCache", "register_class_cache")
+
+# Spec of a node class, the base class name, identifier, metadata
+# attributes without dunders, and for each arg the annotation name, the
+# value of the default leaf or None, and whether the leaf is optional.
+Spec = t.Tuple[
+    str,
+    str,
+    t.Dict[str, str],
+    t.Tuple[t.Tuple[str, str, t.Any, bool], ...],
+]
+
+# Base classes and leaf value types that specs refer to by name.
+NAMES: t.Dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        ModuleNode,
+        ContainerNode,
+        ListNode,
+        LeafListNode,
+        LeafNode,
+        str,
+        int,
+        float,
+        bool,
+    )
+}
+# Types of default values written into class caches as they are, other
+# defaults are taken from class namespaces.
+LITERALS = (str, int, float, bool)
+# Modules whose sources determine the metadata and initializers of node
+# classes, and so whether class caches are valid.
+FINGERPRINTED = (constants, nodes, utils, sys.modules[__name__])
+
+# Class caches of this process, written on exit when changed.
+_caches: t.List["ClassCache"] = list()
+# Content hash of fingerprinted modules, computed once.
+_sources_digest: t.Optional[str] = None
+
+
+def lazy_classes(
+    namespace: t.Dict[str, t.Any], specs: t.Dict[str, Spec], /
+) -> t.Tuple[t.Callable[[str], t.Any], t.Callable[[], t.List[str]]]:
+    """Returns module __getattr__ and __dir__ functions for the module of
+    namespace, that build the node class of each spec by name on first
+    access, children first, and store it in namespace. Importing a module
+    of many classes then only costs reading their specs."""
+
+    module = namespace["__name__"]
+    # Classes may be accessed concurrently, and build their children.
+    lock = threading.RLock()
+
+    def resolve(name: str, /) -> t.Any:
+        if (cls := namespace.get(name)) is None:
+            cls = NAMES.get(name) or build(name)
+        return cls
+
+    def build(name: str, /) -> t.Any:
+        with lock:
+            if (cls := namespace.get(name)) is not None:
+                return cls
+            base, identifier, metadata, fields = specs[name]
+            annotations = dict()
+            body: t.Dict[str, t.Any] = dict(
+                __module__=module,
+                __qualname__=name,
+                **{IDENTIFIER: identifier},
+                **{f"__{attr}__": value for attr, value in metadata.items()},
+            )
+            for cls_arg, annotation, default, optional in fields:
+                annotations[cls_arg] = resolve(annotation)
+                if optional:
+                    body[cls_arg] = None
+                elif default is not None:
+                    body[cls_arg] = annotations[cls_arg](default)
+            body[ANNOTATIONS] = annotations
+            cls = namespace[name] = NodeMeta(name, (NAMES[base],), body)
+            return cls
+
+    def __getattr__(name: str) -> t.Any:
+        """Returns the node class of name, built on first access."""
+
+        if name not in specs:
+            raise AttributeError(
+                f"module {module!r} has no attribute {name!r}"
+            )
+        return build(name)
+
+    def __dir__() -> t.List[str]:
+        """Returns names of module, including classes not built yet."""
+
+        return sorted({*namespace, *specs})
+
+    return __getattr__, __dir__
+
+
+def _fingerprint(digest: str, /) -> str:
+    """Returns the fingerprint of class caches of a module with source
+    digest, which changes with yapyang sources and Python bytecode."""
+
+    global _sources_digest
+
+    if _sources_digest is None:
+        sources = hashlib.sha256()
+        for module in FINGERPRINTED:
+            with open(module.__file__ or "", "rb") as file:
+                sources.update(file.read())
+        _sources_digest = sources.hexdigest()
+    return hashlib.sha256(
+        f"{digest}\0{_sources_digest}\0{sys.implementation.cache_tag}".encode()
+    ).hexdigest()
+
+
+class ClassCache:
+    """Finalized metadata of node classes of a module, and code of their
+    generated functions, written to path and reused by later processes
+    while the fingerprint matches. Classes found in the cache skip
+    metadata construction and validation."""
+
+    __slots__ = ("path", "fingerprint", "classes", "codes", "written")
+
+    def __init__(self, path: str, digest: str, /) -> None:
+        """Initializer that reads the cache at path, or starts an empty
+        cache when it is missing, unreadable or of another fingerprint."""
+
+        self.path = path
+        self.fingerprint = _fingerprint(digest)
+        self.classes: t.Dict[str, t.Tuple[t.Any, ...]] = dict()
+        self.codes: t.Dict[str, types.CodeType] = dict()
+        try:
+            with open(path, "rb") as file:
+                fingerprint, classes, codes = marshal.loads(file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        else:
+            if fingerprint == self.fingerprint:
+                self.classes, self.codes = classes, codes
+        # Sizes of the cache when last read or written.
+        self.written = (len(self.classes), len(self.codes))
+
+    def rehydrate(
+        self, cls_name: str, namespace: t.Dict[str, t.Any], /
+    ) -> bool:
+        """Returns True when the metadata of class is cached, after
+        setting it in namespace as NodeMeta would. Arg annotations and
+        namespace defaults are taken from namespace."""
+
+        if (frozen := self.classes.get(cls_name)) is None:
+            return False
+        items, cls_args, defaults, slots = frozen
+        annotations = namespace.get(ANNOTATIONS) or dict()
+        if any(cls_arg not in annotations for cls_arg in cls_args) or any(
+            value is None and attr not in namespace for attr, value in defaults
+        ):
+            return False
+
+        metadata: t.Dict[str, t.Any] = dict()
+        for attr, name in items:
+            metadata[attr] = NAMES[name] if name else None
+        metadata[ARGS] = {
+            cls_arg: annotations[cls_arg] for cls_arg in cls_args
+        }
+        metadata[DEFAULTS] = {
+            attr: namespace.pop(attr, value) for attr, value in defaults
+        }
+        namespace.pop(ANNOTATIONS, None)
+        namespace["__meta__"] = metadata
+        namespace["__slots__"] = slots
+        namespace["_cls_meta"] = metadata
+        return True
+
+    def freeze(self, cls_name: str, namespace: t.Dict[str, t.Any], /) -> None:
+        """Adds the finalized metadata of class namespace to the cache,
+        unless its metadata types are not NAMES."""
+
+        metadata = namespace["__meta__"]
+        items = list()
+        for attr, value in metadata.items():
+            if attr in (ARGS, DEFAULTS):
+                items.append((attr, ""))
+            elif NAMES.get(name := getattr(value, "__name__", "")) is value:
+                items.append((attr, name))
+            else:
+                return
+        self.classes[cls_name] = (
+            tuple(items),
+            tuple(metadata[ARGS]),
+            tuple(
+                (attr, value if type(value) in LITERALS else None)
+                for attr, value in metadata[DEFAULTS].items()
+            ),
+            namespace["__slots__"],
+        )
+
+    def write(self) -> None:
+        """Writes the cache to path when classes or codes were added,
+        atomically, so that concurrent processes never read a partial
+        cache."""
+
+        if (written := (len(self.classes), len(self.codes))) == self.written:
+            return
+        directory = os.path.dirname(self.path) or "."
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            marshal.dump((self.fingerprint, self.classes, self.codes), file)
+        os.replace(temporary, self.path)
+        self.written = written
+
+
+def register_class_cache(
+    module_name: str, path: str, digest: str, /
+) -> ClassCache:
+    """Returns the class cache at path of the module with name and source
+    digest, used by NodeMeta for classes of the module from now on, see
+    ClassCache. The cache is written on exit when changed, which includes
+    classes of lazy modules built after import."""
+
+    cache = nodes._class_caches[module_name] = ClassCache(path, digest)
+    _caches.append(cache)
+    return cache
+
+
+@atexit.register
+def _write_caches() -> None:
+    """Writes changed class caches of this process."""
+
+    for cache in _caches:
+        try:
+            cache.write()
+        except OSError:
+            # Caches are optional, and rebuilt by later processes.
+            pass
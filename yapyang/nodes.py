@@ -14,32 +14,373 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import array
+import collections
+import functools
+import operator
+import sys
 import typing as t
+import weakref
 
 from ordered_set import OrderedSet
 
 from yapyang.constants import (
     ANNOTATIONS,
     ARGS,
+    COLUMN_TYPECODES,
+    CONTAINER,
     DEFAULTS,
     IDENTIFIER,
+    JSON_MEMBER_TEMPLATE,
+    JSON_QUALIFIED_MEMBER_TEMPLATE,
+    LEAF,
+    LEAF_LIST,
+    LIST,
+    NAMESPACE,
     UNSET,
     XML_ELEMENT_TEMPLATE,
+    XML_END_TAG_TEMPLATE,
+    XML_START_TAG_TEMPLATE,
 )
+from yapyang.binary import dumps, loads
+from yapyang.diffs import Change, diff, iter_edit_config
+from yapyang.fields import compile_fields
+from yapyang.parsers import (
+    JSONTreeBuilder,
+    LazyJSONTreeBuilder,
+    LazyXMLTreeBuilder,
+    XMLTreeBuilder,
+)
+from yapyang.queries import compile_query
 from yapyang.utils import (
+    JSONRenderer,
     MetaInfo,
+    XMLRenderer,
     concatenate_xml_element_attrs,
+    create_function,
+    is_optional_arg,
+    retrieve_json_value_encoder,
+    retrieve_leaf_value_accessor,
+    retrieve_value_parser,
     retrieve_xml_element_attrs,
+    retrieve_xml_value_encoder,
 )
 
+if t.TYPE_CHECKING:
+    from yapyang.loading import ClassCache
+
 __all__ = (
     "ModuleNode",
     "ContainerNode",
     "ListNode",
+    "ColumnarListNode",
     "LeafListNode",
     "LeafNode",
 )
 
+# Class caches of modules loaded with precomputed metadata, by module
+# name, see loading.ClassCache.
+_class_caches: t.Dict[str, "ClassCache"] = dict()
+
+
+def _attach(node: t.Any, parent: t.Any, /) -> None:
+    """Attaches node to parent, so that changes of node mark parent dirty.
+    Nodes given to several parents keep a list of parents."""
+
+    if (
+        current := getattr(node, "_parent", None)
+    ) is None or current is parent:
+        object.__setattr__(node, "_parent", parent)
+    elif type(current) is list:
+        if not any(other is parent for other in current):
+            current.append(parent)
+    else:
+        object.__setattr__(node, "_parent", [current, parent])
+
+
+def _attach_frozen(node: t.Any, copy: t.Any, /) -> None:
+    """Attaches node to copy, a frozen copy of a parent of node, by weak
+    reference, so that snapshots that are no longer referenced are freed.
+    References of freed copies are dropped."""
+
+    if (current := getattr(node, "_parent", None)) is None:
+        object.__setattr__(node, "_parent", weakref.ref(copy))
+        return
+    if type(current) is not list:
+        current = [current]
+        object.__setattr__(node, "_parent", current)
+    current[:] = [
+        other
+        for other in current
+        if type(other) is not weakref.ref or other() is not None
+    ]
+    current.append(weakref.ref(copy))
+
+
+def _mark_dirty(node: t.Any, /) -> None:
+    """Marks node and ancestors dirty, which drops the cached fragments of
+    list entries. Nodes are clean once serialized, and ancestors of a
+    dirty node are dirty, therefore marking stops at dirty nodes."""
+
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ListEntry):
+            if (
+                getattr(node, "_xml", None) is None
+                and getattr(node, "_json", None) is None
+            ):
+                continue
+            object.__setattr__(node, "_xml", None)
+            object.__setattr__(node, "_json", None)
+        elif getattr(node, "_clean", False):
+            object.__setattr__(node, "_clean", False)
+        else:
+            continue
+        nodes.extend(_iter_parents(node))
+
+
+def _copy_default(node: t.Any, /) -> t.Any:
+    """Returns a copy of default node of an arg, so that each instance
+    given the default changes and attaches a node of its own. Leaf nodes
+    are immutable and shared."""
+
+    if not isinstance(node, Node) or isinstance(node, LeafNode):
+        return node
+    cls = node.__class__
+    copy = cls.__new__(cls)
+    if isinstance(node, ColumnarListNode):
+        copy.__init__()
+        copy._append_columns(list(map(list, node._iter_columns())))
+    elif isinstance(node, ListNode):
+        copy.__init__()
+        for key, entry in node._entries.items():
+            entry_copy = node._cls_entry(
+                *(
+                    _copy_default(getattr(entry, attr))
+                    for attr in entry.__slots__
+                )
+            )
+            object.__setattr__(entry_copy, "_parent", copy)
+            copy._entries[key] = entry_copy
+    elif isinstance(node, LeafListNode):
+        copy.__init__()
+        copy.entries.update(node.entries)
+    else:
+        for cls_arg in cls._cls_meta[ARGS]:
+            value = _copy_default(getattr(node, cls_arg))
+            object.__setattr__(copy, cls_arg, value)
+            if isinstance(value, Node) and not isinstance(value, LeafNode):
+                _attach(value, copy)
+    return copy
+
+
+# Cached XML and JSON of clean list entries of classes that do not cache
+# entries, see ListNode.__cache__.
+_UNCACHED_XML: t.Tuple[str, ...] = ()
+_UNCACHED_JSON = ""
+
+# Version of the latest snapshot, nodes stamped with the current version are
+# not shared with any snapshot, and snapshot nodes are stamped frozen.
+_snapshot_version = 0
+_FROZEN = -1
+
+
+def _iter_parents(node: t.Any, /) -> t.Iterator[t.Any]:
+    """Yields the parents of node that are still referenced, see _attach
+    and _attach_frozen."""
+
+    if (parent := getattr(node, "_parent", None)) is None:
+        return
+    for other in tuple(parent) if type(parent) is list else (parent,):
+        if type(other) is weakref.ref and (other := other()) is None:
+            continue
+        yield other
+
+
+def _detach(node: t.Any, parent: t.Any, /) -> None:
+    """Detaches node from parent, see _attach. References of freed frozen
+    parents are dropped."""
+
+    if (current := getattr(node, "_parent", None)) is None:
+        return
+    parents = list()
+    for other in current if type(current) is list else (current,):
+        referent = other() if type(other) is weakref.ref else other
+        if referent is not None and referent is not parent:
+            parents.append(other)
+    if len(parents) < 2:
+        object.__setattr__(node, "_parent", parents[0] if parents else None)
+    else:
+        object.__setattr__(node, "_parent", parents)
+
+
+def _replace_child(parent: t.Any, node: t.Any, copy: t.Any, /) -> None:
+    """Replaces node with copy in each arg of parent that holds node."""
+
+    if isinstance(parent, ListEntry):
+        cls_args: t.Iterable[str] = parent.__slots__
+    else:
+        cls_args = parent._cls_meta[ARGS]
+    for cls_arg in cls_args:
+        if getattr(parent, cls_arg) is node:
+            object.__setattr__(parent, cls_arg, copy)
+    _detach(node, parent)
+
+
+def _prepare_write(node: t.Any, /) -> None:
+    """Prepares node for a change. Snapshot nodes are immutable, and the
+    snapshots that share node are given a copy of node first, therefore a
+    snapshot costs memory proportional to the nodes that change after it
+    is taken and references to the changed node stay valid."""
+
+    if (version := getattr(node, "_version", 0)) == _snapshot_version:
+        return
+    if version == _FROZEN:
+        raise TypeError(
+            f"{node.__class__.__name__} belongs to a snapshot and is immutable."
+        )
+
+    snapshot_lists: t.List[t.Any] = list()
+    frozen: t.List[t.Any] = list()
+    if isinstance(node, ListEntry):
+        if (parent := getattr(node, "_parent", None)) is not None:
+            # Snapshots reach entries through frozen copies of the parent.
+            _prepare_write(parent)
+            key = node._key(node)
+            snapshot_lists = [
+                snapshot_list
+                for snapshot_list in parent._iter_snapshots()
+                if snapshot_list._entries.get(key) is node
+            ]
+    else:
+        # Snapshots that reach node through a shared parent reference node
+        # from a frozen copy of the parent once the parent is prepared.
+        for parent in _iter_parents(node):
+            if getattr(parent, "_version", 0) != _FROZEN:
+                _prepare_write(parent)
+        frozen = [
+            parent
+            for parent in _iter_parents(node)
+            if getattr(parent, "_version", 0) == _FROZEN
+        ]
+
+    if frozen or snapshot_lists:
+        copy = node._snapshot_copy()
+        for parent in frozen:
+            _replace_child(parent, node, copy)
+        for snapshot_list in snapshot_lists:
+            snapshot_list._entries[key] = copy
+    object.__setattr__(node, "_version", _snapshot_version)
+
+
+# State of lazily parsed nodes, besides args, that is built on first access.
+_LAZY_STATE = frozenset(
+    ("_entries", "_columns", "_index", "_version", "_shared")
+)
+
+
+def _materialize(node: t.Any, /) -> None:
+    """Builds the args or entries of lazily parsed node in place from its
+    source, node becomes an instance of its node class."""
+
+    source = node._lazy
+    lazy_cls = node.__class__
+    object.__setattr__(node, "_lazy", None)
+    object.__setattr__(node, "__class__", lazy_cls.__base__)
+    try:
+        source.materialize(node)
+    except BaseException:
+        # Node stays lazy, so that each access raises.
+        object.__setattr__(node, "__class__", lazy_cls)
+        object.__setattr__(node, "_lazy", source)
+        raise
+
+
+def _is_lazy_instance(value: t.Any, annotation: t.Any, /) -> bool:
+    """Returns True when value is a lazily parsed instance of annotation,
+    which is built on first access."""
+
+    return type(value) is getattr(annotation, "__dict__", {}).get("_cls_lazy")
+
+
+def _lazy_getattr(self: t.Any, name: str, /) -> t.Any:
+    """Returns attribute of lazily parsed instance, args and entries are
+    built on first access."""
+
+    if name not in _LAZY_STATE and name not in self._cls_meta[ARGS]:
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+    _materialize(self)
+    return getattr(self, name)
+
+
+def _lazy_iter_xml(self: t.Any, element_attrs: str, /) -> t.Iterator[str]:
+    """Yields XML elements of lazily parsed instance verbatim from source
+    when source is XML with the start tags instance renders, otherwise
+    builds instance first."""
+
+    start_tag = self._cls_xml_renderer.render_start_tag(element_attrs)
+    if (raw := self._lazy.raw_xml(start_tag)) is not None:
+        yield raw
+        return
+    _materialize(self)
+    yield from self._iter_xml(element_attrs)
+
+
+def _lazy_iter_json(self: t.Any, /) -> t.Iterator[str]:
+    """Yields JSON value of lazily parsed instance verbatim from source
+    when source is JSON, otherwise builds instance first."""
+
+    if (raw := self._lazy.raw_json()) is not None:
+        yield raw
+        return
+    _materialize(self)
+    yield from self._iter_json()
+
+
+def _lazy_reduce_ex(self: t.Any, protocol: t.SupportsIndex, /) -> t.Any:
+    """Returns reduction of lazily parsed instance, which is built first
+    so that it pickles and copies as an instance of its node class."""
+
+    _materialize(self)
+    return self.__reduce_ex__(protocol)
+
+
+def _lazy_is_empty(self: t.Any, /) -> bool:
+    """Returns True when lazily parsed instance has no entries."""
+
+    return self._lazy.is_empty()
+
+
+class _Deferred:
+    """Class attribute constructed from its class on first access, which
+    then replaces the deferred attribute on the class, so that classes
+    that are never used only cost their metadata."""
+
+    __slots__ = ("construct", "cls", "name")
+
+    def __init__(self, construct: t.Callable[[t.Any], t.Any], /) -> None:
+        """Initializer that takes the function that constructs the
+        attribute from its class."""
+
+        self.construct = construct
+
+    def __set_name__(self, cls: t.Any, name: str) -> None:
+        """Records the class and name of the attribute."""
+
+        self.cls = cls
+        self.name = name
+
+    def __get__(self, instance: t.Any, owner: t.Any = None) -> t.Any:
+        """Constructs the attribute when deferred and returns it as looked
+        up on instance or owner."""
+
+        if self.cls.__dict__.get(self.name) is self:
+            type.__setattr__(self.cls, self.name, self.construct(self.cls))
+        return getattr(owner if instance is None else instance, self.name)
+
 
 class NodeMeta(type):
     """Metaclass for all YANG nodes."""
@@ -51,6 +392,12 @@ class NodeMeta(type):
         metadata: t.Dict[str, t.Any] = dict()
         args: t.Dict[str, t.Type[t.Any]] = dict()
         defaults: t.Dict[str, t.Any] = dict()
+        slots: t.List[str] = list(namespace.get("__slots__", ()))
+        # Args of list and leaf list classes belong to their entries, and
+        # must not shadow the attributes of instances.
+        arg_slots = namespace.get("_cls_arg_slots", True) and all(
+            getattr(base, "_cls_arg_slots", True) for base in bases
+        )
 
         # Inherit from parents (bases) meta.
         for base_meta in [base.__meta__ for base in bases[::-1]]:
@@ -65,6 +412,9 @@ class NodeMeta(type):
                 if attr.startswith("__") and attr.endswith("__"):
                     metadata[attr] = annotation
                 else:
+                    if arg_slots and attr not in args:
+                        # Inherited args already have a slot.
+                        slots.append(attr)
                     args[attr] = annotation
 
         for attr in list(namespace):
@@ -74,6 +424,8 @@ class NodeMeta(type):
         metadata[ARGS] = args
         metadata[DEFAULTS] = defaults
         namespace["__meta__"] = metadata
+        namespace["__slots__"] = tuple(slots)
+        namespace["_cls_meta"] = metadata
 
     @staticmethod
     def _meta_checker(cls_name: str, bases: tuple, metadata: dict, /) -> None:
@@ -85,6 +437,7 @@ class NodeMeta(type):
             "ModuleNode",
             "ContainerNode",
             "ListNode",
+            "ColumnarListNode",
             "LeafListNode",
             "LeafNode",
         ):
@@ -113,17 +466,414 @@ class NodeMeta(type):
                     if (default := default.default) is UNSET:
                         continue
                 annotation = metadata[ARGS][attr]
+                if default is None and NodeMeta._node_kind(annotation) == LEAF:
+                    # Leaves that default to None are optional.
+                    continue
 
             if (default_type := type(default)) is not annotation:
                 raise TypeError(
                     f"Expected default of type {annotation} for {attr}, got type {default_type}."
                 )
 
-    def __new__(cls, cls_name: str, bases: tuple, namespace: dict):
-        """Constructs class namespace metadata, and creates class object."""
+    @staticmethod
+    def _node_kind(annotation: t.Any, /) -> t.Optional[str]:
+        """Returns the kind of YANG node annotation is, or None when
+        annotation is not a node."""
+
+        if not isinstance(annotation, type):
+            return None
+        if issubclass(annotation, LeafNode):
+            return LEAF
+        if issubclass(annotation, LeafListNode):
+            return LEAF_LIST
+        if issubclass(annotation, ListNode):
+            return LIST
+        if issubclass(annotation, InitNode):
+            return CONTAINER
+        return None
+
+    @staticmethod
+    def _construct_xml_renderer(bases: tuple, namespace: dict, /) -> None:
+        """Constructs namespace XML renderer from metadata, so that
+        instances only serialize the values that change. Values of leaf
+        children are encoded per annotation."""
+
+        metadata = namespace["__meta__"]
+        if IDENTIFIER not in metadata[DEFAULTS]:
+            # Base classes are never serialized.
+            return
+
+        def construct(cls: t.Any, /) -> XMLRenderer:
+            element_attrs = ""
+            if xml_namespace := metadata[DEFAULTS].get(NAMESPACE):
+                element_attrs = concatenate_xml_element_attrs(
+                    dict(xmlns=xml_namespace)
+                )
+
+            children: t.List[tuple] = list()
+            elements: t.Dict[str, tuple] = dict()
+            for cls_arg, annotation in metadata[ARGS].items():
+                child_attrs = element_attrs + retrieve_xml_element_attrs(
+                    metadata, cls_arg
+                )
+                if kind := NodeMeta._node_kind(annotation):
+                    child_meta = annotation.__meta__
+                    child_identifier = child_meta[DEFAULTS][IDENTIFIER]
+                    parse_value = None
+                    if kind in (LEAF, LEAF_LIST):
+                        (value_annotation,) = child_meta[ARGS].values()
+                        parse_value = retrieve_value_parser(value_annotation)
+                    elements[child_identifier] = (
+                        cls_arg,
+                        annotation,
+                        kind,
+                        parse_value,
+                    )
+                if kind == LEAF:
+                    ((value_arg, value_annotation),) = child_meta[ARGS].items()
+                    children.append(
+                        (
+                            retrieve_leaf_value_accessor(
+                                cls_arg,
+                                value_arg,
+                                is_optional_arg(metadata, cls_arg),
+                            ),
+                            child_attrs,
+                            XML_START_TAG_TEMPLATE.format(
+                                child_identifier, child_attrs
+                            ),
+                            XML_END_TAG_TEMPLATE.format(child_identifier),
+                            retrieve_xml_value_encoder(value_annotation),
+                        )
+                    )
+                else:
+                    children.append(
+                        (
+                            operator.attrgetter(cls_arg),
+                            child_attrs,
+                            None,
+                            None,
+                            None,
+                        )
+                    )
+
+            renderer = XMLRenderer(
+                metadata[DEFAULTS][IDENTIFIER],
+                tuple(children),
+                elements,
+                namespace=xml_namespace,
+            )
+            if any(
+                issubclass(base, (LeafNode, LeafListNode)) for base in bases
+            ):
+                (value_annotation,) = metadata[ARGS].values()
+                renderer.encode = retrieve_xml_value_encoder(value_annotation)
+
+            return renderer
+
+        namespace["_cls_xml_renderer"] = _Deferred(construct)
+
+    @staticmethod
+    def _construct_json_renderer(bases: tuple, namespace: dict, /) -> None:
+        """Constructs namespace JSON renderer from metadata, member names
+        of module children are qualified by the module identifier."""
+
+        metadata = namespace["__meta__"]
+        if IDENTIFIER not in metadata[DEFAULTS]:
+            # Base classes are never serialized.
+            return
+
+        def construct(cls: t.Any, /) -> JSONRenderer:
+            module_identifier = None
+            if NAMESPACE in metadata:
+                module_identifier = metadata[DEFAULTS][IDENTIFIER]
+
+            children: t.List[tuple] = list()
+            for cls_arg, annotation in metadata[ARGS].items():
+                if not (kind := NodeMeta._node_kind(annotation)):
+                    continue
+                child_identifier = annotation.__meta__[DEFAULTS][IDENTIFIER]
+                if module_identifier:
+                    member = JSON_QUALIFIED_MEMBER_TEMPLATE.format(
+                        module_identifier, child_identifier
+                    )
+                else:
+                    member = JSON_MEMBER_TEMPLATE.format(child_identifier)
+                if kind == LEAF:
+                    ((value_arg, value_annotation),) = annotation.__meta__[
+                        ARGS
+                    ].items()
+                    children.append(
+                        (
+                            retrieve_leaf_value_accessor(
+                                cls_arg,
+                                value_arg,
+                                is_optional_arg(metadata, cls_arg),
+                            ),
+                            member,
+                            retrieve_json_value_encoder(value_annotation),
+                            False,
+                        )
+                    )
+                else:
+                    children.append(
+                        (
+                            operator.attrgetter(cls_arg),
+                            member,
+                            None,
+                            kind != CONTAINER,
+                        )
+                    )
+
+            renderer = JSONRenderer(tuple(children))
+            if any(
+                issubclass(base, (LeafNode, LeafListNode)) for base in bases
+            ):
+                (value_annotation,) = metadata[ARGS].values()
+                renderer.encode = retrieve_json_value_encoder(value_annotation)
+
+            return renderer
+
+        namespace["_cls_json_renderer"] = _Deferred(construct)
+
+    @staticmethod
+    def _construct_list_entry(
+        namespace: dict,
+        /,
+        *,
+        codes: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> None:
+        """Constructs namespace list entry class from metadata, with a
+        slot for each arg and a key accessor that returns the key value
+        of an entry or a tuple for composite keys. Compiled code is
+        reused from codes."""
+
+        metadata = namespace["__meta__"]
+        if "__key__" not in metadata[DEFAULTS]:
+            return
+
+        paths = list()
+        for cls_arg in metadata[DEFAULTS]["__key__"].split(","):
+            if (annotation := metadata[ARGS].get(cls_arg)) is None:
+                raise TypeError(f"Key {cls_arg} is not an argument.")
+            if is_optional_arg(metadata, cls_arg):
+                raise TypeError(f"Key {cls_arg} cannot be optional.")
+            if isinstance(annotation, type) and issubclass(
+                annotation, LeafNode
+            ):
+                (value_arg,) = annotation.__meta__[ARGS]
+                paths.append(f"{cls_arg}.{value_arg}")
+            else:
+                paths.append(cls_arg)
+
+        def construct(cls: t.Any, /) -> t.Type[ListEntry]:
+            cls_args = tuple(metadata[ARGS])
+            globals: t.Dict[str, t.Any] = dict()
+            body = NodeMeta._construct_attach_source(metadata, globals)
+            return type(
+                ListEntry.__name__,
+                (ListEntry,),
+                dict(
+                    __slots__=cls_args,
+                    __init__=create_function(
+                        "__init__",
+                        ("__self", *cls_args),
+                        body,
+                        globals=globals,
+                        qualname=f"{ListEntry.__name__}.__init__",
+                        codes=codes,
+                    ),
+                    _key=operator.attrgetter(*paths),
+                ),
+            )
+
+        namespace["_cls_entry"] = _Deferred(construct)
+
+    @staticmethod
+    def _construct_args_resolver_source(
+        metadata: t.Dict[str, t.Any],
+        globals: t.Dict[str, t.Any],
+        /,
+        *,
+        coerce: bool = False,
+    ) -> t.List[str]:
+        """Returns source lines that resolve and type check the parameters
+        of a function with a fixed signature of metadata args, adds the
+        names used by the lines to globals. When coerce is True values
+        of leaf node args that are not leaf nodes are passed to the leaf
+        node initializer."""
+
+        body: t.List[str] = list()
+        given = " + ".join(
+            f"({cls_arg} is not __UNSET)" for cls_arg in metadata[ARGS]
+        )
+        body.append("if __extra:")
+        body.append(
+            "    __self._check_given_args_not_greater_than_expected("
+            f"len(__extra){f' + {given}' if given else ''})"
+        )
+        for cls_arg, annotation in metadata[ARGS].items():
+            globals[f"__type_{cls_arg}"] = annotation
+            default = metadata[DEFAULTS].get(cls_arg, UNSET)
+            if type(default) is MetaInfo:
+                default = default.default
+            body.append(f"if {cls_arg} is __UNSET:")
+            if default is UNSET:
+                body.append(
+                    "    raise TypeError("
+                    f'"Missing required argument: {cls_arg}")'
+                )
+            else:
+                globals[f"__default_{cls_arg}"] = default
+                body.append(f"    {cls_arg} = __default_{cls_arg}")
+            # Optional leaves may be given None.
+            optional = f"{cls_arg} is not None and " if default is None else ""
+            body.append(
+                f"elif {optional}type({cls_arg}) is not __type_{cls_arg} "
+                f"and not __is_lazy_instance({cls_arg}, __type_{cls_arg}):"
+            )
+            if (
+                coerce
+                and isinstance(annotation, type)
+                and issubclass(annotation, LeafNode)
+            ):
+                body.append(f"    {cls_arg} = __type_{cls_arg}({cls_arg})")
+            else:
+                body.append(
+                    "    raise TypeError(f'Expected argument of type "
+                    f"{{__type_{cls_arg}}} for {cls_arg}, got type "
+                    f"{{type({cls_arg})}}.')"
+                )
+
+        return body
 
-        cls._construct_meta(namespace, bases)
-        cls._meta_checker(cls_name, bases, namespace["__meta__"])
+    @staticmethod
+    def _construct_attach_source(
+        metadata: t.Dict[str, t.Any], globals: t.Dict[str, t.Any], /
+    ) -> t.List[str]:
+        """Returns source lines that set each metadata arg of __self and
+        attach node values to __self, adds the names used by the lines to
+        globals. Defaults of node args are copied for each instance, see
+        _copy_default."""
+
+        body: t.List[str] = list()
+        globals.update(
+            __setattr=object.__setattr__,
+            __attach=_attach,
+            __copy_default=_copy_default,
+        )
+        for cls_arg, annotation in metadata[ARGS].items():
+            if NodeMeta._node_kind(annotation) in (None, LEAF):
+                # Leaf nodes are immutable.
+                body.append(f'__setattr(__self, "{cls_arg}", {cls_arg})')
+                continue
+            default = metadata[DEFAULTS].get(cls_arg, UNSET)
+            if type(default) is MetaInfo:
+                default = default.default
+            if default is not UNSET:
+                globals[f"__default_{cls_arg}"] = default
+                body.append(f"if {cls_arg} is __default_{cls_arg}:")
+                body.append(f"    {cls_arg} = __copy_default({cls_arg})")
+            body.append(f'__setattr(__self, "{cls_arg}", {cls_arg})')
+            body.append(f"__attach({cls_arg}, __self)")
+
+        return body
+
+    @staticmethod
+    def _construct_initializer(
+        cls_name: str,
+        bases: tuple,
+        namespace: dict,
+        /,
+        *,
+        codes: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> None:
+        """Constructs namespace initializer from metadata, a function with
+        a fixed signature, pre-resolved defaults, and inline type checks
+        that replaces class meta args resolver for the class. Compiled
+        code is reused from codes."""
+
+        metadata = namespace["__meta__"]
+        if IDENTIFIER not in metadata[DEFAULTS]:
+            return
+
+        # Tuples of function name and coerce.
+        functions: t.Tuple[t.Tuple[str, bool], ...] = ()
+        if any(issubclass(base, InitNode) for base in bases):
+            functions = (("__init__", False),)
+        elif any(issubclass(base, ListNode) for base in bases):
+            functions = (
+                ("_create_entry", False),
+                ("_create_entry_from_row", True),
+            )
+        elif any(issubclass(base, LeafListNode) for base in bases):
+            functions = (("append", False),)
+
+        def construct(cls: t.Any, /, *, name: str, coerce: bool) -> t.Callable:
+            cls_args = tuple(metadata[ARGS])
+            globals: t.Dict[str, t.Any] = dict(
+                __UNSET=UNSET,
+                __is_lazy_instance=_is_lazy_instance,
+                __entry=getattr(cls, "_cls_entry", None),
+                __mark_dirty=_mark_dirty,
+                __prepare_write=_prepare_write,
+            )
+            body = NodeMeta._construct_args_resolver_source(
+                metadata, globals, coerce=coerce
+            )
+            if name == "__init__":
+                body.extend(
+                    NodeMeta._construct_attach_source(metadata, globals)
+                )
+            elif name == "append":
+                body.extend(
+                    (
+                        "__prepare_write(__self)",
+                        f"__self.entries.add({', '.join(cls_args)})",
+                        "__mark_dirty(__self)",
+                    )
+                )
+            else:
+                body.append(f"return __entry({', '.join(cls_args)})")
+
+            return create_function(
+                name,
+                (
+                    "__self",
+                    *(f"{cls_arg}=__UNSET" for cls_arg in cls_args),
+                    "*__extra",
+                ),
+                body,
+                globals=globals,
+                qualname=f"{cls_name}.{name}",
+                codes=codes,
+            )
+
+        for name, coerce in functions:
+            if name in namespace:
+                # Explicitly defined by class.
+                continue
+            namespace[name] = _Deferred(
+                functools.partial(construct, name=name, coerce=coerce)
+            )
+
+    def __new__(cls, cls_name: str, bases: tuple, namespace: dict):
+        """Constructs class namespace metadata, and creates class object.
+        Metadata of classes of modules with a class cache is rehydrated
+        from the cache when present, without validation. Renderers, list
+        entry classes and initializers are constructed on first access."""
+
+        cache = _class_caches.get(namespace.get("__module__", ""))
+        if cache is None or not cache.rehydrate(cls_name, namespace):
+            cls._construct_meta(namespace, bases)
+            cls._meta_checker(cls_name, bases, namespace["__meta__"])
+            if cache is not None:
+                cache.freeze(cls_name, namespace)
+        codes = None if cache is None else cache.codes
+        cls._construct_xml_renderer(bases, namespace)
+        cls._construct_json_renderer(bases, namespace)
+        cls._construct_list_entry(namespace, codes=codes)
+        cls._construct_initializer(cls_name, bases, namespace, codes=codes)
         return super().__new__(cls, cls_name, bases, namespace)
 
 
@@ -132,20 +882,108 @@ class Node(metaclass=NodeMeta):
 
     __identifier__: str
 
-    def __init__(self) -> None:
-        """Initializer that creates the mechanics for expected behavior."""
-
-        self._cls_meta: t.Dict[str, t.Any] = self.__class__.__meta__  # type: ignore
-        self._cls_identifier: str = self._cls_meta[DEFAULTS][IDENTIFIER]
+    if t.TYPE_CHECKING:
+        # Class attributes constructed by NodeMeta.
+        __meta__: t.ClassVar[t.Dict[str, t.Any]]
+        _cls_meta: t.ClassVar[t.Dict[str, t.Any]]
+        _cls_xml_renderer: t.ClassVar[XMLRenderer]
+        _cls_json_renderer: t.ClassVar[JSONRenderer]
 
     def __new__(cls, *args, **kwargs):
         """Prevents instances of Node or direct subclasses."""
 
-        if cls is Node or cls in Node.__subclasses__():
+        if cls is Node or Node in cls.__bases__:
             raise TypeError(
                 "Node or subclasses of cannot be directly instantiated."
             )
-        return super().__new__(cls)
+        return object.__new__(cls)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Sets attribute, changes of class meta args mark instance and
+        ancestors dirty. Instances of snapshots are immutable."""
+
+        if name not in self._cls_meta[ARGS]:
+            object.__setattr__(self, name, value)
+            return
+        _prepare_write(self)
+        object.__setattr__(self, name, value)
+        if isinstance(value, Node) and not isinstance(value, LeafNode):
+            _attach(value, self)
+        _mark_dirty(self)
+
+    def __getstate__(self) -> t.Any:
+        """Returns state of instance as values of class meta args, parents
+        attach their children when state is restored."""
+
+        return (
+            None,
+            {
+                cls_arg: getattr(self, cls_arg)
+                for cls_arg in self._cls_meta[ARGS]
+            },
+        )
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary encoding of instance, which is
+        smaller and faster than pickle for leaf values that marshal
+        supports. See binary.dumps."""
+
+        return dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, /) -> "Node":
+        """Returns a new instance from its compact binary encoding. See
+        binary.loads."""
+
+        return loads(data, cls)
+
+    def _snapshot_copy(self) -> "Node":
+        """Returns a frozen copy of instance that shares children with
+        instance."""
+
+        raise NotImplementedError
+
+    @classmethod
+    def _create_lazy(cls, source: t.Any, /) -> "Node":
+        """Returns an instance whose args or entries are built from
+        source, a parsers.LazySource, on first access. Until then the
+        instance is of a subclass that serializes source verbatim."""
+
+        if (lazy_cls := cls.__dict__.get("_cls_lazy")) is None:
+            lazy_cls = type.__new__(
+                type(cls),
+                cls.__name__,
+                (cls,),
+                dict(
+                    __slots__=(),
+                    __module__=cls.__module__,
+                    __qualname__=cls.__qualname__,
+                    __getattr__=_lazy_getattr,
+                    _iter_xml=_lazy_iter_xml,
+                    _iter_json=_lazy_iter_json,
+                    _is_empty=_lazy_is_empty,
+                    __reduce_ex__=_lazy_reduce_ex,
+                ),
+            )
+            setattr(cls, "_cls_lazy", lazy_cls)
+        node = object.__new__(lazy_cls)
+        object.__setattr__(node, "_lazy", source)
+        return node
+
+    def snapshot(self) -> "Node":
+        """Returns an immutable snapshot of instance that shares nodes with
+        instance. When instance changes, snapshots that share the changed
+        nodes are given a copy of them, so that a snapshot costs memory
+        proportional to the nodes that changed since it was taken. Nodes
+        of a snapshot that are still shared belong to instance."""
+
+        global _snapshot_version
+
+        if getattr(self, "_version", 0) == _FROZEN:
+            return self
+        copy = self._snapshot_copy()
+        _snapshot_version += 1
+        return copy
 
     def _cls_meta_args_resolver(
         self, args: tuple, kwargs: dict
@@ -170,9 +1008,15 @@ class Node(metaclass=NodeMeta):
                     is MetaInfo
                 ):
                     value = value.default
+                value = _copy_default(value)
             if value is UNSET:
                 raise TypeError(f"Missing required argument: {cls_arg}")
-            if (value_type := type(value)) is not annotation:
+            if value is None and is_optional_arg(self._cls_meta, cls_arg):
+                yield (cls_arg, value)
+                continue
+            if (
+                value_type := type(value)
+            ) is not annotation and not _is_lazy_instance(value, annotation):
                 # NOTE: Defaults are type checked twice.
                 raise TypeError(
                     f"Expected argument of type {annotation} for {cls_arg}, got type {value_type}."
@@ -188,6 +1032,95 @@ class Node(metaclass=NodeMeta):
                 f"{self.__class__.__name__} takes {expected} arguments, but {given} were given."
             )
 
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from instance, instance elements
+        contain concatenated element attrs."""
+
+        raise NotImplementedError
+
+    def iter_xml(
+        self,
+        /,
+        *,
+        attrs: t.Optional[t.Dict[str, str]] = None,
+        fields: t.Optional[str] = None,
+    ) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from instance. When attrs are
+        provided instance elements contain attrs. When fields, a RESTCONF
+        fields expression, are provided only the selected descendants
+        are visited, see fields.compile_fields."""
+
+        element_attrs = concatenate_xml_element_attrs(attrs)
+        if fields is not None:
+            return compile_fields(self.__class__, fields).iter_xml(
+                self, element_attrs
+            )
+        return self._iter_xml(element_attrs)
+
+    def to_xml(
+        self,
+        /,
+        *,
+        attrs: t.Optional[t.Dict[str, str]] = None,
+        fields: t.Optional[str] = None,
+    ) -> str:
+        """Returns an XML tree from instance. When attrs are provided
+        instance elements contain attrs. When fields are provided only
+        the selected descendants are rendered."""
+
+        return "".join(self.iter_xml(attrs=attrs, fields=fields))
+
+    def write_xml(
+        self,
+        sink: t.TextIO,
+        /,
+        *,
+        attrs: t.Optional[t.Dict[str, str]] = None,
+        fields: t.Optional[str] = None,
+    ) -> None:
+        """Writes an XML tree from instance into sink chunk by chunk,
+        sink is any object with a write method that accepts str. When
+        attrs are provided instance elements contain attrs. When fields
+        are provided only the selected descendants are written."""
+
+        write = sink.write
+        for chunk in self.iter_xml(attrs=attrs, fields=fields):
+            write(chunk)
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON chunks depth-first from instance."""
+
+        raise NotImplementedError
+
+    def iter_json(
+        self, /, *, fields: t.Optional[str] = None
+    ) -> t.Iterator[str]:
+        """Yields JSON (RFC 7951) chunks depth-first from instance. When
+        fields, a RESTCONF fields expression, are provided only the
+        selected descendants are visited, see fields.compile_fields."""
+
+        if fields is not None:
+            return compile_fields(self.__class__, fields).iter_json(self)
+        return self._iter_json()
+
+    def to_json(self, /, *, fields: t.Optional[str] = None) -> str:
+        """Returns a JSON (RFC 7951) text from instance. When fields are
+        provided only the selected descendants are rendered."""
+
+        return "".join(self.iter_json(fields=fields))
+
+    def write_json(
+        self, sink: t.TextIO, /, *, fields: t.Optional[str] = None
+    ) -> None:
+        """Writes a JSON (RFC 7951) text from instance into sink chunk by
+        chunk, sink is any object with a write method that accepts str.
+        When fields are provided only the selected descendants are
+        written."""
+
+        write = sink.write
+        for chunk in self.iter_json(fields=fields):
+            write(chunk)
+
 
 class InitNode(Node):
     """Base class for YANG nodes that initialize with args."""
@@ -198,109 +1131,1054 @@ class InitNode(Node):
 
         super().__init__()
         for cls_arg, value in self._cls_meta_args_resolver(args, kwargs):
-            setattr(self, cls_arg, value)
+            object.__setattr__(self, cls_arg, value)
+            if isinstance(value, Node) and not isinstance(value, LeafNode):
+                _attach(value, self)
+
+    def _snapshot_copy(self) -> "InitNode":
+        """Returns a frozen copy of instance that shares children with
+        instance."""
+
+        copy = self.__class__.__new__(self.__class__)
+        for cls_arg in self._cls_meta[ARGS]:
+            value = getattr(self, cls_arg)
+            object.__setattr__(copy, cls_arg, value)
+            if isinstance(value, Node) and not isinstance(value, LeafNode):
+                _attach_frozen(value, copy)
+        object.__setattr__(copy, "_version", _FROZEN)
+        return copy
 
 
 class ModuleNode(InitNode, Node):
     """Base class for YANG module node."""
 
-    __namespace__: str
+    # Parent, or list of parents, that changes of instance mark dirty,
+    # whether instance was serialized since it was last marked dirty, and
+    # snapshot version of instance. Frozen copies of parents are weakly
+    # referenced.
+    __slots__ = ("_parent", "_clean", "_version", "__weakref__")
 
-    def to_xml(self) -> str:
-        """Returns an XML tree from instance."""
+    __namespace__: str
 
-        xml_tree: str = ""
-        for cls_arg in self._cls_meta[ARGS]:
-            attrs: dict = dict(xmlns=self._cls_meta[DEFAULTS]["__namespace__"])
-            if element_attrs := retrieve_xml_element_attrs(
-                self._cls_meta, cls_arg
-            ):
-                attrs.update(element_attrs)
-            xml_tree += getattr(self, cls_arg).to_xml(attrs=attrs)
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from instance, each child element
+        contains concatenated element attrs."""
 
-        return xml_tree
+        yield from self._cls_xml_renderer.iter_module_children(
+            self, element_attrs
+        )
+        object.__setattr__(self, "_clean", True)
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON chunks depth-first from instance object, member
+        names are qualified by the module identifier."""
+
+        yield "{"
+        yield from self._cls_json_renderer.iter_members(self)
+        yield "}"
+        object.__setattr__(self, "_clean", True)
+
+    @classmethod
+    def from_xml(
+        cls, source: t.Union[str, t.IO], /, *, lazy: bool = False
+    ) -> "ModuleNode":
+        """Returns a new instance from XML source, a path or file-like
+        object, that is parsed incrementally. Elements of module children
+        may be wrapped, e.g. in a NETCONF rpc-reply, and elements that do
+        not map to a node are skipped. When lazy is True containers and
+        lists are built on first access, and untouched ones serialize to
+        XML verbatim, see parsers.LazyXMLTreeBuilder."""
+
+        if lazy:
+            return LazyXMLTreeBuilder(cls).parse(source)
+        return XMLTreeBuilder(cls).parse(source)
+
+    @classmethod
+    def from_json(
+        cls, source: t.Union[str, t.IO], /, *, lazy: bool = False
+    ) -> "ModuleNode":
+        """Returns a new instance from JSON (RFC 7951) source, a path or
+        file-like object, that is tokenized incrementally. Members of
+        module children may be wrapped, e.g. in a RESTCONF
+        ietf-restconf:data, and members that do not map to a node are
+        skipped. When lazy is True containers and lists are built on first
+        access, and untouched ones serialize to JSON verbatim, see
+        parsers.LazyJSONTreeBuilder."""
+
+        if lazy:
+            return LazyJSONTreeBuilder(cls).parse(source)
+        return JSONTreeBuilder(cls).parse(source)
+
+    def select(self, path: str, /) -> t.List[t.Any]:
+        """Returns the nodes of instance that path selects, an absolute
+        path of a subset of XPath, such as
+        /interfaces/interface[name='xe-0/0/0']/config/mtu. Steps are node
+        identifiers, optionally prefixed, list steps take predicates that
+        a leaf equals a literal, leaf list steps that the value (.)
+        equals a literal, and both a position. Predicates on every key
+        leaf of a list look up the entry by key. Compiled paths are
+        reused, see queries.compile_query."""
+
+        return compile_query(self.__class__, path)(self)
+
+    def diff(self, running: "ModuleNode", /) -> t.List[Change]:
+        """Returns the minimal changes from running, an instance of the
+        same class, to instance depth-first. List entries are matched by
+        key."""
+
+        return diff(running, self)
+
+    def to_edit_config(
+        self, running: "ModuleNode", /, *, target: str = "running"
+    ) -> str:
+        """Returns a NETCONF edit-config of the changes from running to
+        instance for target datastore. Changed nodes contain a merge,
+        replace or delete operation attribute."""
+
+        return "".join(
+            iter_edit_config(
+                self.__class__, diff(running, self), target=target
+            )
+        )
 
 
 class ContainerNode(InitNode, Node):
     """Base class for YANG container node."""
 
-    def to_xml(self, /, *, attrs: t.Optional[t.Dict[str, str]] = None) -> str:
-        """Returns an XML tree from instance element. When attrs are
-        provided instance element contains attrs."""
+    # See ModuleNode, and source of lazily parsed instance.
+    __slots__ = ("_parent", "_clean", "_version", "_lazy", "__weakref__")
 
-        element_attrs = concatenate_xml_element_attrs(attrs)
-        element_value: str = ""
-        for cls_arg in self._cls_meta[ARGS]:
-            element_value += getattr(self, cls_arg).to_xml(
-                attrs=retrieve_xml_element_attrs(self._cls_meta, cls_arg)
-            )
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from instance element, instance
+        element contains concatenated element attrs."""
 
-        return XML_ELEMENT_TEMPLATE.format(
-            self._cls_identifier, element_attrs, element_value
-        )
+        renderer: XMLRenderer = self._cls_xml_renderer
+        yield renderer.render_start_tag(element_attrs)
+        yield from renderer.iter_children(self)
+        yield renderer.end_tag
+        object.__setattr__(self, "_clean", True)
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON chunks depth-first from instance object."""
+
+        yield "{"
+        yield from self._cls_json_renderer.iter_members(self)
+        yield "}"
+        object.__setattr__(self, "_clean", True)
 
 
 class ListEntry:
     """Base class for YANG list node entry."""
 
-    def __init__(self, attributes: t.Dict[str, t.Any], /, *, key: str) -> None:
-        """Initializer that manifests into entry through attributes."""
+    # Parent list node, cached XML start tag and fragment and JSON fragment
+    # of entry, which are dropped when entry is marked dirty, and snapshot
+    # version of entry. Frozen copies of entries are weakly referenced.
+    __slots__ = ("_parent", "_xml", "_json", "_version", "__weakref__")
+
+    # Key accessor constructed by NodeMeta for each list node class.
+    _key: t.Callable[["ListEntry"], t.Any]
+
+    def __init__(self, *values) -> None:
+        """Initializer that manifests into entry through values of each
+        slot."""
+
+        attr: str
+        for attr, value in zip(self.__slots__, values):
+            object.__setattr__(self, attr, value)
+            if isinstance(value, Node) and not isinstance(value, LeafNode):
+                _attach(value, self)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Sets attribute, changes mark entry and ancestors dirty. Entries
+        of snapshots are immutable."""
+
+        _prepare_write(self)
+        object.__setattr__(self, name, value)
+        if isinstance(value, Node) and not isinstance(value, LeafNode):
+            _attach(value, self)
+        _mark_dirty(self)
+
+    def _snapshot_copy(self) -> "ListEntry":
+        """Returns a frozen copy of entry that shares values and cached
+        fragments with entry."""
+
+        copy = self.__class__.__new__(self.__class__)
+        for attr in self.__slots__:
+            value = getattr(self, attr)
+            object.__setattr__(copy, attr, value)
+            if isinstance(value, Node) and not isinstance(value, LeafNode):
+                _attach_frozen(value, copy)
+        object.__setattr__(copy, "_xml", getattr(self, "_xml", None))
+        object.__setattr__(copy, "_json", getattr(self, "_json", None))
+        object.__setattr__(copy, "_version", _FROZEN)
+        return copy
+
+    def __hash__(self) -> int:
+        """Returns hash of entry from key values."""
 
-        self.__dict__.update(attributes)
-        self._key = key
+        return hash(self._key(self))
 
-    def __hash__(self):
-        """Returns hash of entry from key values."""
+    def __eq__(self, other: object) -> bool:
+        """Returns True when entries of the same list have equal key
+        values."""
 
-        return hash(
-            tuple((self.__dict__[key] for key in self._key.split(",")))
-        )
+        if not isinstance(other, ListEntry):
+            return NotImplemented
+        key = self._key
+        return key is other._key and key(self) == key(other)
 
 
 class ListNode(Node):
     """Base class for YANG list node."""
 
+    # See ModuleNode, weak references to frozen copies of instance,
+    # whether entries are shared with a frozen copy, and source of lazily
+    # parsed instance.
+    __slots__ = (
+        "_entries",
+        "_parent",
+        "_clean",
+        "_version",
+        "_snapshots",
+        "_shared",
+        "_lazy",
+        "__weakref__",
+    )
+
     __key__: str
+    # Whether entries cache their XML element and JSON object until they
+    # are marked dirty, which keeps a serialized copy of each entry so
+    # that repeated serialization only renders the changed entries.
+    __cache__: bool = False
+
+    # Whether entries are stored as columns, see ColumnarListNode.
+    _cls_columnar = False
+    # Whether args are slots of instances, see NodeMeta._construct_meta.
+    _cls_arg_slots = False
+
+    if t.TYPE_CHECKING:
+        _cls_entry: t.ClassVar[t.Type[ListEntry]]
 
     def __init__(self) -> None:
         """Initializer that creates the mechanics for expected behavior."""
 
         super().__init__()
-        self.entries: OrderedSet = OrderedSet()
-        self._key: str = self._cls_meta[DEFAULTS]["__key__"]
+        self._entries: t.Dict[t.Any, ListEntry] = dict()
+        # New instances are not shared with any snapshot.
+        self._version = _snapshot_version
+        self._shared = False
+
+    def __getitem__(self, key: t.Any) -> ListEntry:
+        """Returns entry for key, composite keys are given as tuple."""
+
+        return self._entries[key]
+
+    def __contains__(self, key: t.Any) -> bool:
+        """Returns True when an entry for key exists."""
+
+        return key in self._entries
+
+    def __getstate__(self) -> t.List[t.Any]:
+        """Returns state of instance as the values of each entry. Entry
+        classes are constructed per list node class and are not
+        importable."""
+
+        cls_args = tuple(self._cls_meta[ARGS])
+        return [
+            tuple(getattr(entry, cls_arg) for cls_arg in cls_args)
+            for entry in self._entries.values()
+        ]
+
+    def __setstate__(self, state: t.List[t.Any], /) -> None:
+        """Restores instance entries from the values of each entry."""
+
+        self._entries = dict()
+        self._version = _snapshot_version
+        self._shared = False
+        create_entry = self._cls_entry
+        for values in state:
+            entry = create_entry(*values)
+            object.__setattr__(entry, "_parent", self)
+            self._entries[entry._key(entry)] = entry
+
+    def _snapshot_copy(self) -> "ListNode":
+        """Returns a frozen copy of instance that shares entries with
+        instance. Entries of the copy are a chain of the entries that
+        change after the copy is made over entries of instance, which
+        instance copies before it adds or removes an entry."""
+
+        copy = self.__class__.__new__(self.__class__)
+        object.__setattr__(
+            copy, "_entries", collections.ChainMap(dict(), self._entries)
+        )
+        object.__setattr__(copy, "_version", _FROZEN)
+        object.__setattr__(self, "_shared", True)
+        snapshots = getattr(self, "_snapshots", None) or list()
+        snapshots.append(weakref.ref(copy))
+        object.__setattr__(self, "_snapshots", snapshots)
+        return copy
+
+    def _iter_snapshots(self) -> t.Iterator["ListNode"]:
+        """Yields frozen copies of instance that are still referenced."""
+
+        snapshots = [
+            snapshot_ref
+            for snapshot_ref in getattr(self, "_snapshots", None) or ()
+            if snapshot_ref() is not None
+        ]
+        object.__setattr__(self, "_snapshots", snapshots)
+        for snapshot_ref in snapshots:
+            if (snapshot_list := snapshot_ref()) is not None:
+                yield snapshot_list
+
+    def _prepare_entries(self) -> None:
+        """Prepares instance for entries to be added or removed, see
+        _prepare_write. Entries shared with frozen copies are copied
+        first."""
+
+        _prepare_write(self)
+        if getattr(self, "_shared", False):
+            object.__setattr__(self, "_entries", dict(self._entries))
+            object.__setattr__(self, "_shared", False)
+
+    @property
+    def entries(self) -> t.ValuesView[ListEntry]:
+        """Returns entries in insertion order."""
+
+        return self._entries.values()
+
+    def _is_empty(self) -> bool:
+        """Returns True when instance has no entries."""
+
+        return not self._entries
+
+    def _create_entry(self, *args, **kwargs) -> ListEntry:
+        """Returns a new entry from arguments for class meta args."""
+
+        return self._cls_entry(
+            *(value for _, value in self._cls_meta_args_resolver(args, kwargs))
+        )
 
     def append(self, *args, **kwargs) -> None:
         """Takes any number of arguments for class meta args to append a
-        new entry into list entries.
+        new entry into list entries. When an entry with the same key
+        exists, list entries are unchanged.
         """
 
-        entry_attr: t.Dict[str, t.Any] = dict()
-        for cls_arg, value in self._cls_meta_args_resolver(args, kwargs):
-            entry_attr[cls_arg] = value
-        self.entries.add(ListEntry(entry_attr, key=self._key))
+        entry = self._create_entry(*args, **kwargs)
+        if self._version != _snapshot_version or self._shared:
+            self._prepare_entries()
+        if self._entries.setdefault(entry._key(entry), entry) is entry:
+            # New entries have no parent.
+            object.__setattr__(entry, "_parent", self)
+            if getattr(self, "_clean", False):
+                _mark_dirty(self)
+
+    def _create_entry_from_row(self, *args, **kwargs) -> ListEntry:
+        """Returns a new entry from row values for class meta args, values
+        of leaf node args that are not leaf nodes initialize the leaf
+        node."""
+
+        return self._create_entry(*args, **kwargs)
+
+    def extend(
+        self, rows: t.Iterable[t.Union[t.Sequence[t.Any], t.Dict[str, t.Any]]]
+    ) -> None:
+        """Takes an iterable of rows to append new entries into list
+        entries, each row is a tuple of args or a dict of kwargs for class
+        meta args. Values of leaf node args may be given as the leaf
+        value. The whole batch is validated before any entry is appended.
+        """
 
-    def to_xml(self, /, *, attrs: t.Optional[t.Dict[str, str]] = None) -> str:
-        """Returns an XML tree from each entries element. When attrs are
-        provided each entry element contains attrs."""
+        create_entry = self._create_entry_from_row
+        batch = [
+            create_entry(**row)
+            if isinstance(row, dict)
+            else create_entry(*row)
+            for row in rows
+        ]
+
+        self._prepare_entries()
+        entries = self._entries
+        key = self._cls_entry._key
+        for entry in batch:
+            if entries.setdefault(key(entry), entry) is entry:
+                object.__setattr__(entry, "_parent", self)
+        _mark_dirty(self)
+
+    def extend_columns(self, columns: t.Dict[str, t.Sequence[t.Any]]) -> None:
+        """Takes columns, a dict of class meta arg and a sequence of values
+        for the arg, to append a new entry for each row of values into
+        list entries. See extend."""
+
+        cls_args = tuple(self._cls_meta[ARGS])
+        names = tuple(columns)
+        if names == cls_args[: len(names)]:
+            self.extend(zip(*columns.values()))
+        else:
+            self.extend(
+                dict(zip(names, row)) for row in zip(*columns.values())
+            )
 
-        element_attrs = concatenate_xml_element_attrs(attrs)
-        xml_tree: str = ""
+    @classmethod
+    def from_rows(
+        cls, rows: t.Iterable[t.Union[t.Sequence[t.Any], t.Dict[str, t.Any]]]
+    ) -> "ListNode":
+        """Returns a new instance with entries from rows. See extend."""
+
+        instance = cls()
+        instance.extend(rows)
+        return instance
+
+    @classmethod
+    def from_columns(
+        cls, columns: t.Dict[str, t.Sequence[t.Any]]
+    ) -> "ListNode":
+        """Returns a new instance with entries from columns. See
+        extend_columns."""
+
+        instance = cls()
+        instance.extend_columns(columns)
+        return instance
+
+    def get(self, key: t.Any, default: t.Any = None) -> t.Any:
+        """Returns entry for key, when entry does not exist returns
+        default."""
+
+        return self._entries.get(key, default)
+
+    def pop(self, key: t.Any, default: t.Any = UNSET) -> t.Any:
+        """Removes and returns entry for key. When entry does not exist
+        returns default if given otherwise raises KeyError."""
+
+        if key in self._entries:
+            self._prepare_entries()
+            _mark_dirty(self)
+        if default is UNSET:
+            return self._entries.pop(key)
+        return self._entries.pop(key, default)
+
+    def replace(self, *args, **kwargs) -> None:
+        """Takes any number of arguments for class meta args to replace
+        the entry with the same key, entry position is kept. When entry
+        does not exist raises KeyError."""
+
+        entry = self._create_entry(*args, **kwargs)
+        if (key := entry._key(entry)) not in self._entries:
+            raise KeyError(key)
+        self._prepare_entries()
+        self._entries[key] = entry
+        _attach(entry, self)
+        _mark_dirty(self)
+
+    def upsert(self, *args, **kwargs) -> None:
+        """Takes any number of arguments for class meta args to replace
+        the entry with the same key, or append when entry does not
+        exist."""
+
+        entry = self._create_entry(*args, **kwargs)
+        self._prepare_entries()
+        self._entries[entry._key(entry)] = entry
+        _attach(entry, self)
+        _mark_dirty(self)
+
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML element from each entry, each entry element contains
+        concatenated element attrs. When class caches entries, elements
+        of entries that are not dirty are reused from cache."""
+
+        renderer: XMLRenderer = self._cls_xml_renderer
+        start_tag = renderer.render_start_tag(element_attrs)
+        end_tag = renderer.end_tag
+        iter_children = renderer.iter_children
+        if not self._cls_meta[DEFAULTS]["__cache__"]:
+            for entry in self.entries:
+                yield start_tag
+                yield from iter_children(entry)
+                yield end_tag
+                # Entries are clean, so that changes mark ancestors dirty.
+                object.__setattr__(entry, "_xml", _UNCACHED_XML)
+            object.__setattr__(self, "_clean", True)
+            return
         for entry in self.entries:
-            element_value: str = ""
-            for cls_arg in self._cls_meta[ARGS]:
-                element_value += getattr(entry, cls_arg).to_xml(
-                    attrs=retrieve_xml_element_attrs(self._cls_meta, cls_arg)
+            if (cached := getattr(entry, "_xml", None)) and (
+                cached[0] == start_tag
+            ):
+                yield cached[1]
+                continue
+            fragment = "".join((start_tag, *iter_children(entry), end_tag))
+            object.__setattr__(entry, "_xml", (start_tag, fragment))
+            yield fragment
+        object.__setattr__(self, "_clean", True)
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON array of each entries object. When class caches
+        entries, objects of entries that are not dirty are reused from
+        cache."""
+
+        iter_members = self._cls_json_renderer.iter_members
+        separator = "["
+        if not self._cls_meta[DEFAULTS]["__cache__"]:
+            for entry in self.entries:
+                yield f"{separator}{{"
+                yield from iter_members(entry)
+                yield "}"
+                separator = ","
+                object.__setattr__(entry, "_json", _UNCACHED_JSON)
+        else:
+            for entry in self.entries:
+                if not (fragment := getattr(entry, "_json", None)):
+                    fragment = "".join(("{", *iter_members(entry), "}"))
+                    object.__setattr__(entry, "_json", fragment)
+                yield f"{separator}{fragment}"
+                separator = ","
+        yield "]" if separator == "," else "[]"
+        object.__setattr__(self, "_clean", True)
+
+
+def _escape_format(text: str, /) -> str:
+    """Returns text with braces escaped for str.format templates."""
+
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+class ColumnarEntry:
+    """Row view of a columnar list node entry, leaf nodes are materialized
+    from the columns of the list node on access."""
+
+    __slots__ = ("_parent", "_key")
+
+    def __init__(self, parent: "ColumnarListNode", key: t.Any, /) -> None:
+        """Initializer that takes the list node and the entry key."""
+
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_key", key)
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Returns leaf node of class meta arg name of entry."""
+
+        return self._parent._get_cell(self._key, name)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Sets leaf node of class meta arg name of entry, changes mark the
+        list node and ancestors dirty."""
+
+        self._parent._set_cell(self._key, name, value)
+
+    def __hash__(self) -> int:
+        """Returns hash of entry from key values."""
+
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        """Returns True when entries of the same list have equal key
+        values."""
+
+        if not isinstance(other, ColumnarEntry):
+            return NotImplemented
+        return (
+            self._parent.__class__ is other._parent.__class__
+            and self._key == other._key
+        )
+
+
+class ColumnarEntries(t.Mapping[t.Any, ColumnarEntry]):
+    """Mapping of key and row view of each entry of a columnar list node,
+    in insertion order."""
+
+    __slots__ = ("_parent",)
+
+    def __init__(self, parent: "ColumnarListNode", /) -> None:
+        """Initializer that takes the list node."""
+
+        self._parent = parent
+
+    def __getitem__(self, key: t.Any) -> ColumnarEntry:
+        """Returns row view of entry for key."""
+
+        if key not in self._parent._index:
+            raise KeyError(key)
+        return ColumnarEntry(self._parent, key)
+
+    def __contains__(self, key: object) -> bool:
+        """Returns True when an entry for key exists."""
+
+        return key in self._parent._index
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        """Yields key of each entry."""
+
+        return iter(self._parent._index)
+
+    def __len__(self) -> int:
+        """Returns number of entries."""
+
+        return len(self._parent._index)
+
+
+class ColumnarListNode(ListNode):
+    """Base class for YANG list node that stores entries as columns, the
+    leaf values of each arg in a contiguous column. Numeric values are
+    stored in arrays and text values are interned. Entries are row views
+    that materialize leaf nodes on access, and serialization iterates the
+    columns. Args of subclasses are leaf nodes."""
+
+    # Column of each class meta arg, row of each entry key.
+    __slots__ = ("_columns", "_index")
+
+    _cls_columnar = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Ensures that args of subclass are leaf nodes that are not
+        optional."""
+
+        super().__init_subclass__(**kwargs)
+        for cls_arg, annotation in cls.__meta__[ARGS].items():
+            if NodeMeta._node_kind(annotation) != LEAF:
+                raise TypeError(
+                    f"Expected leaf node annotation for {cls_arg}, got {annotation}."
+                )
+            if is_optional_arg(cls.__meta__, cls_arg):
+                raise TypeError(
+                    f"Optional leaf {cls_arg} cannot be stored in columns."
+                )
+
+    def __init__(self) -> None:
+        """Initializer that creates an empty column for each arg."""
+
+        self._columns: t.List[t.MutableSequence[t.Any]] = [
+            array.array(typecode) if typecode else list()
+            for *_, typecode in self._cls_column_plan()
+        ]
+        self._index: t.Dict[t.Any, int] = dict()
+        self._version = _snapshot_version
+        self._shared = False
+
+    @classmethod
+    def _cls_column_plan(
+        cls,
+    ) -> t.Tuple[t.Tuple[str, t.Any, str, type, str], ...]:
+        """Returns class arg, leaf class, leaf value arg, value type and
+        array typecode, empty for list columns, of each class meta arg."""
+
+        if (plan := cls.__dict__.get("_column_plan")) is None:
+            columns = list()
+            for cls_arg, annotation in cls._cls_meta[ARGS].items():
+                ((value_arg, value_type),) = annotation._cls_meta[ARGS].items()
+                columns.append(
+                    (
+                        cls_arg,
+                        annotation,
+                        value_arg,
+                        value_type,
+                        COLUMN_TYPECODES.get(value_type, ""),
+                    )
                 )
-            xml_tree += XML_ELEMENT_TEMPLATE.format(
-                self._cls_identifier, element_attrs, element_value
+            plan = tuple(columns)
+            setattr(cls, "_column_plan", plan)
+        return plan
+
+    @property
+    def _entries(self) -> ColumnarEntries:  # type: ignore[override]
+        """Returns mapping of key and row view of each entry."""
+
+        return ColumnarEntries(self)
+
+    def __contains__(self, key: t.Any) -> bool:
+        """Returns True when an entry for key exists."""
+
+        return key in self._index
+
+    def _iter_columns(self) -> t.List[t.Iterable[t.Any]]:
+        """Returns the leaf values of each column in entry order."""
+
+        return [
+            map(bool, column) if value_type is bool else column
+            for (_, _, _, value_type, _), column in zip(
+                self._cls_column_plan(), self._columns
+            )
+        ]
+
+    def _key_of(self, values: t.Sequence[t.Any], /) -> t.Any:
+        """Returns key of entry from leaf values of each arg."""
+
+        positions = self._cls_key_positions()
+        if len(positions) == 1:
+            return values[positions[0]]
+        return tuple(values[position] for position in positions)
+
+    def _values_of(self, entry: t.Any, /) -> t.List[t.Any]:
+        """Returns leaf value of each arg of entry."""
+
+        return [
+            getattr(getattr(entry, cls_arg), value_arg)
+            for cls_arg, _, value_arg, _, _ in self._cls_column_plan()
+        ]
+
+    @classmethod
+    def _cls_key_positions(cls) -> t.Tuple[int, ...]:
+        """Returns position of each key arg within class meta args."""
+
+        if (positions := cls.__dict__.get("_key_positions")) is None:
+            cls_args = list(cls._cls_meta[ARGS])
+            positions = tuple(
+                cls_args.index(cls_arg)
+                for cls_arg in cls._cls_meta[DEFAULTS]["__key__"].split(",")
+            )
+            setattr(cls, "_key_positions", positions)
+        return positions
+
+    def _get_cell(self, key: t.Any, name: str, /) -> t.Any:
+        """Returns leaf node of arg name of entry for key."""
+
+        for position, (
+            cls_arg,
+            leaf_cls,
+            value_arg,
+            value_type,
+            _,
+        ) in enumerate(self._cls_column_plan()):
+            if cls_arg == name:
+                break
+        else:
+            raise AttributeError(
+                f"{ColumnarEntry.__name__} has no attribute {name}."
+            )
+        value = self._columns[position][self._index[key]]
+        leaf = object.__new__(leaf_cls)
+        object.__setattr__(
+            leaf, value_arg, bool(value) if value_type is bool else value
+        )
+        return leaf
+
+    def _set_cell(self, key: t.Any, name: str, value: t.Any, /) -> None:
+        """Sets leaf node of arg name of entry for key."""
+
+        for position, (cls_arg, leaf_cls, value_arg, _, _) in enumerate(
+            self._cls_column_plan()
+        ):
+            if cls_arg == name:
+                break
+        else:
+            raise AttributeError(
+                f"{ColumnarEntry.__name__} has no attribute {name}."
+            )
+        if position in self._cls_key_positions():
+            raise AttributeError(
+                f"Key {name} of {ColumnarEntry.__name__} cannot change."
+            )
+        if (value_type := type(value)) is not leaf_cls:
+            raise TypeError(
+                f"Expected argument of type {leaf_cls} for {name}, got type {value_type}."
             )
+        row = self._index[key]
+        self._prepare_entries()
+        self._set_row(row, (position,), (getattr(value, value_arg),))
+
+    def __getstate__(self) -> t.List[t.Any]:
+        """Returns state of instance as the leaf values of each column."""
+
+        return [list(column) for column in self._iter_columns()]
 
-        return xml_tree
+    def __setstate__(self, state: t.List[t.Any], /) -> None:
+        """Restores instance columns from the leaf values of each
+        column."""
+
+        ColumnarListNode.__init__(self)
+        self._append_columns(state)
+
+    def _prepare_entries(self) -> None:
+        """Prepares instance for entries to change, see _prepare_write.
+        Columns shared with frozen copies are copied first."""
+
+        _prepare_write(self)
+        if getattr(self, "_shared", False):
+            object.__setattr__(
+                self, "_columns", [column[:] for column in self._columns]
+            )
+            object.__setattr__(self, "_index", dict(self._index))
+            object.__setattr__(self, "_shared", False)
+
+    def _snapshot_copy(self) -> "ColumnarListNode":
+        """Returns a frozen copy of instance that shares columns with
+        instance until instance changes."""
+
+        copy = self.__class__.__new__(self.__class__)
+        object.__setattr__(copy, "_columns", self._columns)
+        object.__setattr__(copy, "_index", self._index)
+        object.__setattr__(copy, "_version", _FROZEN)
+        object.__setattr__(self, "_shared", True)
+        return copy
+
+    def _set_row(
+        self,
+        row: int,
+        positions: t.Iterable[int],
+        values: t.Iterable[t.Any],
+        /,
+    ) -> None:
+        """Sets leaf values at positions of row, and marks instance
+        dirty. Keys of rows do not change."""
+
+        columns = self._columns
+        key_positions = self._cls_key_positions()
+        for position, value in zip(positions, values):
+            if position in key_positions:
+                continue
+            if type(value) is str:
+                value = sys.intern(value)
+            try:
+                columns[position][row] = value
+            except OverflowError:
+                # Values out of the array range are kept in a list.
+                columns[position] = list(columns[position])
+                columns[position][row] = value
+        _mark_dirty(self)
+
+    def _append_columns(self, columns: t.List[t.List[t.Any]], /) -> None:
+        """Appends rows of leaf values from columns, rows with a key that
+        exists are skipped. Columns are validated."""
+
+        plan = self._cls_column_plan()
+        if len(columns) != len(plan):
+            raise ValueError(
+                f"Expected {len(plan)} columns, got {len(columns)}."
+            )
+        if len(set(map(len, columns))) > 1:
+            raise ValueError("Expected columns of equal length.")
+        for (cls_arg, _, _, value_type, _), column in zip(plan, columns):
+            for value in column:
+                if type(value) is not value_type:
+                    raise TypeError(
+                        f"Expected argument of type {value_type} for {cls_arg}, got type {type(value)}."
+                    )
+
+        index = self._index
+        rows = list()
+        for values in zip(*columns):
+            if (key := self._key_of(values)) not in index:
+                index[key] = len(index)
+                rows.append(values)
+        if not rows:
+            return
+
+        for position, (stored, values) in enumerate(
+            zip(self._columns, zip(*rows))
+        ):
+            if type(stored) is list:
+                # Keys are distinct, interning them only costs memory.
+                if (
+                    type(values[0]) is str
+                    and position not in self._cls_key_positions()
+                ):
+                    values = tuple(map(sys.intern, values))
+                stored.extend(values)
+                continue
+            length = len(stored)
+            try:
+                stored.extend(values)
+            except OverflowError:
+                # Values out of the array range are kept in a list.
+                self._columns[position] = [*stored[:length], *values]
+        _mark_dirty(self)
+
+    def _unwrap_rows(
+        self,
+        rows: t.Iterable[t.Union[t.Sequence[t.Any], t.Dict[str, t.Any]]],
+        /,
+    ) -> t.List[t.List[t.Any]]:
+        """Returns columns of leaf values from rows, see ListNode.extend.
+        Leaf nodes are unwrapped and defaults fill absent args."""
+
+        plan = self._cls_column_plan()
+        defaults = self._cls_meta[DEFAULTS]
+        columns: t.List[t.List[t.Any]] = [list() for _ in plan]
+        for row in rows:
+            if isinstance(row, dict):
+                if extra := set(row).difference(self._cls_meta[ARGS]):
+                    raise TypeError(f"Unexpected arguments: {sorted(extra)}")
+                row = [row.get(cls_arg, UNSET) for cls_arg, *_ in plan]
+            elif len(row) > len(plan):
+                self._check_given_args_not_greater_than_expected(len(row))
+            for position, (cls_arg, leaf_cls, value_arg, _, _) in enumerate(
+                plan
+            ):
+                value: t.Any = row[position] if position < len(row) else UNSET
+                if value is UNSET:
+                    value = defaults.get(cls_arg, UNSET)
+                    if type(value) is MetaInfo:
+                        value = value.default
+                    if value is UNSET:
+                        raise TypeError(
+                            f"Missing required argument: {cls_arg}"
+                        )
+                if type(value) is leaf_cls:
+                    value = getattr(value, value_arg)
+                columns[position].append(value)
+        return columns
+
+    def append(self, *args, **kwargs) -> None:
+        """Takes any number of arguments for class meta args to append a
+        new entry into list entries. When an entry with the same key
+        exists, list entries are unchanged.
+        """
+
+        self._prepare_entries()
+        entry = self._create_entry(*args, **kwargs)
+        self._append_columns([[value] for value in self._values_of(entry)])
+
+    def extend(
+        self, rows: t.Iterable[t.Union[t.Sequence[t.Any], t.Dict[str, t.Any]]]
+    ) -> None:
+        """Takes an iterable of rows to append new entries into list
+        entries, see ListNode.extend. Rows are stored into the columns
+        without creating entries."""
+
+        columns = self._unwrap_rows(rows)
+        self._prepare_entries()
+        self._append_columns(columns)
+
+    def extend_columns(self, columns: t.Dict[str, t.Sequence[t.Any]]) -> None:
+        """Takes columns, a dict of class meta arg and a sequence of values
+        for the arg, to append a new entry for each row of values into
+        list entries. See extend."""
+
+        if tuple(columns) == tuple(self._cls_meta[ARGS]):
+            plan = self._cls_column_plan()
+            self._prepare_entries()
+            self._append_columns(
+                [
+                    [
+                        getattr(value, value_arg)
+                        if type(value) is leaf_cls
+                        else value
+                        for value in column
+                    ]
+                    for (_, leaf_cls, value_arg, _, _), column in zip(
+                        plan, columns.values()
+                    )
+                ]
+            )
+        else:
+            super().extend_columns(columns)
+
+    def pop(self, key: t.Any, default: t.Any = UNSET) -> t.Any:
+        """Removes and returns a detached entry for key, see ListNode.pop.
+        Rows after the entry move up."""
+
+        if key not in self._index:
+            if default is UNSET:
+                raise KeyError(key)
+            return default
+
+        entry = self._cls_entry(
+            *(
+                getattr(self._entries[key], cls_arg)
+                for cls_arg, *_ in self._cls_column_plan()
+            )
+        )
+        self._prepare_entries()
+        index = self._index
+        row = index.pop(key)
+        for column in self._columns:
+            del column[row]
+        for other, other_row in index.items():
+            if other_row > row:
+                index[other] = other_row - 1
+        _mark_dirty(self)
+        return entry
+
+    def replace(self, *args, **kwargs) -> None:
+        """Takes any number of arguments for class meta args to replace
+        the entry with the same key, entry position is kept. When entry
+        does not exist raises KeyError."""
+
+        entry = self._create_entry(*args, **kwargs)
+        plan = self._cls_column_plan()
+        values = self._values_of(entry)
+        if (key := self._key_of(values)) not in self._index:
+            raise KeyError(key)
+        self._prepare_entries()
+        self._set_row(self._index[key], range(len(plan)), values)
+
+    def upsert(self, *args, **kwargs) -> None:
+        """Takes any number of arguments for class meta args to replace
+        the entry with the same key, or append when entry does not
+        exist."""
+
+        entry = self._create_entry(*args, **kwargs)
+        plan = self._cls_column_plan()
+        values = self._values_of(entry)
+        self._prepare_entries()
+        if (key := self._key_of(values)) in self._index:
+            self._set_row(self._index[key], range(len(plan)), values)
+        else:
+            self._append_columns([[value] for value in values])
+
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML element of each row from the columns, each entry
+        element contains concatenated element attrs. Leaf values are
+        encoded per column."""
+
+        renderer: XMLRenderer = self._cls_xml_renderer
+        children = t.cast(
+            t.Tuple[t.Tuple[t.Any, str, str, str, t.Callable], ...],
+            renderer.children,
+        )
+        template = "".join(
+            (
+                _escape_format(renderer.render_start_tag(element_attrs)),
+                *(
+                    f"{_escape_format(start_tag)}{{}}{_escape_format(end_tag)}"
+                    for _, _, start_tag, end_tag, _ in children
+                ),
+                _escape_format(renderer.end_tag),
+            )
+        )
+        yield from map(
+            template.format,
+            *(
+                map(encode, column)
+                for (_, _, _, _, encode), column in zip(
+                    children, self._iter_columns()
+                )
+            ),
+        )
+        object.__setattr__(self, "_clean", True)
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON array of each row object from the columns."""
+
+        children = self._cls_json_renderer.children
+        template = "{{%s}}" % ",".join(
+            f"{_escape_format(member)}{{}}" for _, member, _, _ in children
+        )
+        rows = map(
+            template.format,
+            *(
+                map(t.cast(t.Callable[[t.Any], str], encode), column)
+                for (_, _, encode, _), column in zip(
+                    children, self._iter_columns()
+                )
+            ),
+        )
+        separator = "["
+        for row in rows:
+            yield f"{separator}{row}"
+            separator = ","
+        yield "]" if separator == "," else "[]"
+        object.__setattr__(self, "_clean", True)
 
 
 class LeafListNode(Node):
     """Base class for YANG leaf list node."""
 
+    # See ModuleNode.
+    __slots__ = ("entries", "_parent", "_clean", "_version")
+
+    # See ListNode.
+    _cls_arg_slots = False
+
     value: t.Any
 
     def __init__(self) -> None:
@@ -309,40 +2187,135 @@ class LeafListNode(Node):
         super().__init__()
         self.entries: OrderedSet = OrderedSet()
 
+    def _is_empty(self) -> bool:
+        """Returns True when instance has no entries."""
+
+        return not self.entries
+
+    def __getstate__(self) -> t.List[t.Any]:
+        """Returns state of instance as entries."""
+
+        return list(self.entries)
+
+    def __setstate__(self, state: t.List[t.Any], /) -> None:
+        """Restores instance entries."""
+
+        self.entries = OrderedSet(state)
+
+    def _snapshot_copy(self) -> "LeafListNode":
+        """Returns a frozen copy of instance."""
+
+        copy = self.__class__.__new__(self.__class__)
+        object.__setattr__(copy, "entries", OrderedSet(self.entries))
+        object.__setattr__(copy, "_version", _FROZEN)
+        return copy
+
     def append(self, *value) -> None:
         """Takes a single ;) value argument to append a new entry into leaf
         list entries.
         """
 
+        _prepare_write(self)
         for _, value in self._cls_meta_args_resolver(value, dict()):
             self.entries.add(value)
+        _mark_dirty(self)
 
-    def to_xml(self, /, *, attrs: t.Optional[t.Dict[str, str]] = None) -> str:
-        """Returns XML element for each entry. When attrs are provided
-        each entry element contains attrs."""
+    def extend(self, values: t.Iterable[t.Any]) -> None:
+        """Takes an iterable of values to append new entries into leaf list
+        entries. The whole batch is validated before any entry is
+        appended."""
 
-        element_attrs = concatenate_xml_element_attrs(attrs)
-        elements: str = ""
+        batch = list(values)
+        ((cls_arg, annotation),) = self._cls_meta[ARGS].items()
+        for value in batch:
+            if (value_type := type(value)) is not annotation:
+                raise TypeError(
+                    f"Expected argument of type {annotation} for {cls_arg}, got type {value_type}."
+                )
+        _prepare_write(self)
+        self.entries.update(batch)
+        _mark_dirty(self)
+
+    @classmethod
+    def from_rows(cls, values: t.Iterable[t.Any]) -> "LeafListNode":
+        """Returns a new instance with entries from values. See extend."""
+
+        instance = cls()
+        instance.extend(values)
+        return instance
+
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML element for each entry, each entry element contains
+        concatenated element attrs."""
+
+        renderer: XMLRenderer = self._cls_xml_renderer
+        start_tag = renderer.render_start_tag(element_attrs)
+        end_tag = renderer.end_tag
+        encode = renderer.encode
         for element_value in self.entries:
-            elements += XML_ELEMENT_TEMPLATE.format(
-                self._cls_identifier, element_attrs, element_value
-            )
+            yield f"{start_tag}{encode(element_value)}{end_tag}"
+        object.__setattr__(self, "_clean", True)
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON array of entries."""
 
-        return elements
+        encode = self._cls_json_renderer.encode
+        yield f"[{','.join(map(encode, self.entries))}]"
+        object.__setattr__(self, "_clean", True)
 
 
 class LeafNode(InitNode, Node):
-    """Base class for YANG leaf node."""
+    """Base class for YANG leaf node, instances are immutable values so
+    that they may be shared and used as keys."""
 
     value: t.Any
 
-    def to_xml(self, /, *, attrs: t.Optional[t.Dict[str, str]] = None) -> str:
-        """Returns XML from instance element. When attrs are
-        provided instance element contains attrs."""
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Prevents changes of instance, a new instance is assigned to the
+        parent instead."""
 
-        element_attrs = concatenate_xml_element_attrs(attrs)
-        return XML_ELEMENT_TEMPLATE.format(
-            self._cls_identifier,
+        raise AttributeError(
+            f"{self.__class__.__name__} is immutable, assign a new instance to its parent."
+        )
+
+    def snapshot(self) -> "LeafNode":
+        """Returns instance, which is immutable."""
+
+        return self
+
+    def __reduce__(self) -> t.Tuple[type, tuple]:
+        """Returns class and value that recreate instance."""
+
+        return (self.__class__, (getattr(self, *self._cls_meta[ARGS]),))
+
+    def __hash__(self) -> int:
+        """Returns hash of instance from class and value."""
+
+        return hash((self.__class__, getattr(self, *self._cls_meta[ARGS])))
+
+    def __eq__(self, other: object) -> bool:
+        """Returns True when other is an instance of the same class with
+        an equal value."""
+
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        (cls_arg,) = self._cls_meta[ARGS]
+        return getattr(self, cls_arg) == getattr(other, cls_arg)
+
+    def _iter_xml(self, element_attrs: str, /) -> t.Iterator[str]:
+        """Yields XML element from instance, instance element contains
+        concatenated element attrs."""
+
+        renderer: XMLRenderer = self._cls_xml_renderer
+        yield XML_ELEMENT_TEMPLATE.format(
+            renderer.identifier,
             element_attrs,
-            getattr(self, *self._cls_meta[ARGS].keys()),
+            renderer.encode(getattr(self, *self._cls_meta[ARGS].keys())),
+        )
+
+    def _iter_json(self) -> t.Iterator[str]:
+        """Yields JSON value from instance."""
+
+        yield self._cls_json_renderer.encode(
+            getattr(self, *self._cls_meta[ARGS].keys())
         )
@@ -0,0 +1,980 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import codecs
+import io
+import json
+import re
+import typing as t
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from json.scanner import NUMBER_RE
+from xml.etree import ElementTree
+
+from yapyang.constants import (
+    CONTAINER,
+    DEFAULTS,
+    IDENTIFIER,
+    LEAF,
+    LEAF_LIST,
+    LIST,
+    UNSET,
+)
+from yapyang.utils import MetaInfo
+
+__all__ = ()
+
+
+def split_xml_tag(tag: str, /) -> t.Tuple[t.Optional[str], str]:
+    """Splits XML tag in Clark notation into namespace and local name."""
+
+    if tag[:1] == "{":
+        namespace, _, name = tag[1:].partition("}")
+        return namespace, name
+    return None, tag
+
+
+class XMLFrame:
+    """Parse state of an open XML element."""
+
+    __slots__ = ("element", "cls", "kind", "cls_arg", "parse_value", "values")
+
+    def __init__(
+        self,
+        element: ElementTree.Element,
+        cls: t.Any = None,
+        kind: t.Optional[str] = None,
+        cls_arg: str = "",
+        parse_value: t.Any = None,
+    ) -> None:
+        """Initializer that takes the element and when the element maps
+        to a node, the node class, kind, parent class arg and value
+        parser. Elements outside of module children have the module class
+        and no kind, elements that are skipped have neither."""
+
+        self.element = element
+        self.cls = cls
+        self.kind = kind
+        self.cls_arg = cls_arg
+        self.parse_value = parse_value
+        self.values: t.Dict[str, t.Any] = dict()
+
+
+class TreeBuilder:
+    """Base class for builders of node trees from serialized data."""
+
+    def __init__(self, module_cls: t.Any, /) -> None:
+        """Initializer that takes the module node class to build."""
+
+        self.module_cls = module_cls
+        self._missing: t.Dict[type, t.Tuple[t.Tuple[str, t.Any, str], ...]] = (
+            dict()
+        )
+
+    def _missing_children(
+        self, cls: t.Any, /
+    ) -> t.Tuple[t.Tuple[str, t.Any, str], ...]:
+        """Returns class arg, class and kind of each container, list and
+        leaf list child of class without a default."""
+
+        if (missing := self._missing.get(cls)) is None:
+            defaults = cls.__meta__[DEFAULTS]
+            children = list()
+            for (
+                cls_arg,
+                child_cls,
+                kind,
+                _,
+            ) in cls._cls_xml_renderer.elements.values():
+                default = defaults.get(cls_arg, UNSET)
+                if type(default) is MetaInfo:
+                    default = default.default
+                if kind != LEAF and default is UNSET:
+                    children.append((cls_arg, child_cls, kind))
+            missing = self._missing[cls] = tuple(children)
+
+        return missing
+
+    def fill_missing(
+        self, cls: t.Any, values: t.Dict[str, t.Any], /
+    ) -> t.Dict[str, t.Any]:
+        """Returns values of class args, where absent containers, lists and
+        leaf lists without a default are created empty."""
+
+        for cls_arg, child_cls, kind in self._missing_children(cls):
+            if cls_arg not in values:
+                if kind == CONTAINER:
+                    values[cls_arg] = self.create_node(child_cls, dict())
+                else:
+                    values[cls_arg] = child_cls()
+
+        return values
+
+    def create_node(self, cls: t.Any, values: t.Dict[str, t.Any], /) -> t.Any:
+        """Returns a new node of class from values. See fill_missing."""
+
+        return cls(**self.fill_missing(cls, values))
+
+
+class LazySource:
+    """Source of a lazily parsed container or list node, the document
+    that was parsed and the span of each element or value of the node in
+    the document. See Node._create_lazy."""
+
+    __slots__ = ("builder", "text", "kind", "spans")
+
+    def __init__(
+        self,
+        builder: t.Any,
+        text: str,
+        kind: str,
+        spans: t.List[t.Tuple[int, int]],
+        /,
+    ) -> None:
+        """Initializer that takes the lazy builder of the node, the text of
+        the document, the kind of the node and the start and end offset
+        of each span."""
+
+        self.builder = builder
+        self.text = text
+        self.kind = kind
+        self.spans = spans
+
+    def materialize(self, node: t.Any, /) -> None:
+        """Builds the args or entries of node from source."""
+
+        self.builder.materialize(node, self)
+
+    def raw_xml(self, start_tag: str, /) -> t.Optional[str]:
+        """Returns the XML elements of source verbatim when source is XML
+        and each element starts with start tag, otherwise None."""
+
+        return self.builder.raw_xml(self, start_tag)
+
+    def raw_json(self) -> t.Optional[str]:
+        """Returns the JSON value of source verbatim when source is JSON,
+        otherwise None."""
+
+        return self.builder.raw_json(self)
+
+    def is_empty(self) -> bool:
+        """Returns True when source is an empty JSON array."""
+
+        return self.builder.is_empty(self)
+
+
+class XMLTreeBuilder(TreeBuilder):
+    """Builds a node tree from XML incrementally. Elements are mapped to
+    node classes through each class identifier and args, and are cleared
+    once built, so memory is bounded by the node tree and not by the XML
+    document."""
+
+    def _open(
+        self, element: ElementTree.Element, parent: t.Optional[XMLFrame], /
+    ) -> XMLFrame:
+        """Returns frame of element opened within parent frame."""
+
+        namespace, name = split_xml_tag(element.tag)
+        if parent is None or (parent.kind is None and parent.cls):
+            # Element outside of module children, or a module child.
+            renderer = self.module_cls._cls_xml_renderer
+            if namespace in (None, renderer.namespace) and (
+                plan := renderer.elements.get(name)
+            ):
+                return XMLFrame(element, plan[1], plan[2], plan[0], plan[3])
+            return XMLFrame(element, self.module_cls)
+
+        if parent.kind in (CONTAINER, LIST) and (
+            plan := parent.cls._cls_xml_renderer.elements.get(name)
+        ):
+            return XMLFrame(element, plan[1], plan[2], plan[0], plan[3])
+
+        # Element does not map to a node.
+        return XMLFrame(element)
+
+    def _close(self, frame: XMLFrame, values: t.Dict[str, t.Any], /) -> None:
+        """Builds node from closed frame into parent values."""
+
+        if frame.kind == LEAF:
+            values[frame.cls_arg] = frame.cls(
+                frame.parse_value(frame.element.text or "")
+            )
+        elif frame.kind == LEAF_LIST:
+            if (leaf_list := values.get(frame.cls_arg)) is None:
+                leaf_list = values[frame.cls_arg] = frame.cls()
+            leaf_list.append(frame.parse_value(frame.element.text or ""))
+        elif frame.kind == LIST:
+            if (list_node := values.get(frame.cls_arg)) is None:
+                list_node = values[frame.cls_arg] = frame.cls()
+            list_node.append(**self.fill_missing(frame.cls, frame.values))
+        elif frame.kind == CONTAINER:
+            values[frame.cls_arg] = self.create_node(frame.cls, frame.values)
+
+    def parse(self, source: t.Union[str, t.IO], /) -> t.Any:
+        """Returns a new module node from source, a path or file-like
+        object. Elements outside of module children, such as NETCONF
+        rpc-reply and data, are descended into, and elements that do not
+        map to a node are skipped."""
+
+        values: t.Dict[str, t.Any] = dict()
+        stack: t.List[XMLFrame] = list()
+        for event, element in ElementTree.iterparse(
+            source, events=("start", "end")
+        ):
+            if event == "start":
+                stack.append(self._open(element, stack[-1] if stack else None))
+                continue
+
+            frame = stack.pop()
+            if stack and stack[-1].kind is not None:
+                self._close(frame, stack[-1].values)
+            else:
+                self._close(frame, values)
+
+            # Elements are not needed once built, therefore parent
+            # elements are emptied so that the document is not retained.
+            element.clear()
+            if stack:
+                del stack[-1].element[:]
+
+        return self.create_node(self.module_cls, values)
+
+
+class LazyXMLTreeBuilder(TreeBuilder):
+    """Builds a node tree from XML lazily. The document is read whole and
+    its tags are scanned one level of children at a time, children that
+    are containers or lists are created as lazy nodes that record the
+    offsets of their elements and are built on first access, so that
+    elements of untouched subtrees are only skipped over. Lazy nodes
+    that are serialized to XML untouched emit their elements verbatim.
+    The document is retained as long as lazy nodes are, and its
+    well-formedness is only checked where it is built."""
+
+    # Markup of XML text, groups are CDATA content, end tag name, and
+    # start tag name, attributes and whether the element is empty.
+    MARKUP: t.ClassVar[re.Pattern] = re.compile(
+        r"<(?:!--.*?--|!\[CDATA\[(.*?)\]\]|\?.*?\?|![^>]*"
+        r"|/([^\s>]+)\s*"
+        r"|([^\s/>]+)((?:\s+[^\s=>]+\s*=\s*(?:\"[^\"]*\"|'[^']*'))*)\s*(/?))>",
+        re.S,
+    )
+    ATTRIBUTE: t.ClassVar[re.Pattern] = re.compile(
+        r"([^\s=]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')"
+    )
+    REFERENCE: t.ClassVar[re.Pattern] = re.compile(
+        r"&(#x[0-9a-fA-F]+|#[0-9]+|\w+);"
+    )
+    ENTITIES: t.ClassVar[t.Dict[str, str]] = dict(
+        lt="<", gt=">", amp="&", apos="'", quot='"'
+    )
+    ENCODING: t.ClassVar[re.Pattern] = re.compile(
+        rb"<\?xml[^>]*encoding\s*=\s*[\"']([A-Za-z0-9._-]+)"
+    )
+
+    def __init__(self, module_cls: t.Any, /) -> None:
+        """Initializer that takes the module node class to build."""
+
+        super().__init__(module_cls)
+        self._tags: t.Dict[str, re.Pattern] = dict()
+
+    @classmethod
+    def _replace_reference(cls, match: re.Match, /) -> str:
+        """Returns character of entity or character reference."""
+
+        name = match.group(1)
+        if name[:2] == "#x":
+            return chr(int(name[2:], 16))
+        if name[:1] == "#":
+            return chr(int(name[1:]))
+        if (char := cls.ENTITIES.get(name)) is None:
+            raise ValueError(f"Undefined XML entity: {match.group()}")
+        return char
+
+    def _skip(
+        self, text: str, match: re.Match, /
+    ) -> t.Tuple[int, t.Optional[str]]:
+        """Returns end offset and character data of the element that
+        match starts, character data of child elements is not
+        included."""
+
+        if match.group(5):
+            return match.end(), ""
+
+        chunks: t.List[str] = list()
+        search = self.MARKUP.search
+        position = match.end()
+        depth = 0
+        while markup := search(text, position):
+            if not depth:
+                chunks.append(text[position : markup.start()])
+            position = markup.end()
+            if markup.group(3):
+                if not markup.group(5):
+                    depth += 1
+            elif markup.group(2):
+                if not depth:
+                    value = "".join(chunks)
+                    if "&" in value:
+                        value = self.REFERENCE.sub(
+                            self._replace_reference, value
+                        )
+                    return position, value
+                depth -= 1
+            elif (cdata := markup.group(1)) is not None and not depth:
+                # Ampersands of CDATA sections are escaped, so that they
+                # are not replaced as references.
+                chunks.append(cdata.replace("&", "&#38;"))
+        raise ValueError(f"Unclosed XML element at offset {match.start()}.")
+
+    def _skip_subtree(self, text: str, match: re.Match, /) -> int:
+        """Returns end offset of the element that match starts, found
+        through the tags of the element name only. Comments, CDATA
+        sections and processing instructions are skipped as in MARKUP,
+        so that tags within them are not counted."""
+
+        if match.group(5):
+            return match.end()
+
+        tag = match.group(3)
+        if (pattern := self._tags.get(tag)) is None:
+            pattern = self._tags[tag] = re.compile(
+                r"<(?:!--.*?--|!\[CDATA\[.*?\]\]|\?.*?\?|![^>]*"
+                rf"|(/?){re.escape(tag)}"
+                r"(?:\s(?:[^>\"']|\"[^\"]*\"|'[^']*')*?)?(/?))>",
+                re.S,
+            )
+        position = match.end()
+        depth = 1
+        while depth:
+            if (found := pattern.search(text, position)) is None:
+                raise ValueError(
+                    f"Unclosed XML element at offset {match.start()}."
+                )
+            position = found.end()
+            if found.group(1) is None:
+                continue
+            if found.group(1):
+                depth -= 1
+            elif not found.group(2):
+                depth += 1
+        return position
+
+    def _scan_field(
+        self,
+        text: str,
+        match: re.Match,
+        plan: t.Tuple[str, t.Any, str, t.Any],
+        values: t.Dict[str, t.Any],
+        /,
+    ) -> int:
+        """Builds child of plan from the element that match starts into
+        values, containers and lists are lazy. Returns end offset of the
+        element."""
+
+        cls_arg, cls, kind, parse_value = plan
+        if kind in (CONTAINER, LIST):
+            end, value = self._skip_subtree(text, match), None
+        else:
+            end, value = self._skip(text, match)
+        if kind == LEAF:
+            values[cls_arg] = cls(parse_value(value))
+        elif kind == LEAF_LIST:
+            if (leaf_list := values.get(cls_arg)) is None:
+                leaf_list = values[cls_arg] = cls()
+            leaf_list.append(parse_value(value))
+        elif kind == LIST and (list_node := values.get(cls_arg)):
+            list_node._lazy.spans.append((match.start(), end))
+        else:
+            values[cls_arg] = cls._create_lazy(
+                LazySource(self, text, kind, [(match.start(), end)])
+            )
+        return end
+
+    def _scan_children(
+        self, text: str, start: int, end: int, cls: t.Any, /
+    ) -> t.Dict[str, t.Any]:
+        """Returns values of the children of class from the element of
+        text between start and end offsets."""
+
+        values: t.Dict[str, t.Any] = dict()
+        elements = cls._cls_xml_renderer.elements
+        search = self.MARKUP.search
+        markup = search(text, start)
+        if markup is None or markup.group(5):
+            return values
+
+        position = markup.end()
+        while markup := search(text, position, end):
+            position = markup.end()
+            if markup.group(2):
+                break
+            if not (tag := markup.group(3)):
+                continue
+            if plan := elements.get(tag.rpartition(":")[2]):
+                position = self._scan_field(text, markup, plan, values)
+            else:
+                position, _ = self._skip(text, markup)
+        return values
+
+    def _scan_module(self, text: str, /) -> t.Dict[str, t.Any]:
+        """Returns values of module children from text. Elements outside of
+        module children are descended into, see XMLTreeBuilder.parse."""
+
+        values: t.Dict[str, t.Any] = dict()
+        renderer = self.module_cls._cls_xml_renderer
+        # Namespace declarations in scope of each open element.
+        scopes: t.List[t.Dict[str, str]] = [dict()]
+        search = self.MARKUP.search
+        position = 0
+        while markup := search(text, position):
+            position = markup.end()
+            if markup.group(2):
+                scopes.pop()
+                continue
+            if not (tag := markup.group(3)):
+                continue
+
+            scope = scopes[-1]
+            if "xmlns" in (attrs := markup.group(4)):
+                scope = dict(scope)
+                for attr in self.ATTRIBUTE.finditer(attrs):
+                    if attr.group(1)[:5] == "xmlns":
+                        scope[attr.group(1)] = attr.group(2) or attr.group(3)
+            prefix, _, name = tag.rpartition(":")
+            namespace = scope.get(f"xmlns:{prefix}" if prefix else "xmlns")
+            if namespace in (None, renderer.namespace) and (
+                plan := renderer.elements.get(name)
+            ):
+                position = self._scan_field(text, markup, plan, values)
+            elif not markup.group(5):
+                scopes.append(scope)
+
+        return values
+
+    def materialize(self, node: t.Any, source: LazySource, /) -> None:
+        """Builds the args or entries of lazy node from source."""
+
+        cls = node.__class__
+        text = source.text
+        if source.kind == LIST:
+            node.__init__()
+            for start, end in source.spans:
+                node.append(
+                    **self.fill_missing(
+                        cls, self._scan_children(text, start, end, cls)
+                    )
+                )
+        else:
+            ((start, end),) = source.spans
+            node.__init__(
+                **self.fill_missing(
+                    cls, self._scan_children(text, start, end, cls)
+                )
+            )
+
+    def raw_xml(
+        self, source: LazySource, start_tag: str, /
+    ) -> t.Optional[str]:
+        """Returns the elements of source verbatim when each starts with
+        start tag, otherwise None."""
+
+        text = source.text
+        elements = [text[start:end] for start, end in source.spans]
+        if all(element.startswith(start_tag) for element in elements):
+            return "".join(elements)
+        return None
+
+    def raw_json(self, source: LazySource, /) -> t.Optional[str]:
+        """Returns None, source is XML."""
+
+        return None
+
+    def is_empty(self, source: LazySource, /) -> bool:
+        """Returns False, elements of source are entries."""
+
+        return False
+
+    def parse(self, source: t.Union[str, t.IO], /) -> t.Any:
+        """Returns a new module node from source, a path or file-like
+        object, that is read whole. See XMLTreeBuilder.parse."""
+
+        if isinstance(source, str):
+            with open(source, "rb") as file:
+                return self.parse(file)
+
+        text = source.read()
+        if isinstance(text, bytes):
+            encoding = "utf-8-sig"
+            if text[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+                encoding = "utf-16"
+            elif declaration := self.ENCODING.match(text):
+                encoding = declaration.group(1).decode()
+            text = text.decode(encoding)
+        return self.create_node(self.module_cls, self._scan_module(text))
+
+
+class JSONTokenizer:
+    """Pull tokenizer of JSON text read from a file-like object chunk by
+    chunk, only the unconsumed part of the current chunk is retained."""
+
+    __slots__ = ("_read", "_decode", "_buffer", "_index", "_eof")
+
+    TOKEN_START: t.ClassVar[re.Pattern] = re.compile(r"[^ \t\n\r]")
+    SCALAR_END: t.ClassVar[re.Pattern] = re.compile(r"[ \t\n\r,:\]}]")
+    PUNCTUATION: t.ClassVar[str] = "{}[]:,"
+    LITERALS: t.ClassVar[t.Dict[str, t.Any]] = dict(
+        true=True, false=False, null=None
+    )
+    DECODER: t.ClassVar[json.JSONDecoder] = json.JSONDecoder()
+
+    def __init__(self, source: t.IO, /, *, chunk_size: int = 65536) -> None:
+        """Initializer that takes the file-like object to read from."""
+
+        self._read = lambda: source.read(chunk_size)
+        self._decode = codecs.getincrementaldecoder("utf-8")().decode
+        self._buffer = ""
+        self._index = 0
+        self._eof = False
+
+    @classmethod
+    def from_text(cls, text: str, index: int = 0, /) -> "JSONTokenizer":
+        """Returns a tokenizer of text whole from index, buffer indexes
+        are text indexes."""
+
+        tokens = cls(io.StringIO())
+        tokens._buffer = text
+        tokens._index = index
+        tokens._eof = True
+        return tokens
+
+    def _fill(self) -> bool:
+        """Appends the next chunk to the unconsumed buffer, returns False
+        when source is exhausted."""
+
+        if self._eof:
+            return False
+        if not (chunk := self._read()):
+            self._eof = True
+            return False
+        if isinstance(chunk, bytes):
+            # Binary sources are decoded as RFC 8259 requires, a chunk
+            # may end within a character.
+            chunk = self._decode(chunk)
+        self._buffer = self._buffer[self._index :] + chunk
+        self._index = 0
+        return True
+
+    def _peek(self) -> int:
+        """Returns the buffer index of the next character that is not
+        whitespace, or -1 at end of text."""
+
+        while not (
+            match := self.TOKEN_START.search(self._buffer, self._index)
+        ):
+            self._index = len(self._buffer)
+            if not self._fill():
+                return -1
+
+        return match.start()
+
+    def next(self) -> t.Tuple[str, t.Any]:
+        """Returns the next token, a tuple of punctuation character and
+        None, "string" and the string, or "scalar" and the number, bool or
+        None. At end of text returns an empty token."""
+
+        if (index := self._peek()) < 0:
+            return ("", None)
+
+        buffer = self._buffer
+        char = buffer[index]
+        if char in self.PUNCTUATION:
+            self._index = index + 1
+            return (char, None)
+
+        if char == '"':
+            try:
+                value, self._index = scanstring(buffer, index + 1)
+            except ValueError:
+                # String may continue in the next chunk.
+                self._index = index
+                if not self._fill():
+                    raise
+                return self.next()
+            return ("string", value)
+
+        if not self.SCALAR_END.search(buffer, index) and not self._eof:
+            # Scalar may continue in the next chunk.
+            self._index = index
+            self._fill()
+            return self.next()
+
+        if match := NUMBER_RE.match(buffer, index):
+            integer, fraction, exponent = match.groups()
+            self._index = match.end()
+            if fraction or exponent:
+                return ("scalar", float(match.group()))
+            return ("scalar", int(integer))
+
+        for literal, value in self.LITERALS.items():
+            if buffer.startswith(literal, index):
+                self._index = index + len(literal)
+                return ("scalar", value)
+
+        raise ValueError(f"Unexpected JSON text: {buffer[index : index + 16]}")
+
+    def decode(self) -> t.Any:
+        """Returns the next value decoded whole, which is faster than
+        tokens for small values such as list entries of leaves."""
+
+        if (start := self._peek()) < 0:
+            raise ValueError("Unexpected end of JSON text.")
+        try:
+            value, end = self.DECODER.raw_decode(self._buffer, start)
+        except ValueError:
+            # Value may continue in the next chunk.
+            if not self._fill():
+                raise
+            return self.decode()
+        if end == len(self._buffer) and self._fill():
+            # Scalar may continue in the next chunk.
+            return self.decode()
+
+        self._index = end
+        return value
+
+    def skip_span(self) -> t.Tuple[int, int]:
+        """Consumes the next value, that must be in the buffer whole, and
+        returns the buffer index of its start and end."""
+
+        if (start := self._peek()) < 0:
+            raise ValueError("Unexpected end of JSON text.")
+        _, self._index = self.DECODER.raw_decode(self._buffer, start)
+        return start, self._index
+
+    def iter_decoded_items(self) -> t.Iterator[t.Any]:
+        """Yields each item of the array whose opening bracket was
+        consumed decoded whole. See decode."""
+
+        if (index := self._peek()) >= 0 and self._buffer[index] == "]":
+            self._index = index + 1
+            return
+        while True:
+            yield self.decode()
+            token, _ = self.next()
+            if token == "]":
+                return
+            if token != ",":
+                raise ValueError(f"Expected JSON , or ], got {token}.")
+
+    def expect(self, expected: str, /) -> t.Any:
+        """Returns the value of the next token, which must be expected."""
+
+        token, value = self.next()
+        if token != expected:
+            raise ValueError(
+                f"Expected JSON {expected or 'end'}, got {token or 'end'}."
+            )
+        return value
+
+    def iter_members(self) -> t.Iterator[str]:
+        """Yields the name of each member of the object whose opening
+        brace was consumed, the member value must be consumed before the
+        next name is yielded."""
+
+        token, value = self.next()
+        if token == "}":
+            return
+        while True:
+            if token != "string":
+                raise ValueError(f"Expected JSON string, got {token}.")
+            self.expect(":")
+            yield value
+            token, _ = self.next()
+            if token == "}":
+                return
+            if token != ",":
+                raise ValueError(f"Expected JSON , or }}, got {token}.")
+            token, value = self.next()
+
+    def iter_items(self) -> t.Iterator[t.Tuple[str, t.Any]]:
+        """Yields the first token of each item of the array whose opening
+        bracket was consumed, the item must be consumed before the next
+        token is yielded."""
+
+        token, value = self.next()
+        if token == "]":
+            return
+        while True:
+            yield token, value
+            token, _ = self.next()
+            if token == "]":
+                return
+            if token != ",":
+                raise ValueError(f"Expected JSON , or ], got {token}.")
+            token, value = self.next()
+
+    def skip(self, token: str, /) -> None:
+        """Consumes the value that token starts."""
+
+        depth = 1 if token in ("{", "[") else 0
+        while depth:
+            token, _ = self.next()
+            if token in ("{", "["):
+                depth += 1
+            elif token in ("}", "]"):
+                depth -= 1
+            elif not token:
+                raise ValueError("Unexpected end of JSON text.")
+
+
+class JSONTreeBuilder(TreeBuilder):
+    """Builds a node tree from JSON (RFC 7951) incrementally. Members are
+    mapped to node classes through each class identifier and args as
+    tokens are read, so memory is bounded by the node tree and not by
+    the JSON text."""
+
+    def __init__(self, module_cls: t.Any, /) -> None:
+        """Initializer that takes the module node class to build."""
+
+        super().__init__(module_cls)
+        self._flat: t.Dict[type, bool] = dict()
+
+    def _is_flat(self, cls: t.Any, /) -> bool:
+        """Returns True when children of class are leaves or leaf lists,
+        so that entries are small enough to be decoded whole."""
+
+        if (flat := self._flat.get(cls)) is None:
+            flat = self._flat[cls] = all(
+                kind in (LEAF, LEAF_LIST)
+                for _, _, kind, _ in cls._cls_xml_renderer.elements.values()
+            )
+
+        return flat
+
+    @staticmethod
+    def _convert(value: t.Any, parse_value: t.Callable[[str], t.Any], /):
+        """Returns leaf value from decoded value. Strings are parsed, since
+        RFC 7951 encodes some numbers as strings, and [null] is the empty
+        value."""
+
+        if type(value) is str:
+            return parse_value(value)
+        if type(value) is list and value == [None]:
+            return None
+        return value
+
+    def _build_decoded(self, cls: t.Any, item: t.Any, /) -> t.Dict[str, t.Any]:
+        """Returns values of each member of decoded object mapped to a leaf
+        or leaf list child of class. See _build_members."""
+
+        if type(item) is not dict:
+            raise ValueError(f"Expected JSON object, got {item!r}.")
+
+        values: t.Dict[str, t.Any] = dict()
+        elements = cls._cls_xml_renderer.elements
+        for name, value in item.items():
+            if plan := elements.get(name.rpartition(":")[2]):
+                cls_arg, child_cls, kind, parse_value = plan
+                if kind == LEAF:
+                    values[cls_arg] = self._convert(value, parse_value)
+                elif type(value) is list:
+                    values[cls_arg] = child_cls.from_rows(
+                        [self._convert(entry, parse_value) for entry in value]
+                    )
+                else:
+                    raise ValueError(f"Expected JSON array, got {value!r}.")
+
+        return self.fill_missing(cls, values)
+
+    def _build(
+        self,
+        tokens: JSONTokenizer,
+        plan: t.Tuple[str, t.Any, str, t.Any],
+        values: t.Dict[str, t.Any],
+        /,
+    ) -> None:
+        """Builds node of plan from the member value into values."""
+
+        cls_arg, cls, kind, parse_value = plan
+        if kind == LEAF:
+            values[cls_arg] = cls(self._convert(tokens.decode(), parse_value))
+        elif kind == LEAF_LIST:
+            if type(value := tokens.decode()) is not list:
+                raise ValueError(f"Expected JSON array, got {value!r}.")
+            values[cls_arg] = cls.from_rows(
+                [self._convert(entry, parse_value) for entry in value]
+            )
+        elif kind == CONTAINER:
+            tokens.expect("{")
+            values[cls_arg] = self.create_node(
+                cls, self._build_members(tokens, cls, dict())
+            )
+        else:
+            values[cls_arg] = cls()
+            self._build_list(tokens, values[cls_arg])
+
+    def _build_list(self, tokens: JSONTokenizer, list_node: t.Any, /) -> None:
+        """Builds entries of list node from the array value."""
+
+        cls = list_node.__class__
+        tokens.expect("[")
+        if self._is_flat(cls):
+            list_node.extend(
+                self._build_decoded(cls, item)
+                for item in tokens.iter_decoded_items()
+            )
+            return
+
+        for token, _ in tokens.iter_items():
+            if token != "{":
+                raise ValueError(f"Expected JSON {{, got {token}.")
+            list_node.append(
+                **self.fill_missing(
+                    cls, self._build_members(tokens, cls, dict())
+                )
+            )
+
+    def _build_members(
+        self, tokens: JSONTokenizer, cls: t.Any, values: t.Dict[str, t.Any], /
+    ) -> t.Dict[str, t.Any]:
+        """Returns values with each member of the object mapped to a child
+        of class, members are resolved by identifier regardless of module
+        qualification. Members that do not map to a child are skipped."""
+
+        elements = cls._cls_xml_renderer.elements
+        for name in tokens.iter_members():
+            if plan := elements.get(name.rpartition(":")[2]):
+                self._build(tokens, plan, values)
+            else:
+                tokens.skip(tokens.next()[0])
+
+        return values
+
+    def _build_module_members(
+        self, tokens: JSONTokenizer, values: t.Dict[str, t.Any], /
+    ) -> None:
+        """Builds each member of the object mapped to a module child into
+        values. Members qualified by other modules, such as RESTCONF
+        ietf-restconf:data, are descended into when they are objects and
+        skipped otherwise."""
+
+        identifier = self.module_cls.__meta__[DEFAULTS][IDENTIFIER]
+        elements = self.module_cls._cls_xml_renderer.elements
+        for name in tokens.iter_members():
+            prefix, _, name = name.rpartition(":")
+            if prefix in ("", identifier) and (plan := elements.get(name)):
+                self._build(tokens, plan, values)
+            elif (token := tokens.next()[0]) == "{":
+                self._build_module_members(tokens, values)
+            else:
+                tokens.skip(token)
+
+    def _tokenize(self, source: t.IO, /) -> JSONTokenizer:
+        """Returns tokenizer of source."""
+
+        return JSONTokenizer(source)
+
+    def parse(self, source: t.Union[str, t.IO], /) -> t.Any:
+        """Returns a new module node from source, a path or file-like
+        object."""
+
+        if isinstance(source, str):
+            with open(source, encoding="utf-8") as file:
+                return self.parse(file)
+
+        tokens = self._tokenize(source)
+        values: t.Dict[str, t.Any] = dict()
+        tokens.expect("{")
+        self._build_module_members(tokens, values)
+        tokens.expect("")
+        return self.create_node(self.module_cls, values)
+
+
+class LazyJSONTreeBuilder(JSONTreeBuilder):
+    """Builds a node tree from JSON (RFC 7951) lazily. The text is read
+    whole, members that are containers or lists are created as lazy
+    nodes that record the offsets of their values and are built on
+    first access. Lazy nodes that are serialized to JSON untouched emit
+    their values verbatim. The text is retained as long as lazy nodes
+    are."""
+
+    def __init__(self, module_cls: t.Any, /) -> None:
+        """Initializer that takes the module node class to build."""
+
+        super().__init__(module_cls)
+        self.text = ""
+
+    def _tokenize(self, source: t.IO, /) -> JSONTokenizer:
+        """Returns tokenizer of source read whole."""
+
+        text = source.read()
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+        self.text = text
+        return JSONTokenizer.from_text(text)
+
+    def _build(
+        self,
+        tokens: JSONTokenizer,
+        plan: t.Tuple[str, t.Any, str, t.Any],
+        values: t.Dict[str, t.Any],
+        /,
+    ) -> None:
+        """Builds node of plan from the member value into values, lazily
+        when node is a container or list."""
+
+        cls_arg, cls, kind, _ = plan
+        if kind not in (CONTAINER, LIST):
+            super()._build(tokens, plan, values)
+            return
+        values[cls_arg] = cls._create_lazy(
+            LazySource(self, self.text, kind, [tokens.skip_span()])
+        )
+
+    def materialize(self, node: t.Any, source: LazySource, /) -> None:
+        """Builds the args or entries of lazy node from source."""
+
+        ((start, _),) = source.spans
+        tokens = JSONTokenizer.from_text(source.text, start)
+        if source.kind == LIST:
+            node.__init__()
+            self._build_list(tokens, node)
+        else:
+            cls = node.__class__
+            tokens.expect("{")
+            node.__init__(
+                **self.fill_missing(
+                    cls, self._build_members(tokens, cls, dict())
+                )
+            )
+
+    def raw_xml(
+        self, source: LazySource, start_tag: str, /
+    ) -> t.Optional[str]:
+        """Returns None, source is JSON."""
+
+        return None
+
+    def raw_json(self, source: LazySource, /) -> t.Optional[str]:
+        """Returns the value of source verbatim."""
+
+        ((start, end),) = source.spans
+        return source.text[start:end]
+
+    def is_empty(self, source: LazySource, /) -> bool:
+        """Returns True when source is an empty array."""
+
+        ((start, end),) = source.spans
+        return not source.text[start + 1 : end - 1].strip()
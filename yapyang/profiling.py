@@ -0,0 +1,245 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import contextlib
+import functools
+import sys
+import threading
+import time
+import typing as t
+
+from yapyang.constants import DEFAULTS, IDENTIFIER
+
+__all__ = ("profile", "Stats")
+
+# Operation recorded for each instrumented method of node classes.
+OPERATIONS: t.Dict[str, str] = {
+    "__init__": "construct",
+    "append": "append",
+    "_iter_xml": "xml",
+    "_iter_json": "json",
+}
+# Instrumented methods that are generators of serialized chunks.
+GENERATORS = frozenset(("_iter_xml", "_iter_json"))
+
+# Stack of frames of running instrumented calls, each the time and bytes
+# of nested instrumented calls, per thread.
+_local = threading.local()
+_enabled = False
+
+
+class Record:
+    """Calls, exclusive seconds and for serializers exclusive bytes
+    produced, of an operation of a node class."""
+
+    __slots__ = ("calls", "time", "bytes")
+
+    def __init__(self) -> None:
+        """Initializer that creates an empty record."""
+
+        self.calls = 0
+        self.time = 0.0
+        self.bytes = 0
+
+
+class Stats:
+    """Records of each operation of each node class, collected by
+    profile."""
+
+    __slots__ = ("records",)
+
+    def __init__(self) -> None:
+        """Initializer that creates empty records."""
+
+        self.records: t.Dict[type, t.Dict[str, Record]] = dict()
+
+    def record(self, cls: type, operation: str, /) -> Record:
+        """Returns the record of operation of class, created when
+        missing."""
+
+        operations = self.records.setdefault(cls, dict())
+        if (record := operations.get(operation)) is None:
+            record = operations[operation] = Record()
+        return record
+
+    def dump(self, sink: t.Optional[t.TextIO] = None, /) -> None:
+        """Writes a row of calls, seconds and bytes for each called
+        operation of each class into sink, standard output by default,
+        slowest first. Construct calls are instance counts."""
+
+        rows = sorted(
+            (
+                (f"{cls.__module__}.{cls.__qualname__}", operation, record)
+                for cls, operations in self.records.items()
+                for operation, record in operations.items()
+                if record.calls
+            ),
+            key=lambda row: row[2].time,
+            reverse=True,
+        )
+        write = (sink or sys.stdout).write
+        width = max((len(row[0]) for row in rows), default=5)
+        write(
+            f"{'class':<{width}} {'operation':<9} {'calls':>9} "
+            f"{'seconds':>10} {'bytes':>12}\n"
+        )
+        for name, operation, record in rows:
+            write(
+                f"{name:<{width}} {operation:<9} {record.calls:>9} "
+                f"{record.time:>10.6f} {record.bytes:>12}\n"
+            )
+
+
+def _frames() -> t.List[t.List[t.Any]]:
+    """Returns the frame stack of the current thread."""
+
+    try:
+        return _local.frames
+    except AttributeError:
+        frames = _local.frames = list()
+        return frames
+
+
+def _instrument_call(
+    function: t.Callable[..., t.Any], record: Record, /
+) -> t.Callable[..., t.Any]:
+    """Returns a wrapper of function that records calls and exclusive time
+    of function."""
+
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        frames = _frames()
+        frame = [0.0, 0]
+        frames.append(frame)
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            frames.pop()
+            record.calls += 1
+            record.time += elapsed - frame[0]
+            if frames:
+                frames[-1][0] += elapsed
+
+    return wrapper
+
+
+def _instrument_generator(
+    function: t.Callable[..., t.Iterator[str]], record: Record, /
+) -> t.Callable[..., t.Iterator[str]]:
+    """Returns a wrapper of generator function that records calls,
+    exclusive time and exclusive bytes of the chunks it yields. Chunks
+    yielded by nested instrumented generators, directly or joined, are
+    recorded by the nested generators only."""
+
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args):
+        record.calls += 1
+        iterator = function(*args)
+        while True:
+            frames = _frames()
+            frame = [0.0, 0]
+            frames.append(frame)
+            start = perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed = perf_counter() - start
+                frames.pop()
+                record.time += elapsed - frame[0]
+                if frames:
+                    frames[-1][0] += elapsed
+            size = len(chunk.encode())
+            record.bytes += size - frame[1]
+            if frames:
+                frames[-1][1] += size
+            yield chunk
+
+    return wrapper
+
+
+def _iter_node_classes() -> t.Iterator[type]:
+    """Yields each node class with an identifier, which excludes the base
+    classes and subclasses of lazily parsed instances."""
+
+    # Nodes import this module.
+    from yapyang.nodes import Node
+
+    seen = set()
+    pending = [Node]
+    while pending:
+        cls = pending.pop()
+        for subclass in cls.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                pending.append(subclass)
+        meta = cls.__dict__.get("__meta__")
+        if meta is not None and IDENTIFIER in meta[DEFAULTS]:
+            yield cls
+
+
+@contextlib.contextmanager
+def profile() -> t.Iterator[Stats]:
+    """Returns a context manager that records, for each node class
+    defined on entry, instances constructed, appends, and time spent and
+    bytes produced by XML and JSON serialization, into the stats it
+    yields. Time and bytes are exclusive of nested node classes, except
+    for leaves rendered by their parents. Wrappers of the instrumented
+    methods are installed on entry and removed on exit, so when not
+    profiling nodes run unchanged."""
+
+    global _enabled
+
+    if _enabled:
+        raise RuntimeError("Profiling is already enabled.")
+
+    stats = Stats()
+    # Tuples of class, method name and method defined by class or None.
+    installed: t.List[t.Tuple[type, str, t.Any]] = list()
+    # Resolve every method before installing any wrapper, so that wrappers
+    # never wrap the wrappers of parent classes.
+    methods = [
+        (cls, name, function)
+        for cls in _iter_node_classes()
+        for name in OPERATIONS
+        if (function := getattr(cls, name, None)) is not None
+    ]
+    _enabled = True
+    try:
+        for cls, name, function in methods:
+            record = stats.record(cls, OPERATIONS[name])
+            instrument = (
+                _instrument_generator
+                if name in GENERATORS
+                else _instrument_call
+            )
+            installed.append((cls, name, cls.__dict__.get(name)))
+            setattr(cls, name, instrument(function, record))
+        yield stats
+    finally:
+        for cls, name, own in reversed(installed):
+            if own is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, own)
+        _enabled = False
@@ -0,0 +1,279 @@
+"""
+Copyright 2024 Nomios UK&I
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import functools
+import operator
+import re
+import typing as t
+
+from yapyang.constants import ARGS, DEFAULTS, LEAF, LEAF_LIST, LIST
+from yapyang.utils import create_function, is_optional_arg
+
+__all__ = ("Query", "compile_query")
+
+# Step of a path, an optionally prefixed identifier and its predicates.
+STEP = re.compile(
+    r"/(?:[^\W\d][\w.-]*:)?([^\W\d][\w.-]*)"
+    r"((?:\[(?:[^\]'\"]|'[^']*'|\"[^\"]*\")*\])*)"
+)
+# Predicate of a step, a leaf or the leaf list value equal to a quoted
+# literal, or a position.
+PREDICATE = re.compile(
+    r"\[\s*(?:"
+    r"(?:(?:[^\W\d][\w.-]*:)?([^\W\d][\w.-]*)|(\.))\s*=\s*"
+    r"(?:'([^']*)'|\"([^\"]*)\")"
+    r"|(\d+)"
+    r")\s*\]"
+)
+
+# Step of a compiled query, the kind and accessor of the child, the key
+# of the list entry or leaf list value to look up or UNKEYED, the filter
+# that returns entries whose leaves equal the values of predicates or
+# None, and the position of the match to select or 0 for every match.
+Step = t.Tuple[
+    str,
+    t.Callable[[t.Any], t.Any],
+    t.Any,
+    t.Optional[t.Callable[[t.Iterable[t.Any]], t.List[t.Any]]],
+    int,
+]
+
+# Key of steps that do not look up a single entry or value.
+UNKEYED = object()
+# Number of compiled queries kept, the least recently used are evicted so
+# that paths with distinct literals do not grow memory without bound.
+CACHE_SIZE = 1024
+
+
+class Query:
+    """Path of a subset of XPath (instance identifiers) compiled against
+    a module class into a chain of accessors, see compile_query."""
+
+    __slots__ = ("cls", "path", "steps")
+
+    def __init__(self, cls: t.Any, path: str, /) -> None:
+        """Initializer that compiles path against class, raises
+        ValueError when path is not supported or does not match a node
+        of class."""
+
+        self.cls = cls
+        self.path = path
+        steps: t.List[Step] = list()
+        node_cls, kind = cls, None
+        end = 0
+        for match in STEP.finditer(path):
+            if match.start() != end:
+                break
+            end = match.end()
+            identifier, predicates = match.groups()
+            if kind in (LEAF, LEAF_LIST):
+                raise ValueError(
+                    f"Unknown node {identifier} in {path}, {kind} nodes "
+                    "have no children."
+                )
+            try:
+                cls_arg, node_cls, kind, parse_value = (
+                    node_cls._cls_xml_renderer.elements[identifier]
+                )
+            except KeyError:
+                raise ValueError(f"Unknown node {identifier} in {path}.")
+            steps.append(
+                self._compile_step(
+                    node_cls, cls_arg, kind, parse_value, predicates
+                )
+            )
+        if not steps or end != len(path):
+            raise ValueError(f"Invalid path {path}.")
+        self.steps = tuple(steps)
+
+    def _compile_step(
+        self,
+        cls: t.Any,
+        cls_arg: str,
+        kind: str,
+        parse_value: t.Optional[t.Callable[[str], t.Any]],
+        predicates: str,
+        /,
+    ) -> Step:
+        """Returns the compiled step to child of class and kind at class
+        arg, whose entries or values match predicates. Equality with
+        every key leaf of a list becomes a key lookup."""
+
+        values: t.Dict[str, t.Any] = dict()
+        position = 0
+        end = 0
+        for match in PREDICATE.finditer(predicates):
+            if match.start() != end:
+                break
+            end = match.end()
+            name, dot, single, double, index = match.groups()
+            if index is not None and kind in (LIST, LEAF_LIST):
+                if (position := int(index)) < 1:
+                    raise ValueError(
+                        f"Invalid position {index} in {self.path}, "
+                        "positions start at 1."
+                    )
+                continue
+            literal = single if single is not None else double
+            if kind == LEAF_LIST and dot:
+                values["."] = self._parse(parse_value, literal, dot)
+            elif kind == LIST and name:
+                child = cls._cls_xml_renderer.elements.get(name)
+                if child is None or child[2] != LEAF:
+                    raise ValueError(
+                        f"Unknown leaf {name} in predicate of {self.path}."
+                    )
+                values[child[0]] = self._parse(child[3], literal, name)
+            else:
+                raise ValueError(
+                    f"Invalid predicate {match.group()} of {kind} in "
+                    f"{self.path}."
+                )
+        if end != len(predicates):
+            raise ValueError(f"Invalid predicate in {self.path}.")
+
+        key = UNKEYED
+        if kind == LEAF_LIST and "." in values:
+            key = values.pop(".")
+        elif kind == LIST and (key := cls.__meta__[DEFAULTS].get("__key__")):
+            key_args = key.split(",")
+            key = UNKEYED
+            if all(key_arg in values for key_arg in key_args):
+                key_values = [values.pop(key_arg) for key_arg in key_args]
+                key = (
+                    key_values[0]
+                    if len(key_values) == 1
+                    else tuple(key_values)
+                )
+        matcher = None
+        if values:
+            matcher = self._compile_filter(cls, values)
+        return kind, operator.attrgetter(cls_arg), key, matcher, position
+
+    def _compile_filter(
+        self, cls: t.Any, values: t.Dict[str, t.Any], /
+    ) -> t.Callable[[t.Iterable[t.Any]], t.List[t.Any]]:
+        """Returns a function compiled from values of leaf args of list
+        class, that returns entries whose leaves equal values. Absent
+        optional leaves equal no value."""
+
+        globals: t.Dict[str, t.Any] = dict()
+        conditions = list()
+        for leaf_arg, value in values.items():
+            globals[f"__value_{leaf_arg}"] = value
+            condition = (
+                f"__entry.{leaf_arg}.{self._value_arg(cls, leaf_arg)} "
+                f"== __value_{leaf_arg}"
+            )
+            if is_optional_arg(cls.__meta__, leaf_arg):
+                condition = f"(__entry.{leaf_arg} is not None and {condition})"
+            conditions.append(condition)
+        return create_function(
+            "__filter",
+            ("__entries",),
+            (
+                "return [__entry for __entry in __entries if "
+                f"{' and '.join(conditions)}]",
+            ),
+            globals=globals,
+            qualname=f"{self.__class__.__name__}.__filter",
+        )
+
+    @staticmethod
+    def _value_arg(cls: t.Any, cls_arg: str, /) -> str:
+        """Returns the value arg of the leaf at class arg of class."""
+
+        (value_arg,) = cls.__meta__[ARGS][cls_arg].__meta__[ARGS]
+        return value_arg
+
+    def _parse(
+        self,
+        parse_value: t.Optional[t.Callable[[str], t.Any]],
+        literal: str,
+        name: str,
+        /,
+    ) -> t.Any:
+        """Returns literal of predicate on name as a leaf value."""
+
+        try:
+            return parse_value(literal) if parse_value else literal
+        except ValueError:
+            raise ValueError(
+                f"Invalid value {literal!r} of {name} in {self.path}."
+            )
+
+    def __repr__(self) -> str:
+        """Returns representation of query with class and path."""
+
+        return f"{self.__class__.__name__}({self.cls.__name__}, {self.path!r})"
+
+    def __call__(self, node: t.Any, /) -> t.List[t.Any]:
+        """Returns the nodes of instance of class that path selects, in
+        document order. Containers and leaves are nodes, list steps
+        select entries and leaf list steps select values."""
+
+        if not isinstance(node, self.cls):
+            raise TypeError(
+                f"Expected instance of {self.cls}, got type {type(node)}."
+            )
+
+        nodes = [node]
+        for step in self.steps:
+            nodes = [match for node in nodes for match in _matches(step, node)]
+        return nodes
+
+
+def _matches(step: Step, node: t.Any, /) -> t.List[t.Any]:
+    """Returns the children of node that step selects."""
+
+    kind, accessor, key, matcher, position = step
+    if kind == LIST:
+        entries = accessor(node)._entries
+        if key is UNKEYED:
+            matches = (
+                list(entries.values())
+                if matcher is None
+                else matcher(entries.values())
+            )
+        elif (entry := entries.get(key)) is not None:
+            matches = [entry] if matcher is None else matcher((entry,))
+        else:
+            return []
+    elif kind == LEAF_LIST:
+        values = accessor(node).entries
+        if key is UNKEYED:
+            matches = list(values)
+        elif key in values:
+            matches = [key]
+        else:
+            return []
+    elif (child := accessor(node)) is None:
+        # Optional leaves may be absent.
+        return []
+    else:
+        return [child]
+    if position:
+        return matches[position - 1 : position]
+    return matches
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def compile_query(cls: t.Any, path: str, /) -> Query:
+    """Returns the query of path compiled against module class, the most
+    recently used queries are reused for every instance, see
+    CACHE_SIZE."""
+
+    return Query(cls, path)
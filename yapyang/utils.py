@@ -14,43 +14,389 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
+import math
+import operator
+import re
+import types
 import typing as t
+from json.encoder import encode_basestring
+from xml.sax.saxutils import escape
 
-from yapyang.constants import DEFAULTS, XML_ATTRIBUTE_TEMPLATE, UNSET
+from yapyang.constants import (
+    DEFAULTS,
+    FUNCTION_TEMPLATE,
+    UNSET,
+    XML_ATTRIBUTE_TEMPLATE,
+    XML_END_TAG_TEMPLATE,
+    XML_START_TAG_TEMPLATE,
+)
 
 __all__ = ("MetaInfo",)
 
+# XML attribute name, a name optionally qualified by a namespace prefix.
+XML_ATTRIBUTE_NAME = re.compile(r"(?:[^\W\d][\w.-]*:)?[^\W\d][\w.-]*")
+# Character references of whitespace that attribute values normalize.
+XML_ATTRIBUTE_ENTITIES: t.Dict[str, str] = {
+    '"': "&quot;",
+    "\t": "&#9;",
+    "\n": "&#10;",
+    "\r": "&#13;",
+}
+# Code compiled by create_function in this process, by source. Classes
+# with the same args and defaults share initializer source.
+_codes: t.Dict[str, types.CodeType] = dict()
+
+
+def concatenate_xml_element_attrs(
+    attrs: t.Optional[t.Mapping[str, str]],
+) -> str:
+    """Concatenates XML element attributes, values are escaped. Raises
+    ValueError for invalid attribute names and TypeError for values that
+    are not str."""
+
+    element_attrs: str = ""
+    if attrs:
+        for attr, value in attrs.items():
+            if not isinstance(attr, str) or not XML_ATTRIBUTE_NAME.fullmatch(
+                attr
+            ):
+                raise ValueError(f"Invalid XML attribute name: {attr!r}")
+            if type(value) is not str:
+                raise TypeError(
+                    f"Expected XML attribute value of type {str} for {attr}, got type {type(value)}."
+                )
+            element_attrs += XML_ATTRIBUTE_TEMPLATE.format(
+                attr, escape(value, XML_ATTRIBUTE_ENTITIES)
+            )
+
+    return element_attrs
+
 
 class MetaInfo:
     """YANG data model metadata information."""
 
+    __slots__ = ("default", "attrs", "namespaces", "fragment")
+
     def __init__(
         self,
         default: t.Any = UNSET,
         attrs: t.Optional[t.Dict[str, str]] = None,
+        namespaces: t.Optional[t.Dict[str, str]] = None,
     ) -> None:
+        """Initializer that takes the default of a class arg, and the XML
+        attributes and namespace prefix declarations of its elements,
+        which are validated, escaped and frozen into an attribute
+        fragment. Namespaces map prefixes to namespace names."""
+
+        declarations = {
+            f"xmlns:{prefix}": name
+            for prefix, name in (namespaces or dict()).items()
+        }
         self.default = default
-        self.attrs = attrs
+        self.attrs = types.MappingProxyType(dict(attrs or dict()))
+        self.namespaces = types.MappingProxyType(dict(namespaces or dict()))
+        self.fragment = concatenate_xml_element_attrs(
+            {**declarations, **self.attrs}
+        )
 
 
-def concatenate_xml_element_attrs(attrs: t.Optional[t.Dict[str, str]]) -> str:
-    """Concatenates XML element attributes."""
+def retrieve_xml_element_attrs(
+    cls_meta: t.Dict[str, t.Any], cls_arg: str, /
+) -> str:
+    """Retrieves XML element attribute fragment from class meta for class
+    arg."""
 
-    element_attrs: str = ""
-    if attrs:
-        for attr, value in attrs.items():
-            element_attrs += XML_ATTRIBUTE_TEMPLATE.format(attr, value)
+    if type(default := cls_meta[DEFAULTS].get(cls_arg)) is MetaInfo:
+        return default.fragment
 
-    return element_attrs
+    return ""
 
 
-def retrieve_xml_element_attrs(
-    cls_meta: t.Dict[str, t.Any], cls_arg: str, /
-) -> t.Optional[dict]:
-    """Retrieves XML element attributes from class meta for class arg."""
+def is_optional_arg(cls_meta: t.Dict[str, t.Any], cls_arg: str, /) -> bool:
+    """Returns True when class arg defaults to None, so that its leaf may
+    be absent."""
+
+    if type(default := cls_meta[DEFAULTS].get(cls_arg, UNSET)) is MetaInfo:
+        default = default.default
+    return default is None
+
+
+def retrieve_leaf_value_accessor(
+    cls_arg: str, value_arg: str, optional: bool, /
+) -> t.Callable[[t.Any], t.Any]:
+    """Retrieves the accessor of the value of the leaf at class arg. When
+    optional the accessor returns None for absent leaves."""
+
+    if not optional:
+        return operator.attrgetter(f"{cls_arg}.{value_arg}")
+
+    def accessor(instance: t.Any) -> t.Any:
+        if (leaf := getattr(instance, cls_arg)) is None:
+            return None
+        return getattr(leaf, value_arg)
+
+    return accessor
+
+
+def create_function(
+    name: str,
+    args: t.Iterable[str],
+    body: t.Iterable[str],
+    /,
+    *,
+    globals: t.Dict[str, t.Any],
+    qualname: t.Optional[str] = None,
+    codes: t.Optional[t.Dict[str, types.CodeType]] = None,
+) -> t.Callable:
+    """Returns function compiled from args and body source lines, globals
+    are the names available to body. Code compiled from the same source
+    is reused from codes and from the code compiled in this process, and
+    added to both when missing."""
+
+    source = FUNCTION_TEMPLATE.format(
+        name,
+        ", ".join(args),
+        "".join(f"    {line}\n" for line in body) or "    pass\n",
+    )
+    code = None if codes is None else codes.get(source)
+    if code is None:
+        if (code := _codes.get(source)) is None:
+            code = _codes[source] = compile(source, "<string>", "exec")
+        if codes is not None:
+            codes[source] = code
+    namespace: t.Dict[str, t.Any] = dict()
+    exec(code, dict(globals), namespace)
+    function = namespace[name]
+    function.__qualname__ = qualname or name
+    return function
+
+
+def parse_bool(text: str, /) -> bool:
+    """Returns bool from XML text, accepts YANG and Python spelling."""
+
+    if (value := text.strip().lower()) in ("true", "false"):
+        return value == "true"
+    raise ValueError(f"Invalid boolean: {text}")
+
+
+def retrieve_value_parser(annotation: t.Any, /) -> t.Callable[[str], t.Any]:
+    """Retrieves the function that parses text into a value of
+    annotation."""
+
+    if annotation is bool:
+        return parse_bool
+    return annotation
+
+
+def encode_xml_bool(value: bool, /) -> str:
+    """Returns YANG XML text of bool."""
+
+    return "true" if value else "false"
+
+
+def encode_xml_text(value: t.Any, /) -> str:
+    """Returns escaped XML text of value."""
+
+    return escape(str(value))
+
+
+def retrieve_xml_value_encoder(
+    annotation: t.Any, /
+) -> t.Callable[[t.Any], str]:
+    """Retrieves the function that encodes a value of annotation into
+    escaped XML text."""
+
+    if annotation is bool:
+        return encode_xml_bool
+    if annotation is int or annotation is float:
+        return repr
+    if annotation is str:
+        return escape
+    return encode_xml_text
+
+
+def encode_json_bool(value: bool, /) -> str:
+    """Returns JSON literal of bool."""
+
+    return "true" if value else "false"
+
+
+def encode_json_float(value: float, /) -> str:
+    """Returns JSON number of float, raises ValueError for infinity and
+    NaN which JSON cannot represent."""
+
+    if math.isfinite(value):
+        return repr(value)
+    raise ValueError(
+        f"Out of range float values are not JSON compliant: {value!r}"
+    )
+
+
+def retrieve_json_value_encoder(
+    annotation: t.Any, /
+) -> t.Callable[[t.Any], str]:
+    """Retrieves the function that encodes a value of annotation into
+    JSON text."""
+
+    if annotation is bool:
+        return encode_json_bool
+    if annotation is int:
+        return repr
+    if annotation is float:
+        return encode_json_float
+    if annotation is str:
+        return encode_basestring
+    return json.dumps
+
+
+class XMLRenderer:
+    """Precomputed XML plan of a YANG node class, used to serialize
+    instances and to map parsed elements to children."""
+
+    __slots__ = (
+        "identifier",
+        "namespace",
+        "start_tag",
+        "end_tag",
+        "children",
+        "elements",
+        "encode",
+    )
+
+    def __init__(
+        self,
+        identifier: str,
+        children: t.Tuple[
+            t.Tuple[
+                t.Callable[[t.Any], t.Any],
+                str,
+                t.Optional[str],
+                t.Optional[str],
+                t.Optional[t.Callable[[t.Any], str]],
+            ],
+            ...,
+        ],
+        elements: t.Dict[
+            str, t.Tuple[str, type, str, t.Optional[t.Callable[[str], t.Any]]]
+        ],
+        /,
+        *,
+        namespace: t.Optional[str] = None,
+        encode: t.Callable[[t.Any], str] = encode_xml_text,
+    ) -> None:
+        """Initializer that takes the class identifier, a plan for each
+        child and for leaf or leaf list classes the value encoder. A
+        child plan is a tuple of accessor, element attrs, and when child
+        is a leaf its start and end tags and value encoder otherwise
+        None. Elements map child identifiers to a tuple of class arg,
+        class, kind and for leaf or leaf list children the value
+        parser."""
+
+        self.identifier = identifier
+        self.namespace = namespace
+        self.encode = encode
+        self.start_tag = XML_START_TAG_TEMPLATE.format(identifier, "")
+        self.end_tag = XML_END_TAG_TEMPLATE.format(identifier)
+        self.children = children
+        self.elements = elements
+
+    def render_start_tag(self, element_attrs: str, /) -> str:
+        """Returns start tag, which contains element attrs when given."""
+
+        if element_attrs:
+            return XML_START_TAG_TEMPLATE.format(
+                self.identifier, element_attrs
+            )
+        return self.start_tag
+
+    def iter_children(self, instance: t.Any, /) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from instance children, absent
+        leaves are skipped."""
+
+        for (
+            accessor,
+            element_attrs,
+            start_tag,
+            end_tag,
+            encode,
+        ) in self.children:
+            if encode is None:
+                yield from accessor(instance)._iter_xml(element_attrs)
+            elif (value := accessor(instance)) is not None:
+                yield f"{start_tag}{encode(value)}{end_tag}"
+
+    def iter_module_children(
+        self, instance: t.Any, element_attrs: str, /
+    ) -> t.Iterator[str]:
+        """Yields XML chunks depth-first from children of module instance,
+        each child element contains concatenated element attrs. Absent
+        leaves are skipped."""
+
+        for (
+            accessor,
+            child_attrs,
+            start_tag,
+            end_tag,
+            encode,
+        ) in self.children:
+            if encode is None:
+                yield from accessor(instance)._iter_xml(
+                    child_attrs + element_attrs
+                )
+            elif (value := accessor(instance)) is not None:
+                if element_attrs:
+                    # Start tag of leaf already contains child attrs.
+                    start_tag = (
+                        f"{t.cast(str, start_tag)[:-1]}{element_attrs}>"
+                    )
+                yield f"{start_tag}{encode(value)}{end_tag}"
+
+
+class JSONRenderer:
+    """Precomputed JSON (RFC 7951) plan of a YANG node class, used to
+    serialize instances."""
+
+    __slots__ = ("children", "encode")
+
+    def __init__(
+        self,
+        children: t.Tuple[
+            t.Tuple[
+                t.Callable[[t.Any], t.Any],
+                str,
+                t.Optional[t.Callable[[t.Any], str]],
+                bool,
+            ],
+            ...,
+        ],
+        /,
+        *,
+        encode: t.Callable[[t.Any], str] = json.dumps,
+    ) -> None:
+        """Initializer that takes a plan for each child and for leaf or
+        leaf list classes the value encoder. A child plan is a tuple of
+        accessor, member name, when child is a leaf the value encoder
+        otherwise None, and whether child is omitted when it has no
+        entries."""
+
+        self.children = children
+        self.encode = encode
 
-    if cls_attr_default := cls_meta[DEFAULTS].get(cls_arg):
-        if isinstance(cls_attr_default, MetaInfo):
-            return cls_attr_default.attrs
+    def iter_members(self, instance: t.Any, /) -> t.Iterator[str]:
+        """Yields JSON chunks depth-first from instance children, members
+        are separated by commas and absent leaves are skipped."""
 
-    return None
+        separator = ""
+        for accessor, member, encode, omit_empty in self.children:
+            child = accessor(instance)
+            if encode is not None:
+                if child is None:
+                    continue
+                yield f"{separator}{member}{encode(child)}"
+            elif omit_empty and child._is_empty():
+                continue
+            else:
+                yield f"{separator}{member}"
+                yield from child._iter_json()
+            separator = ","